@@ -0,0 +1,161 @@
+import csv
+import os
+from typing import Dict, List, Optional
+import logging
+
+from config import KeywordConfig
+from domain.model import ListedCompany
+from domain.services.company_index import CompanyIndex
+
+logger = logging.getLogger(__name__)
+
+# 표준 열 이름 → 허용하는 헤더 (KRX KIND 상장법인목록, DART 고유번호 목록 등)
+HEADER_ALIASES: Dict[str, tuple] = {
+    'ticker': ('ticker', '종목코드', '단축코드', 'stock_code'),
+    'name': ('name', '회사명', '종목명', '한글 종목약명', 'corp_name'),
+    'corp_code': ('corp_code', '고유번호'),
+    'former_names': ('former_names', '이전 회사명', '이전회사명'),
+}
+
+FIELDNAMES = ['ticker', 'name', 'corp_code', 'former_names']
+
+# KRX에서 내려받은 CSV는 CP949인 경우가 많음
+ENCODINGS = ('utf-8-sig', 'cp949')
+
+
+def load_companies(filepath: Optional[str] = KeywordConfig.COMPANY_MASTER_FILE) -> List[ListedCompany]:
+    """상장 회사 마스터 CSV를 읽습니다.
+
+    Args:
+        filepath: CSV 경로 (None이거나 없으면 빈 목록)
+
+    Returns:
+        ListedCompany 리스트 (종목코드나 회사명이 없는 행은 제외)
+    """
+    if not filepath or not os.path.exists(filepath):
+        return []
+
+    for encoding in ENCODINGS:
+        try:
+            with open(filepath, 'r', encoding=encoding, newline='') as f:
+                companies = _read_rows(csv.DictReader(f))
+            logger.info(f"상장 회사 마스터 로드: {len(companies)}개 ({filepath})")
+            return companies
+        except UnicodeDecodeError:
+            continue
+        except Exception as e:
+            logger.error(f"상장 회사 마스터 로드 오류: {e}")
+            return []
+
+    logger.error(f"상장 회사 마스터 인코딩을 알 수 없습니다: {filepath}")
+    return []
+
+
+def load_company_index(
+    filepath: Optional[str] = KeywordConfig.COMPANY_MASTER_FILE,
+    import_path: Optional[str] = KeywordConfig.COMPANY_IMPORT_FILE
+) -> CompanyIndex:
+    """상장 회사 마스터 CSV로 CompanyIndex 생성
+
+    import_path에 마스터보다 새 목록이 있으면 먼저 마스터로 가져온다 (import_companies).
+
+    Args:
+        filepath: 마스터 CSV 경로 (None이면 빈 색인)
+        import_path: 내려받은 목록 경로 (None이거나 없으면 가져오지 않음)
+
+    Returns:
+        CompanyIndex
+    """
+    if filepath and import_path and _is_newer(import_path, filepath):
+        try:
+            import_companies(import_path, filepath)
+        except Exception as e:
+            logger.error(f"상장 회사 목록 가져오기 오류: {e}")
+    return CompanyIndex(load_companies(filepath))
+
+
+def _is_newer(path: str, than: str) -> bool:
+    """path가 있고 than이 없거나 than보다 나중에 수정되었는지"""
+    if not os.path.exists(path):
+        return False
+    return not os.path.exists(than) or os.path.getmtime(path) > os.path.getmtime(than)
+
+
+def import_companies(source_path: str, filepath: str = KeywordConfig.COMPANY_MASTER_FILE) -> int:
+    """내려받은 목록(KRX/DART 형식)을 표준 형식 마스터 CSV로 저장합니다.
+
+    기존 마스터의 이전 회사명은 유지하고, 회사명이 바뀐 종목은 이전 회사명에 추가한다.
+
+    Args:
+        source_path: 내려받은 CSV 경로
+        filepath: 저장할 마스터 CSV 경로
+
+    Returns:
+        저장한 회사 수
+    """
+    existing = {company.ticker: company for company in load_companies(filepath)}
+    imported = load_companies(source_path)
+    if not imported:
+        logger.warning(f"가져올 회사가 없습니다: {source_path}")
+        return 0
+
+    merged: List[ListedCompany] = []
+    for company in imported:
+        previous = existing.get(company.ticker)
+        if previous is not None:
+            former = [*company.former_names, *previous.names]
+            former = tuple(dict.fromkeys(name for name in former if name != company.name))
+            company = ListedCompany(
+                ticker=company.ticker,
+                name=company.name,
+                corp_code=company.corp_code or previous.corp_code,
+                former_names=former,
+            )
+        merged.append(company)
+
+    base_dir = os.path.dirname(filepath)
+    if base_dir:
+        os.makedirs(base_dir, exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for company in merged:
+            writer.writerow({
+                'ticker': company.ticker,
+                'name': company.name,
+                'corp_code': company.corp_code,
+                'former_names': '|'.join(company.former_names),
+            })
+
+    logger.info(f"상장 회사 마스터 저장: {len(merged)}개 ({filepath})")
+    return len(merged)
+
+
+def _read_rows(reader: csv.DictReader) -> List[ListedCompany]:
+    """헤더를 표준 열 이름에 맞춰 행을 ListedCompany로 변환"""
+    headers = [header.strip() for header in (reader.fieldnames or [])]
+    columns = {}
+    for field, aliases in HEADER_ALIASES.items():
+        for header in headers:
+            if header in aliases:
+                columns[field] = header
+                break
+    if 'ticker' not in columns or 'name' not in columns:
+        raise ValueError(f"종목코드/회사명 열이 없습니다: {headers}")
+
+    companies = []
+    for row in reader:
+        row = {key.strip(): (value or '').strip() for key, value in row.items() if key}
+        # 엑셀로 저장한 목록은 종목코드 앞의 0이 빠져 있을 수 있음
+        ticker = CompanyIndex.normalize_ticker(row.get(columns['ticker'], ''), pad=True)
+        name = row.get(columns['name'], '')
+        if not ticker or not name:
+            continue
+        former = row.get(columns.get('former_names', ''), '')
+        companies.append(ListedCompany(
+            ticker=ticker,
+            name=name,
+            corp_code=row.get(columns.get('corp_code', ''), ''),
+            former_names=tuple(part.strip() for part in former.split('|') if part.strip()),
+        ))
+    return companies
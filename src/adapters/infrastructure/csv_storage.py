@@ -1,54 +1,160 @@
 import csv
 import os
+import threading
+import time
 from datetime import datetime
-from typing import Set
+from typing import IO, Iterable, List, Optional, Set, Tuple
 import logging
 
-from domain.model import Article
+from config import StorageConfig
+from domain.model import Article, article_key
 from ports.storage_port import StorageRepository
 
 logger = logging.getLogger(__name__)
 
+LINK_COLUMN = 2    # 링크 열 위치
+SOURCE_COLUMN = 6  # 출처 열 위치
+KEY_COLUMN = 7     # Article.key 열 위치
+
 class CsvStorage(StorageRepository):
-    def __init__(self, base_dir: str = "logs"):
+    """일별 CSV 기사 저장소 (logs/report_YYYYMMDD.csv)
+
+    기사마다 파일을 열고 닫지 않고, 당일 파일 핸들 하나를 열어 둔 채 행을 버퍼에 모았다가
+    flush_rows개 또는 flush_interval초가 지나면 한 번에 기록한다 (group commit).
+    - save_articles(주기 끝)와 load_today_keys는 항상 버퍼를 먼저 기록
+    - 날짜가 바뀌면 이전 파일을 닫고 새 파일을 연다
+    - 종료 시 close()로 남은 행 기록
+    """
+
+    def __init__(
+        self,
+        base_dir: str = "logs",
+        flush_rows: int = StorageConfig.CSV_FLUSH_ROWS,
+        flush_interval: float = StorageConfig.CSV_FLUSH_INTERVAL
+    ):
+        """
+        Args:
+            base_dir: CSV 폴더
+            flush_rows: 버퍼가 이 행 수에 이르면 기록
+            flush_interval: 마지막 기록 후 이 시간(초)이 지난 뒤 저장하면 기록
+        """
         self.base_dir = base_dir
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
         os.makedirs(self.base_dir, exist_ok=True)
 
+        # 모니터 스레드와 UI 저장(asyncio.to_thread)이 함께 쓰므로 lock으로 직렬화
+        self._lock = threading.Lock()
+        self._buffer: List[Tuple[str, list]] = []  # [(파일명, 행)] - 저장 시점의 날짜 파일
+        self._file: Optional[IO[str]] = None
+        self._writer = None
+        self._filename = ""
+        self._last_flush = time.monotonic()
+
     def _get_today_filename(self) -> str:
         today = datetime.now().strftime("%Y%m%d")
         return os.path.join(self.base_dir, f"report_{today}.csv")
 
-    def load_today_ids(self) -> Set[int]:
+    def load_today_keys(self) -> Set[int]:
+        """오늘 저장된 기사 고유 키 로드
+
+        키 열이 없는 이전 형식의 행은 링크(와 출처)로 키를 다시 계산한다
+        (SqliteStorage.import_csv와 같은 방식, URL 링크면 출처와 관계없이 같은 키).
+        """
+        self.flush()
         filename = self._get_today_filename()
-        ids = set()
-        
+        keys = set()
+
         if not os.path.exists(filename):
-            return ids
-            
+            return keys
+
         try:
             with open(filename, mode='r', encoding='utf-8') as f:
                 reader = csv.reader(f)
                 for row in reader:
-                    if row and row[0].isdigit():
-                        ids.add(int(row[0]))
+                    if len(row) > KEY_COLUMN and row[KEY_COLUMN].lstrip('-').isdigit():
+                        keys.add(int(row[KEY_COLUMN]))
+                    elif len(row) > LINK_COLUMN and row[0].lstrip('-').isdigit() and row[LINK_COLUMN]:
+                        source = row[SOURCE_COLUMN] if len(row) > SOURCE_COLUMN else ""
+                        keys.add(article_key(source, row[LINK_COLUMN]))
         except Exception as e:
             logger.error(f"CSV 로드 오류: {e}")
-            
-        return ids
+
+        return keys
 
     def save_article(self, article: Article) -> None:
-        filename = self._get_today_filename()
+        """기사를 버퍼에 추가 (행 수/시간 기준을 넘으면 기록)"""
+        with self._lock:
+            self._buffer.append(self._to_row(article))
+            due = (
+                len(self._buffer) >= self.flush_rows
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+            if due:
+                self._flush_locked()
+
+    def save_articles(self, articles: Iterable[Article]) -> int:
+        """한 주기의 기사를 버퍼에 추가하고 바로 기록 (추가한 행 수 반환)"""
+        rows = [self._to_row(article) for article in articles]
+        with self._lock:
+            self._buffer.extend(rows)
+            self._flush_locked()
+        return len(rows)
+
+    def flush(self) -> None:
+        """버퍼의 행을 파일에 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """버퍼를 기록하고 파일 닫기"""
+        with self._lock:
+            self._flush_locked()
+            self._close_file()
+
+    def _to_row(self, article: Article) -> Tuple[str, list]:
+        # Format: ID, Title, Link, Date, Keyword, SavedAt, Source, Key
+        # (Source, Key는 기존 열 순서를 유지하기 위해 끝에 추가)
+        return self._get_today_filename(), [
+            article.id,
+            article.title,
+            article.link,
+            article.date,
+            article.keyword,
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            article.source,
+            article.key
+        ]
+
+    def _flush_locked(self) -> None:
+        """버퍼 기록 (lock 안에서 호출, 날짜가 바뀐 행은 해당 날짜 파일로)"""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
         try:
-            with open(filename, mode='a', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                # Format: ID, Title, Link, Date, SavedAt
-                writer.writerow([
-                    article.id,
-                    article.title,
-                    article.link,
-                    article.date,
-                    article.keyword,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                ])
+            for filename, row in rows:
+                if filename != self._filename:
+                    self._open_file(filename)
+                self._writer.writerow(row)
+            self._file.flush()
         except Exception as e:
             logger.error(f"CSV 저장 오류: {e}")
+            self._close_file()
+
+    def _open_file(self, filename: str) -> None:
+        """날짜 파일 열기 (이전 날짜 파일은 닫음)"""
+        self._close_file()
+        self._file = open(filename, mode='a', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+        self._filename = filename
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception as e:
+                logger.error(f"CSV 닫기 오류: {e}")
+        self._file = None
+        self._writer = None
+        self._filename = ""
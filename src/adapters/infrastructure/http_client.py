@@ -0,0 +1,265 @@
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import logging
+
+import httpx
+
+from config import HttpConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """소스별 캐시 적중 통계"""
+    hits: int = 0          # 변경 없음 (파싱 생략)
+    misses: int = 0        # 본문 수신 후 파싱
+    bytes_saved: int = 0   # 적중으로 절약한 본문 크기 (직전 응답 기준)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"hit {self.hits}/miss {self.misses} ({self.hit_ratio:.0%}, {self.bytes_saved / 1024:.0f}KB 절약)"
+
+
+class ValidatorCache:
+    """URL별 ETag / Last-Modified 검증자 캐시
+
+    조건부 GET(If-None-Match / If-Modified-Since) 요청 헤더를 만들고,
+    304 응답 여부를 소스별 CacheStats로 집계한다.
+    """
+
+    def __init__(self):
+        # {url: (etag, last_modified, 직전 본문 크기)}
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str], int]] = {}
+        self._stats: Dict[str, CacheStats] = {}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """저장된 검증자로 조건부 요청 헤더 생성"""
+        entry = self._validators.get(url)
+        if entry is None:
+            return {}
+
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def store(self, url: str, response: httpx.Response, size: Optional[int] = None) -> None:
+        """200 응답의 검증자 저장 (검증자가 없으면 항목 제거)
+
+        Args:
+            url: 요청 URL
+            response: 200 응답
+            size: 본문 크기 (스트리밍 응답이면 실제로 읽은 바이트 수를 지정)
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            if size is None:
+                size = len(response.content)
+            self._validators[url] = (etag, last_modified, size)
+        else:
+            self._validators.pop(url, None)
+
+    def record_hit(self, source: str, url: str) -> None:
+        stats = self._stats.setdefault(source, CacheStats())
+        stats.hits += 1
+        entry = self._validators.get(url)
+        if entry is not None:
+            stats.bytes_saved += entry[2]
+
+    def record_miss(self, source: str) -> None:
+        self._stats.setdefault(source, CacheStats()).misses += 1
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """소스별 적중 통계 반환"""
+        return dict(self._stats)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """검증자 삭제 (url이 없으면 전체)"""
+        if url is None:
+            self._validators.clear()
+        else:
+            self._validators.pop(url, None)
+
+
+class HttpClient:
+    """모든 스크래퍼가 공유하는 커넥션 풀 기반 HTTP 클라이언트
+
+    - 모니터링 세션 동안 하나의 httpx.AsyncClient를 재사용 (keep-alive)
+      → TCP 연결/TLS 핸드셰이크/DNS 조회 비용을 호스트당 한 번만 지불
+    - 호스트별 동시 요청 수 제한
+    - HTTP/2 선택 사용 (h2 패키지가 설치된 경우)
+    - 모니터링 종료 시 aclose()로 커넥션 정리
+    """
+
+    def __init__(
+        self,
+        timeout: float = HttpConfig.TIMEOUT,
+        max_connections: int = HttpConfig.MAX_CONNECTIONS,
+        max_connections_per_host: int = HttpConfig.MAX_CONNECTIONS_PER_HOST,
+        max_keepalive_connections: int = HttpConfig.MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HttpConfig.KEEPALIVE_EXPIRY,
+        http2: bool = HttpConfig.HTTP2,
+    ):
+        self.timeout = timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.debug("h2 패키지가 없어 HTTP/1.1로 동작합니다 (pip install httpx[http2])")
+            http2 = False
+        self.http2 = http2
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.validators = ValidatorCache()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """내부 httpx 클라이언트 (최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 요청 제한용 세마포어 반환"""
+        host = urlsplit(url).hostname or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """HTTP 요청 (호스트별 동시 요청 제한 적용)
+
+        Args:
+            method: HTTP 메서드
+            url: 요청할 URL
+            **kwargs: httpx.AsyncClient.request 인자 (headers, data, timeout 등)
+
+        Returns:
+            httpx.Response
+        """
+        async with self._host_semaphore(url):
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def get_conditional(
+        self,
+        url: str,
+        source: str,
+        revalidate: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """검증자 캐시를 사용하는 조건부 GET
+
+        Args:
+            url: 요청할 URL
+            source: 통계 집계용 소스 이름
+            revalidate: False면 검증자를 보내지 않고 전체 본문을 받음 (검증자는 갱신)
+            headers: 추가 요청 헤더
+
+        Returns:
+            httpx.Response (변경이 없으면 status_code == 304, 본문 없음)
+
+        Note:
+            200 응답의 검증자는 저장하지 않는다. 호출한 쪽이 본문 처리(파싱)에 성공한 뒤
+            validators.store(url, response)를 호출해야 한다. 처리에 실패한 본문의 검증자가
+            남으면 다음 폴링이 304를 받아 같은 본문을 다시 처리할 수 없기 때문이다.
+        """
+        request_headers = dict(headers or {})
+        if revalidate:
+            request_headers.update(self.validators.conditional_headers(url))
+
+        response = await self.get(url, headers=request_headers, **kwargs)
+        if response.status_code == 304:
+            self.validators.record_hit(source, url)
+            return response
+
+        self.validators.record_miss(source)
+        return response
+
+    @asynccontextmanager
+    async def stream_conditional(
+        self,
+        url: str,
+        source: str,
+        revalidate: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """검증자 캐시를 사용하는 조건부 GET (스트리밍)
+
+        본문을 받는 대로 처리하고 필요한 부분만 읽은 뒤 중단할 수 있도록
+        응답을 스트림으로 넘긴다. 컨텍스트를 벗어나면 응답이 닫힌다.
+
+        Args:
+            url: 요청할 URL
+            source: 통계 집계용 소스 이름
+            revalidate: False면 검증자를 보내지 않고 전체 본문을 받음 (검증자는 갱신)
+            headers: 추가 요청 헤더
+
+        Yields:
+            httpx.Response (본문 미수신 상태, 변경이 없으면 status_code == 304)
+
+        Note:
+            get_conditional()과 같이 검증자는 저장하지 않는다. 호출한 쪽이 본문을 처리한 뒤
+            validators.store(url, response, size=읽은 바이트 수)를 호출해야 한다.
+        """
+        request_headers = dict(headers or {})
+        if revalidate:
+            request_headers.update(self.validators.conditional_headers(url))
+
+        async with self._host_semaphore(url):
+            async with self.client.stream("GET", url, headers=request_headers, **kwargs) as response:
+                if response.status_code == 304:
+                    self.validators.record_hit(source, url)
+                else:
+                    self.validators.record_miss(source)
+                yield response
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """소스별 조건부 요청 적중 통계"""
+        return self.validators.stats()
+
+    async def aclose(self) -> None:
+        """커넥션 풀 정리 (모니터링 종료 시 호출)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.debug("HTTP 클라이언트 종료")
+        self._client = None
+        self._host_semaphores.clear()
+
+    async def __aenter__(self) -> "HttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
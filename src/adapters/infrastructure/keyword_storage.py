@@ -1,13 +1,26 @@
 import json
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
 
+from config import KeywordConfig
+from domain.services.company_index import CompanyIndex
+from domain.services.keyword_query import KeywordQuery, compile_query
+
 logger = logging.getLogger(__name__)
 
 class KeywordStorage:
-    def __init__(self, filepath: str = "config/keywords.json"):
+    """감시 항목(키워드/종목명) 저장소
+
+    항목은 문자열 그대로 저장하고 ("q:" 접두어 항목만 keyword_query 문법으로 해석),
+    컴파일 결과는 항목별로 캐시하여 매칭기 재구성 시 다시 파싱하지 않는다.
+    상장 회사 마스터가 있으면 회사명/종목코드 항목은 현재/이전 회사명 검색으로 컴파일한다.
+    """
+
+    def __init__(self, filepath: str = "config/keywords.json", companies: Optional[CompanyIndex] = None):
         self.filepath = filepath
+        self.companies = companies
+        self._compiled: Dict[str, KeywordQuery] = {}
         self.base_dir = os.path.dirname(filepath)
         if self.base_dir:
             os.makedirs(self.base_dir, exist_ok=True)
@@ -24,6 +37,10 @@ class KeywordStorage:
             return {"keywords": [], "stock_names": []}
 
     def save(self, keywords: List[str], stock_names: List[str]) -> None:
+        # 목록에서 빠진 항목의 컴파일 캐시 정리
+        current = set(keywords) | set(stock_names)
+        self._compiled = {term: query for term, query in self._compiled.items() if term in current}
+
         data = {
             "keywords": keywords,
             "stock_names": stock_names
@@ -33,3 +50,52 @@ class KeywordStorage:
                 json.dump(data, f, ensure_ascii=False, indent=2)
         except Exception as e:
             logger.error(f"키워드 저장 오류: {e}")
+
+    def load_aliases(self, filepath: Optional[str] = KeywordConfig.ALIASES_FILE) -> List[List[str]]:
+        """별칭 그룹 로드 (예: [["삼성전자", "삼전"], ...])
+
+        Args:
+            filepath: 별칭 JSON 파일 경로 (None이거나 없으면 별칭 없음)
+
+        Returns:
+            별칭 그룹 리스트
+        """
+        if not filepath or not os.path.exists(filepath):
+            return []
+
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                groups = [list(group) for group in json.load(f)]
+            logger.info(f"별칭 그룹 로드: {len(groups)}개 ({filepath})")
+            return groups
+        except Exception as e:
+            logger.error(f"별칭 로드 오류: {e}")
+            return []
+
+    def compile(self, term: str) -> KeywordQuery:
+        """감시 항목을 쿼리로 컴파일 (항목별로 한 번만, 문법 오류면 문구로 검색)
+
+        상장 회사(회사명 또는 종목코드)면 현재/이전 회사명 중 하나라도 포함되면 일치한다.
+
+        Args:
+            term: 감시 항목 문자열
+
+        Returns:
+            KeywordQuery
+        """
+        query = self._compiled.get(term)
+        if query is None:
+            if self.companies is not None:
+                query = self.companies.query_for(term)
+            if query is None:
+                query = compile_query(term)
+            self._compiled[term] = query
+        return query
+
+    def display_name(self, term: str) -> str:
+        """알림/음성 안내에 쓸 항목 이름 (종목코드면 회사명)"""
+        if self.companies is not None and CompanyIndex.normalize_ticker(term):
+            company = self.companies.get(term)
+            if company is not None:
+                return company.name
+        return term
@@ -0,0 +1,88 @@
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+import logging
+
+from config import ParseConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ParseExecutor:
+    """HTML/XML 파싱을 이벤트 루프 밖에서 실행하는 실행기
+
+    모니터링 루프는 Flet UI와 같은 이벤트 루프에서 돌기 때문에
+    BeautifulSoup/ElementTree 파싱을 루프에서 직접 하면 그동안 UI와
+    다른 소스의 응답 처리가 멈춘다. 스크래퍼는 받은 본문을 이 실행기에 넘기고
+    Article 리스트를 돌려받는다.
+
+    - 스레드 풀 (기본): 모든 스크래퍼
+    - 프로세스 풀 (선택): cpu_bound=True로 요청한 BeautifulSoup 위주 소스
+      (함수와 인자가 pickle 가능해야 함)
+    - max_workers=0: 루프에서 직접 실행 (단독 실행/디버깅용)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = ParseConfig.MAX_WORKERS,
+        process_workers: int = ParseConfig.PROCESS_WORKERS,
+    ):
+        """
+        Args:
+            max_workers: 스레드 풀 크기 (0이면 이벤트 루프에서 직접 실행)
+            process_workers: 프로세스 풀 크기 (0이면 cpu_bound 작업도 스레드 풀 사용)
+        """
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def inline(cls) -> "ParseExecutor":
+        """이벤트 루프에서 직접 실행하는 실행기 (풀 없음)"""
+        return cls(max_workers=0, process_workers=0)
+
+    def _executor(self, cpu_bound: bool) -> Optional[Executor]:
+        """작업을 보낼 풀 반환 (최초 사용 시 생성, 없으면 None)"""
+        if cpu_bound and self.process_workers > 0:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+            return self._process_pool
+
+        if self.max_workers > 0:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="parse"
+                )
+            return self._thread_pool
+
+        return None
+
+    async def run(self, func: Callable[..., Any], *args, cpu_bound: bool = False) -> Any:
+        """파싱 함수를 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            func: 실행할 함수 (프로세스 풀이면 pickle 가능해야 함)
+            *args: 함수 인자
+            cpu_bound: True면 프로세스 풀 사용 (설정된 경우)
+
+        Returns:
+            함수 반환값
+        """
+        executor = self._executor(cpu_bound)
+        if executor is None:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+    def shutdown(self) -> None:
+        """풀 정리 (모니터링 종료 시 호출, 대기 중인 작업은 취소)"""
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = None
+        self._process_pool = None
+        logger.debug("파싱 실행기 종료")
@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
-import httpx
-from bs4 import BeautifulSoup
-from typing import List, Optional
+from typing import Container, Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
 
 from domain.model import Article
-from ports.news_port import NewsRepository
+from domain.services.keyword_matcher import KeywordMatcher
+from ports.news_port import NewsRepository, fetch_query_results
+from adapters.infrastructure.http_client import HttpClient
+from adapters.infrastructure.parse_executor import ParseExecutor
+from adapters.infrastructure.scrapers.fingerprint_cache import FingerprintCache
+from adapters.infrastructure.scrapers.html_parser import HtmlParser
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +19,11 @@ class BaseWebScraper(NewsRepository, ABC):
     
     공통 로직:
     - HTTP 요청 및 응답 처리
-    - HTML 파싱 (BeautifulSoup)
+    - HTML 파싱 (BeautifulSoup, lxml 백엔드로 뉴스 목록 영역만 부분 파싱)
     - 에러 처리
     - 날짜 포맷 변환 유틸리티
+    - 기사 목록 영역 지문 캐시 (목록이 직전 폴링과 같으면 기사 파싱 생략)
+    - 파싱은 ParseExecutor에서 실행 (이벤트 루프 밖, 프로세스 풀 사용 가능)
     
     각 스크래퍼에서 구현해야 할 부분:
     - build_search_url(): 검색 URL 생성
@@ -31,6 +36,37 @@ class BaseWebScraper(NewsRepository, ABC):
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     TIMEOUT = 20
     
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        parse_executor: Optional[ParseExecutor] = None
+    ):
+        """
+        Args:
+            http_client: 공유 HTTP 클라이언트 (없으면 스크래퍼 전용 클라이언트 생성)
+            parse_executor: 공유 파싱 실행기 (없으면 이벤트 루프에서 직접 파싱)
+        """
+        self.http_client = http_client or HttpClient()
+        self.parse_executor = parse_executor or ParseExecutor.inline()
+        self.fingerprints = FingerprintCache()
+        self._html_parser: Optional[HtmlParser] = None
+    
+    def __getstate__(self) -> dict:
+        # 프로세스 풀로 파싱을 넘길 때는 파싱에 필요한 상태만 전달
+        state = self.__dict__.copy()
+        state['http_client'] = None
+        state['parse_executor'] = None
+        state['fingerprints'] = None
+        state['_html_parser'] = None
+        return state
+    
+    @property
+    def html_parser(self) -> HtmlParser:
+        """뉴스 목록 셀렉터 기반 HTML 파서 (최초 사용 시 생성)"""
+        if self._html_parser is None:
+            self._html_parser = HtmlParser(self.get_news_list_selector())
+        return self._html_parser
+    
     async def fetch_reports(self, keyword: str) -> List[Article]:
         """뉴스 기사 목록 가져오기 (템플릿 메서드 패턴)
         
@@ -45,13 +81,69 @@ class BaseWebScraper(NewsRepository, ABC):
         
         try:
             html = await self._fetch_html(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            articles = await self._parse_articles(soup, keyword)
+            articles = await self.parse_executor.run(self._parse_articles, html, keyword, cpu_bound=True)
         except Exception as e:
             logger.error(f"{self.get_source_name()} 스크래핑 오류: {e}", exc_info=True)
             
         return articles
     
+    async def fetch_reports_many(
+        self,
+        keywords: List[str],
+        matcher: Optional[KeywordMatcher] = None,
+        seen: Optional[Container[int]] = None
+    ) -> Dict[str, List[Article]]:
+        """키워드별 검색 결과 가져오기 (모니터링 루프용)
+        
+        검색 결과 목록 영역이 직전 폴링과 동일하면 기사 파싱을 생략하고
+        빈 리스트를 반환한다 (새 기사 없음).
+        검색어는 폴링당 한 번만 요청하고 같은 검색어를 쓰는 항목들이 결과를 나눠 쓴다 (fetch_query_results).
+        
+        Args:
+            keywords: 검색할 키워드 목록
+            matcher: 감시 목록 매칭기 (쿼리 항목은 필수 리터럴로 검색 후 제목으로 확인)
+            seen: 이미 본 기사 키 집합 (결과에서 제외, HTML 파싱은 프로세스 풀에서 할 수 있어 파싱 후 확인)
+            
+        Returns:
+            {키워드: Article 리스트}
+        """
+        results, fetched = await fetch_query_results(keywords, matcher, seen, self._fetch_reports_if_changed)
+        self._record_new_items(fetched)
+        return results
+    
+    async def _fetch_reports_if_changed(self, keyword: str, queries: Tuple[str, ...] = ()) -> List[Article]:
+        """목록 영역 지문이 바뀐 경우에만 기사를 파싱
+        
+        지문은 (URL, 이 검색어를 쓰는 항목들)마다 기억한다. 검색어를 같이 쓰는 항목이
+        새로 추가되면 목록이 같아도 그 항목을 위해 다시 파싱한다.
+        
+        Args:
+            keyword: 검색할 키워드
+            queries: 이 검색어를 쓰는 감시 항목들
+            
+        Returns:
+            Article 리스트 (변경 없으면 빈 리스트)
+        """
+        url = self.build_search_url(keyword)
+        cache_key = "\x1f".join((url,) + queries)
+        
+        try:
+            html = await self._fetch_html(url)
+            digest, size, articles = await self.parse_executor.run(
+                self._parse_if_changed, html, keyword, self.fingerprints.digest_of(cache_key),
+                cpu_bound=True
+            )
+            if self.fingerprints.check(self.get_source_name(), cache_key, digest, size):
+                logger.debug(f"{self.get_source_name()} '{keyword}' 목록 동일 (파싱 생략)")
+                return []
+            
+            # 파싱이 끝난 뒤에만 지문 저장 (실패하면 다음 폴링에서 같은 목록도 다시 파싱)
+            self.fingerprints.commit(cache_key, digest)
+            return articles
+        except Exception as e:
+            logger.error(f"{self.get_source_name()} 스크래핑 오류: {e}", exc_info=True)
+            return []
+    
     async def _fetch_html(self, url: str) -> str:
         """HTTP 요청하여 HTML 가져오기 (공통 로직)
         
@@ -62,24 +154,56 @@ class BaseWebScraper(NewsRepository, ABC):
             HTML 텍스트
         """
         headers = {'User-Agent': self.USER_AGENT}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=self.TIMEOUT)
-            response.raise_for_status()
-            return response.text
+        response = await self.http_client.get(url, headers=headers, timeout=self.TIMEOUT)
+        response.raise_for_status()
+        return response.text
     
-    async def _parse_articles(self, soup: BeautifulSoup, keyword: str) -> List[Article]:
-        """HTML에서 기사 목록 파싱 (공통 로직 + 추상 메서드 호출)
+    def _parse_articles(self, html: str, keyword: str) -> List[Article]:
+        """HTML에서 기사 목록 파싱 (파싱 실행기에서 실행)
         
         Args:
-            soup: BeautifulSoup 객체
+            html: 검색 결과 HTML
+            keyword: 검색 키워드
+            
+        Returns:
+            Article 리스트
+        """
+        news_list = self.html_parser.select(html)
+        return self._parse_items(news_list, keyword)
+    
+    def _parse_if_changed(
+        self, html: str, keyword: str, previous: Optional[bytes]
+    ) -> Tuple[bytes, int, List[Article]]:
+        """목록 영역 지문을 계산하고, 직전 지문과 다를 때만 기사 파싱 (파싱 실행기에서 실행)
+        
+        지문 비교/저장은 호출한 쪽(이벤트 루프)에서 파싱 결과를 받은 뒤에 한다.
+        
+        Args:
+            html: 검색 결과 HTML
+            keyword: 검색 키워드
+            previous: 직전 폴링의 목록 영역 지문
+            
+        Returns:
+            (지문, 목록 영역 크기, Article 리스트 - 변경 없으면 빈 리스트)
+        """
+        news_list = self.html_parser.select(html)
+        region = "".join(str(item) for item in news_list).encode('utf-8')
+        digest = FingerprintCache.fingerprint(region)
+        if digest == previous:
+            return digest, len(region), []
+        return digest, len(region), self._parse_items(news_list, keyword)
+    
+    def _parse_items(self, news_list: list, keyword: str) -> List[Article]:
+        """기사 목록 element들을 Article로 변환
+        
+        Args:
+            news_list: 뉴스 아이템 element 리스트
             keyword: 검색 키워드
             
         Returns:
             Article 리스트
         """
         articles = []
-        selector = self.get_news_list_selector()
-        news_list = soup.select(selector)
         source_name = self.get_source_name()
         
         for item in news_list:
@@ -88,8 +212,7 @@ class BaseWebScraper(NewsRepository, ABC):
                 if article:
                     # source 필드가 비어있으면 자동으로 채우기
                     if not article.source:
-                        from dataclasses import replace
-                        article = replace(article, source=source_name)
+                        article = article.replace(source=source_name)
                     articles.append(article)
             except Exception as e:
                 logger.debug(f"{source_name} 항목 파싱 오류: {e}")
@@ -122,21 +245,6 @@ class BaseWebScraper(NewsRepository, ABC):
         """
         return datetime.now().strftime("%Y-%m-%d %H:%M")
     
-    def normalize_date(self, date_str: str) -> str:
-        """날짜 문자열을 표준 형식으로 변환
-        
-        지원 형식:
-        - "2025.12.08" -> "2025-12-08"
-        - "2025.12.08 14:30" -> "2025-12-08 14:30"
-        
-        Args:
-            date_str: 변환할 날짜 문자열
-            
-        Returns:
-            표준 형식 날짜 문자열
-        """
-        return date_str.replace('.', '-', 2)
-    
     # 추상 메서드 - 각 스크래퍼에서 구현 필요
     @abstractmethod
     def build_search_url(self, keyword: str) -> str:
@@ -0,0 +1,83 @@
+import hashlib
+from typing import Dict, Optional
+import logging
+
+from adapters.infrastructure.http_client import CacheStats
+
+logger = logging.getLogger(__name__)
+
+
+class FingerprintCache:
+    """URL별 콘텐츠 지문(해시) 캐시
+
+    검증자(ETag/Last-Modified)를 지원하지 않고 항상 200을 돌려주는 소스용.
+    직전 폴링과 본문(RSS) 또는 기사 목록 영역(HTML)이 바이트 단위로 같으면
+    파싱, Article 생성, 날짜 변환을 생략할 수 있도록 판단한다.
+
+    확인(check)과 저장(commit)을 나눈다. 지문은 파싱이 성공한 뒤에만 저장해야
+    파싱이 실패/시간 초과된 본문을 다음 폴링에서 "변경 없음"으로 건너뛰지 않는다.
+    """
+
+    DIGEST_SIZE = 16
+
+    def __init__(self):
+        self._digests: Dict[str, bytes] = {}
+        self._stats: Dict[str, CacheStats] = {}
+
+    @classmethod
+    def fingerprint(cls, content: bytes, salt: bytes = b"") -> bytes:
+        """콘텐츠 지문 계산
+
+        Args:
+            content: 원본 바이트
+            salt: 결과에 영향을 주는 추가 입력 (예: 매칭 키워드 목록)
+
+        Returns:
+            지문 바이트
+        """
+        hasher = hashlib.blake2b(content, digest_size=cls.DIGEST_SIZE)
+        if salt:
+            hasher.update(b"\x00")
+            hasher.update(salt)
+        return hasher.digest()
+
+    def digest_of(self, url: str) -> Optional[bytes]:
+        """직전 폴링의 지문 (없으면 None)"""
+        return self._digests.get(url)
+
+    def check(self, source: str, url: str, digest: bytes, size: int) -> bool:
+        """지문을 직전에 저장한 지문과 비교합니다 (저장하지 않음).
+
+        Args:
+            source: 통계 집계용 소스 이름
+            url: 캐시 키 (요청 URL)
+            digest: fingerprint()로 계산한 지문
+            size: 지문을 계산한 콘텐츠 크기 (통계용)
+
+        Returns:
+            동일하면 True (파싱 생략 가능)
+        """
+        stats = self._stats.setdefault(source, CacheStats())
+
+        if self._digests.get(url) == digest:
+            stats.hits += 1
+            stats.bytes_saved += size
+            return True
+
+        stats.misses += 1
+        return False
+
+    def commit(self, url: str, digest: bytes) -> None:
+        """파싱이 성공한 콘텐츠의 지문 저장 (다음 폴링의 비교 기준)"""
+        self._digests[url] = digest
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """소스별 적중 통계 반환"""
+        return dict(self._stats)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """지문 삭제 (url이 없으면 전체)"""
+        if url is None:
+            self._digests.clear()
+        else:
+            self._digests.pop(url, None)
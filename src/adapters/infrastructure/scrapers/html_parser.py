@@ -0,0 +1,89 @@
+import re
+from typing import List, Optional
+import logging
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from config import HtmlConfig
+
+logger = logging.getLogger(__name__)
+
+# 셀렉터 첫 부분이 단순 형태(tag, #id, .class 조합)일 때만 부분 파싱
+_SIMPLE_COMPOUND = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*)?(?P<rest>(?:[.#][\w-]+)*)$')
+
+
+def build_strainer(selector: str) -> Optional[SoupStrainer]:
+    """CSS 셀렉터의 첫 부분(최상위 요소)으로 SoupStrainer 생성
+
+    예: "ul.list_wrap > li.article_item" → <ul class="list_wrap ...">만 트리로 생성
+        ".list-block"                    → class에 list-block이 있는 요소만 생성
+
+    첫 부분과 일치하는 요소의 하위 트리만 만들기 때문에 전체 셀렉터는 그 안에서
+    그대로 동작한다. 스트레이너는 실제 대상보다 넓게(상위 집합) 잡고, 정확한
+    매칭은 이후 select()가 담당한다.
+
+    Args:
+        selector: 뉴스 목록 CSS 셀렉터
+
+    Returns:
+        SoupStrainer, 부분 파싱이 불가능한 셀렉터면 None
+    """
+    if ',' in selector:
+        return None
+
+    first = selector.strip().split()[0]
+    match = _SIMPLE_COMPOUND.match(first)
+    if not match:
+        return None
+
+    tag = match.group('tag')
+    attrs = {}
+    for prefix, value in re.findall(r'([.#])([\w-]+)', match.group('rest')):
+        if prefix == '#':
+            attrs['id'] = value
+        elif 'class' not in attrs:
+            attrs['class'] = value  # 첫 번째 class만 사용 (상위 집합)
+
+    if not tag and not attrs:
+        return None
+    return SoupStrainer(tag, attrs=attrs)
+
+
+class HtmlParser:
+    """뉴스 목록 영역만 파싱하는 HTML 파서
+
+    - 백엔드: lxml (C 구현, 기본) / html.parser (lxml이 없을 때 대체)
+    - 부분 파싱: 목록 셀렉터로 만든 SoupStrainer로 해당 영역의 하위 트리만 생성
+    - 결과는 BeautifulSoup Tag이므로 기존 parse_article() 구현을 그대로 사용
+    """
+
+    def __init__(
+        self,
+        selector: str,
+        backend: str = HtmlConfig.PARSER,
+        partial: bool = HtmlConfig.PARTIAL,
+    ):
+        """
+        Args:
+            selector: 뉴스 목록 CSS 셀렉터
+            backend: BeautifulSoup 파서 이름 ('lxml', 'html.parser')
+            partial: 목록 영역만 파싱할지 여부
+        """
+        self.selector = selector
+        self.backend = backend
+        self.strainer = build_strainer(selector) if partial else None
+        if partial and self.strainer is None:
+            logger.debug(f"부분 파싱 불가 셀렉터, 전체 파싱: {selector}")
+
+    def parse(self, html: str) -> BeautifulSoup:
+        """HTML 파싱 (부분 파싱이면 목록 영역만 포함된 트리)"""
+        try:
+            return BeautifulSoup(html, self.backend, parse_only=self.strainer)
+        except FeatureNotFound:
+            logger.warning(f"{self.backend} 파서가 없어 html.parser로 동작합니다")
+            self.backend = 'html.parser'
+            return BeautifulSoup(html, self.backend, parse_only=self.strainer)
+
+    def select(self, html: str) -> List:
+        """HTML에서 뉴스 목록 element 리스트 추출"""
+        return self.parse(html).select(self.selector)
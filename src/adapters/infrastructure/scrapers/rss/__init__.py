@@ -1,27 +1,16 @@
 """RSS 기반 뉴스 스크래퍼 모음"""
 
-from adapters.infrastructure.scrapers.rss.asiae_rss_scraper import AsiaeRssScraper
-from adapters.infrastructure.scrapers.rss.dart_rss_scraper import DartRssScraper
-from adapters.infrastructure.scrapers.rss.edaily_rss_scraper import EdailyRssScraper
-from adapters.infrastructure.scrapers.rss.etoday_rss_scraper import EtodayRssScraper
-from adapters.infrastructure.scrapers.rss.hankyung_rss_scraper import HankyungRssScraper
-from adapters.infrastructure.scrapers.rss.herald_rss_scraper import HeraldRssScraper
-from adapters.infrastructure.scrapers.rss.mk_rss_scraper import MKRssScraper
-from adapters.infrastructure.scrapers.rss.newspim_rss_scraper import NewspimRssScraper
-from adapters.infrastructure.scrapers.rss.seoul_rss_scraper import SeoulRssScraper
-from adapters.infrastructure.scrapers.rss.yonhap_rss_scraper import YonhapRssScraper
+from adapters.infrastructure.scrapers.rss.base_rss_scraper import BaseRssScraper
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper, RssSourceSpec
+from adapters.infrastructure.scrapers.rss.rss_sources import RSS_SOURCES, get_rss_source, load_rss_sources
 from adapters.infrastructure.scrapers.rss.infostock_scraper import InfostockScraper
 
 __all__ = [
-    'AsiaeRssScraper',
-    'DartRssScraper',
-    'EdailyRssScraper',
-    'EtodayRssScraper',
-    'HankyungRssScraper',
-    'HeraldRssScraper',
-    'MKRssScraper',
-    'NewspimRssScraper',
-    'SeoulRssScraper',
-    'YonhapRssScraper',
+    'BaseRssScraper',
+    'RssFeedScraper',
+    'RssSourceSpec',
+    'RSS_SOURCES',
+    'get_rss_source',
+    'load_rss_sources',
     'InfostockScraper',
 ]
@@ -0,0 +1,533 @@
+from abc import ABC, abstractmethod
+import xml.etree.ElementTree as ET
+from typing import Container, Dict, List, Optional
+import logging
+
+import httpx
+
+from config import RssConfig
+from domain.model import Article, article_key
+from domain.services.date_parser import kst_day_start
+from domain.services.keyword_matcher import KeywordMatcher
+from ports.news_port import NewsRepository
+from adapters.infrastructure.http_client import HttpClient
+from adapters.infrastructure.parse_executor import ParseExecutor
+from adapters.infrastructure.scrapers.fingerprint_cache import FingerprintCache
+from adapters.infrastructure.scrapers.rss.feed_watermark import FeedWatermark
+from adapters.infrastructure.scrapers.rss.xml_backend import (
+    create_pull_parser,
+    parse_xml,
+    pull_parser_is_thread_bound,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BaseRssScraper(NewsRepository, ABC):
+    """RSS 피드 기반 뉴스 스크래퍼의 베이스 클래스
+
+    공통 로직:
+    - RSS 요청 (공유 HTTP 클라이언트) 및 XML 파싱
+    - 조건부 GET (ETag / Last-Modified): 304면 파싱 없이 "변경 없음" 처리
+    - 콘텐츠 지문 캐시: 본문이 직전 폴링과 같으면 파싱 생략
+    - 피드 item 순회 및 키워드 필터링 (KeywordMatcher로 item당 한 번만 매칭)
+    - 여러 키워드를 피드 1회 요청으로 처리 (fetch_reports_many)
+    - 링크 기준점 (FeedWatermark): 직전 폴링까지 처리한 item은 링크 문자열만 보고 건너뜀
+      (필드 추출/URL 정규화/Article 생성 없음, 감시 목록이 바뀌면 초기화)
+    - 증분 파싱 (INCREMENTAL): 본문을 받는 대로 pull parser로 읽다가
+      이미 본 항목이나 오늘 이전 항목에 도달하면 중단
+      (주기적으로 끝까지 읽으며 날짜 순서를 확인, 최신순이 아니면 전체 파싱으로 전환)
+    - XML 파싱과 item 처리는 ParseExecutor에서 실행 (이벤트 루프 밖)
+
+    각 스크래퍼에서 구현해야 할 부분:
+    - rss_url: RSS 피드 URL
+    - _extract_item_fields(): item 필드 추출
+    - _create_article_from_fields(): Article 생성
+    - get_source_name(): 뉴스 소스 이름
+
+    필요 시 재정의:
+    - RECOVER: malformed 피드면 True (lxml 복구 모드로 한 번만 파싱)
+    - _parse_rss_content(): 응답 본문 파싱
+    - _item_link(), _item_ts(): 기준점/중복 확인용 링크 (필드 추출 전) / 증분 파싱 날짜
+    - _match_text(): 키워드를 검색할 텍스트 (기본: 제목)
+
+    URL/ID/날짜 포맷만 다른 일반 피드는 RssFeedScraper + RssSourceSpec을 사용한다.
+    """
+
+    # 공통 설정
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    TIMEOUT = 20
+    INCREMENTAL = False  # 최신순 피드에서만 켤 것
+    RECOVER = False      # malformed XML 복구 모드 (lxml)
+    KNOWN_STREAK = RssConfig.INCREMENTAL_KNOWN_STREAK
+    ORDER_TOLERANCE = RssConfig.INCREMENTAL_ORDER_TOLERANCE
+    ORDER_CHECK_EVERY = RssConfig.INCREMENTAL_ORDER_CHECK_EVERY
+
+    rss_url: str
+
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        parse_executor: Optional[ParseExecutor] = None
+    ):
+        """
+        Args:
+            http_client: 공유 HTTP 클라이언트 (없으면 스크래퍼 전용 클라이언트 생성)
+            parse_executor: 공유 파싱 실행기 (없으면 이벤트 루프에서 직접 파싱)
+        """
+        self.http_client = http_client or HttpClient()
+        self.parse_executor = parse_executor or ParseExecutor.inline()
+        self.fingerprints = FingerprintCache()
+        self.watermark = FeedWatermark()
+        self._last_keywords: Optional[List[str]] = None
+        self._polls_since_order_check: Optional[int] = None  # 증분 파싱 순서 확인 후 지난 폴링 수
+        self._matcher = KeywordMatcher()  # matcher를 받지 않았을 때 사용하는 자체 매칭기
+
+    async def fetch_reports(self, keyword: str = "") -> List[Article]:
+        """RSS 피드에서 뉴스를 가져옵니다.
+
+        Args:
+            keyword: 필터링할 키워드
+                    빈 문자열이면 모든 항목 반환
+
+        Returns:
+            Article 리스트
+        """
+        # RSS XML 가져오기
+        content = await self._fetch_rss_bytes()
+        if content is None:
+            return []
+
+        results = await self.parse_executor.run(
+            self._parse_items, content, [keyword], self._matcher_for([keyword])
+        )
+        return results[keyword]
+
+    async def fetch_reports_many(
+        self,
+        keywords: List[str],
+        matcher: Optional[KeywordMatcher] = None,
+        seen: Optional[Container[int]] = None
+    ) -> Dict[str, List[Article]]:
+        """피드를 한 번만 가져와서 모든 키워드를 로컬에서 매칭합니다.
+
+        Args:
+            keywords: 필터링할 키워드 목록
+            matcher: 감시 목록으로 컴파일된 공유 매칭기 (없으면 keywords로 자체 매칭기 갱신)
+            seen: 이미 본 기사 키(Article.key) 집합 - 새 링크 중 키워드가 매칭된 item만 확인
+
+        Returns:
+            {키워드: 해당 키워드가 매칭된 Article 리스트}
+        """
+        results: Dict[str, List[Article]] = {keyword: [] for keyword in keywords}
+        matcher = matcher or self._matcher_for(keywords)
+        self.last_new_items = None
+
+        # 키워드가 바뀌면 기존 항목도 다시 매칭해야 하므로 조건부 요청을 하지 않고 기준점도 초기화
+        revalidate = self._last_keywords == list(keywords)
+        self._last_keywords = list(keywords)
+        if not revalidate:
+            self.watermark.reset()
+
+        if self.INCREMENTAL:
+            await self._fetch_incremental(results, matcher, revalidate, seen)
+            return results
+
+        # 304(변경 없음) 또는 오류면 None → 빈 결과
+        response = await self._fetch_rss_response(conditional=True, revalidate=revalidate)
+        if response is None:
+            return results
+        content = response.content
+
+        # 검증자를 지원하지 않는 소스: 본문이 직전 폴링과 같으면 파싱/Article 생성 생략
+        salt = "\x1f".join(keywords).encode('utf-8')
+        digest = FingerprintCache.fingerprint(content, salt)
+        if self.fingerprints.check(self.get_source_name(), self.rss_url, digest, len(content)):
+            logger.debug(f"{self.get_source_name()} 피드 본문 동일 (파싱 생략)")
+            self.last_new_items = 0
+            self.http_client.validators.store(self.rss_url, response)
+            return results
+
+        try:
+            results = await self.parse_executor.run(
+                self._parse_items, content, keywords, matcher, seen, self.watermark, True
+            )
+        except Exception as e:
+            # 지문/검증자를 저장하지 않으므로 같은 본문도 다음 폴링에서 다시 받아 파싱
+            logger.error(f"{self.get_source_name()} RSS 파싱 오류: {e}")
+            return results
+
+        self.fingerprints.commit(self.rss_url, digest)
+        self.http_client.validators.store(self.rss_url, response)
+        return results
+
+    def _parse_items(
+        self,
+        content: bytes,
+        keywords: List[str],
+        matcher: KeywordMatcher,
+        seen: Optional[Container[int]] = None,
+        watermark: Optional[FeedWatermark] = None,
+        strict: bool = False
+    ) -> Dict[str, List[Article]]:
+        """피드 본문 전체를 파싱하여 키워드별 Article 생성 (파싱 실행기에서 실행)
+
+        Args:
+            content: RSS 응답 본문
+            keywords: 필터링할 키워드 목록 (빈 문자열이면 모든 항목)
+            matcher: keywords로 컴파일된 다중 매칭기
+            seen: 이미 본 기사 키 집합 (키워드가 매칭된 item만 확인, 있으면 Article 생성 생략)
+            watermark: 직전 폴링까지 처리한 링크 (주어지면 해당 item은 링크만 보고 건너뛰고,
+                새 링크 수를 last_new_items에 기록)
+            strict: XML 파싱 오류를 예외로 전달 (False면 로그 후 빈 결과)
+
+        Returns:
+            {키워드: 해당 키워드가 매칭된 Article 리스트}
+        """
+        results: Dict[str, List[Article]] = {keyword: [] for keyword in keywords}
+
+        root = self._parse_rss_content(content) if strict else self._parse_rss_safely(content)
+        if root is None:
+            if strict:
+                raise ValueError("RSS 본문에서 XML root를 얻지 못했습니다")
+            return results
+
+        source = self.get_source_name()
+        skipped = 0
+        primed = watermark is not None and watermark.primed
+        new_items = 0
+        for item in root.findall('.//item'):
+            try:
+                link = self._item_link(item)
+                if watermark is not None:
+                    # 링크 문자열만으로 확인 (직전 폴링까지 처리한 item은 여기서 끝)
+                    if watermark.is_known(link):
+                        skipped += 1
+                        continue
+                    watermark.add(link)
+                    new_items += 1  # 감시 항목 매칭 여부와 관계없이 (발행 주기 학습용)
+                # 필드 추출은 item당 한 번만 수행
+                fields = self._extract_item_fields(item)
+                self._append_matches(results, fields, matcher, seen, link)
+            except Exception as e:
+                logger.debug(f"RSS 항목 파싱 오류: {e}")
+                continue
+
+        if skipped:
+            logger.debug(f"{source} 이미 처리한 항목 {skipped}개 생략")
+        if watermark is not None:
+            self.last_new_items = new_items if primed else None
+        return results
+
+    async def _fetch_incremental(
+        self,
+        results: Dict[str, List[Article]],
+        matcher: KeywordMatcher,
+        revalidate: bool,
+        seen: Optional[Container[int]] = None
+    ) -> None:
+        """피드를 스트리밍으로 받으며 새 항목만 처리합니다.
+
+        본문 조각을 pull parser에 넣고 item이 완성될 때마다 처리한다.
+        이미 본 항목이 KNOWN_STREAK개 연속으로 나오거나 오늘 이전 항목에 도달하면
+        더 이상 파싱/Article 생성을 하지 않는다. 폴링당 비용은 피드 크기가 아니라
+        새 항목 수에 비례한다.
+
+        조기 중단은 피드가 최신순이라는 가정에 기대므로 item 날짜 순서를 함께 확인한다.
+        처음 폴링과 ORDER_CHECK_EVERY번마다 한 번은 중단 없이 끝까지 읽으며
+        이미 본 항목의 날짜까지 확인한다. 앞 항목보다 ORDER_TOLERANCE초 넘게 새로운 항목이
+        나오면 이번 폴링은 끝까지 읽고, 기준점/검증자를 버려 다음 폴링부터 전체 파싱으로
+        전환한다 (그 전에 조기 중단으로 놓친 항목은 다음 전체 파싱에서 다시 읽는다).
+
+        Args:
+            results: {키워드: Article 리스트} (매칭된 새 항목을 추가)
+            matcher: 키워드 다중 매칭기
+            revalidate: 조건부 GET에서 저장된 검증자를 보낼지 여부
+            seen: 이미 본 기사 키 집합 (키워드가 매칭된 새 item만 확인)
+        """
+        source = self.get_source_name()
+        watermark = self.watermark
+        today_start = kst_day_start()
+        primed = watermark.primed
+        known_streak = 0
+        scanned = 0
+        new_items = 0
+        last_ts = 0
+        unordered = False
+        # 순서 확인 폴링: 처음과 ORDER_CHECK_EVERY번마다 한 번은 중단 없이 끝까지 읽으며 날짜 순서 확인
+        verify = (
+            self._polls_since_order_check is None
+            or self._polls_since_order_check >= self.ORDER_CHECK_EVERY
+        )
+
+        def consume(events) -> bool:
+            """완성된 item 처리, 중단 지점에 도달하면 True"""
+            nonlocal known_streak, scanned, new_items, last_ts, unordered
+            for _event, item in events:
+                if item.tag != 'item':
+                    continue
+                scanned += 1
+                try:
+                    link = self._item_link(item)
+                    known = watermark.is_known(link)
+                    if known:
+                        known_streak += 1
+                        if known_streak >= self.KNOWN_STREAK and not (verify or unordered):
+                            return True
+                        if not verify:
+                            continue
+                    else:
+                        known_streak = 0
+
+                    fields = self._extract_item_fields(item)
+                    ts = self._item_ts(fields)
+                    if ts:
+                        if last_ts and ts > last_ts + self.ORDER_TOLERANCE:
+                            unordered = True
+                        last_ts = ts
+                    if known:
+                        continue
+                    if ts and ts < today_start:
+                        if not (verify or unordered):
+                            return True
+                        continue
+
+                    watermark.add(link)
+                    new_items += 1
+                    self._append_matches(results, fields, matcher, seen, link)
+                except Exception as e:
+                    logger.debug(f"RSS 항목 파싱 오류: {e}")
+                finally:
+                    item.clear()
+            return False
+
+        stopped = False
+        received = 0
+        try:
+            async with self.http_client.stream_conditional(
+                self.rss_url,
+                source=source,
+                revalidate=revalidate,
+                headers={'User-Agent': self.USER_AGENT},
+                timeout=self.TIMEOUT
+            ) as response:
+                if response.status_code == 304:
+                    logger.debug(f"{source} 피드 변경 없음 (304)")
+                    self.last_new_items = 0
+                    return
+                response.raise_for_status()
+
+                parser = self._create_pull_parser()
+
+                def feed(chunk: Optional[bytes]) -> bool:
+                    # 본문 조각 파싱 + item 처리 (파싱 실행기에서 실행, None이면 마지막)
+                    if chunk is None:
+                        # 마지막 item 이벤트는 close() 이후에 나올 수 있음
+                        parser.close()
+                    else:
+                        parser.feed(chunk)
+                    return consume(parser.read_events())
+
+                # lxml pull parser는 생성한 스레드에서만 feed 가능 → 루프에서 직접 처리
+                offload = not pull_parser_is_thread_bound(self.RECOVER)
+
+                async for chunk in response.aiter_bytes():
+                    received += len(chunk)
+                    if stopped:
+                        # HTTP/1.1은 남은 본문을 받아야 연결을 재사용할 수 있음 (파싱은 하지 않음)
+                        if response.http_version.startswith('HTTP/1'):
+                            continue
+                        break
+                    stopped = await self.parse_executor.run(feed, chunk) if offload else feed(chunk)
+
+                if not stopped:
+                    stopped = await self.parse_executor.run(feed, None) if offload else feed(None)
+
+                # 본문 처리가 끝난 뒤에만 검증자 저장 (실패하면 다음 폴링에서 304 없이 다시 받음)
+                # 크기는 실제로 받은 바이트 수 (Content-Length는 없을 수 있음)
+                if not unordered:
+                    self.http_client.validators.store(self.rss_url, response, size=received)
+            # 감시 항목 매칭 여부와 관계없이 새로 올라온 항목 수 (발행 주기 학습용)
+            self.last_new_items = new_items if primed else None
+            if scanned:
+                self._polls_since_order_check = 0 if verify else self._polls_since_order_check + 1
+        except Exception as e:
+            logger.error(f"{source} RSS 증분 파싱 오류: {e}")
+
+        if unordered:
+            logger.warning(f"{source} 피드가 최신순이 아닙니다 - 증분 파싱을 끄고 전체 파싱으로 전환")
+            self.INCREMENTAL = False
+            watermark.reset()
+            self.http_client.validators.invalidate(self.rss_url)
+
+        logger.debug(
+            f"{source} 증분 파싱: {scanned}개 항목 확인, 새 항목 {new_items}개 "
+            f"({'중단' if stopped else '끝까지'})"
+        )
+
+    def _matcher_for(self, keywords: List[str]) -> KeywordMatcher:
+        """자체 매칭기를 keywords에 맞춰 갱신 (바뀐 키워드만 추가/삭제)"""
+        self._matcher.sync(keywords)
+        return self._matcher
+
+    def _append_matches(
+        self,
+        results: Dict[str, List[Article]],
+        fields: dict,
+        matcher: KeywordMatcher,
+        seen: Optional[Container[int]] = None,
+        link: str = ""
+    ) -> None:
+        """item을 매칭된 키워드의 결과에 추가합니다.
+
+        검색 텍스트는 item당 한 번만 만들고 모든 키워드를 한 번에 매칭한다.
+        기사 키(URL 정규화 + 해시)는 매칭된 item만 한 번 계산하여 seen 확인과 Article 생성에 쓴다.
+
+        Args:
+            results: {키워드: Article 리스트} (빈 문자열 키는 모든 항목)
+            fields: _extract_item_fields에서 반환된 필드 dict
+            matcher: 키워드 다중 매칭기
+            seen: 이미 본 기사 키 집합 (있으면 Article을 만들지 않음)
+            link: _item_link로 읽은 링크
+        """
+        keywords = [keyword for keyword in matcher.find(self._match_text(fields)) if keyword in results]
+        if "" in results:
+            keywords.insert(0, "")
+        if not keywords:
+            return
+
+        if seen is not None:
+            key = article_key(self.get_source_name(), link)
+            if key in seen:
+                return
+            fields['_key'] = key
+        for keyword in keywords:
+            results[keyword].append(self._create_article_from_fields(fields, keyword))
+
+    def _match_text(self, fields: dict) -> str:
+        """키워드를 검색할 텍스트 (기본: 제목)"""
+        return fields['title']
+
+    def _create_pull_parser(self):
+        """증분 파싱용 pull parser 생성 (element 종료 이벤트)"""
+        return create_pull_parser(self.RECOVER)
+
+    def _item_link(self, item: ET.Element) -> str:
+        """필드 추출 전에 item 링크만 읽기 (증분 파싱 기준점 키, 이미 본 기사 확인용)"""
+        return item.findtext('link') or ""
+
+    def _item_ts(self, fields: dict) -> int:
+        """증분 파싱에서 오늘 이전 항목을 판단할 날짜 (epoch 초, 모르면 0)"""
+        return 0
+
+    async def _fetch_rss_bytes(self, conditional: bool = False, revalidate: bool = True) -> Optional[bytes]:
+        """RSS 응답 본문을 가져옵니다.
+
+        Args:
+            conditional: 검증자 캐시를 사용하는 조건부 GET 여부
+            revalidate: 조건부 GET에서 저장된 검증자를 보낼지 여부
+
+        Returns:
+            응답 본문, 변경 없음(304) 또는 실패시 None
+        """
+        response = await self._fetch_rss_response(conditional, revalidate)
+        return response.content if response is not None else None
+
+    async def _fetch_rss_response(
+        self, conditional: bool = False, revalidate: bool = True
+    ) -> Optional[httpx.Response]:
+        """RSS 응답을 가져옵니다.
+
+        조건부 GET의 검증자는 저장하지 않는다. 본문 처리에 성공한 뒤
+        http_client.validators.store()로 저장해야 다음 폴링에서 304를 받는다.
+
+        Args:
+            conditional: 검증자 캐시를 사용하는 조건부 GET 여부
+            revalidate: 조건부 GET에서 저장된 검증자를 보낼지 여부
+
+        Returns:
+            성공한 응답, 변경 없음(304) 또는 실패시 None
+        """
+        try:
+            headers = {'User-Agent': self.USER_AGENT}
+            if conditional:
+                response = await self.http_client.get_conditional(
+                    self.rss_url,
+                    source=self.get_source_name(),
+                    revalidate=revalidate,
+                    headers=headers,
+                    timeout=self.TIMEOUT
+                )
+                if response.status_code == 304:
+                    logger.debug(f"{self.get_source_name()} 피드 변경 없음 (304)")
+                    self.last_new_items = 0
+                    return None
+            else:
+                response = await self.http_client.get(self.rss_url, headers=headers, timeout=self.TIMEOUT)
+            response.raise_for_status()
+
+            return response
+        except Exception as e:
+            logger.error(f"RSS 가져오기 오류: {e}", exc_info=True)
+            return None
+
+    def _parse_rss_safely(self, content: bytes) -> Optional[ET.Element]:
+        """_parse_rss_content 호출 (예외 시 None)"""
+        try:
+            return self._parse_rss_content(content)
+        except Exception as e:
+            logger.error(f"{self.get_source_name()} RSS 파싱 오류: {e}")
+            return None
+
+    def _parse_rss_content(self, content: bytes) -> Optional[ET.Element]:
+        """응답 본문을 XML로 파싱합니다.
+
+        Args:
+            content: RSS 응답 본문
+
+        Returns:
+            파싱된 XML root element (RECOVER면 lxml Element), 실패시 None
+        """
+        return parse_xml(content, recover=self.RECOVER)
+
+    def _get_element_text(self, element: Optional[ET.Element]) -> str:
+        """XML Element에서 텍스트를 안전하게 추출합니다.
+
+        Args:
+            element: XML Element (None 가능)
+
+        Returns:
+            Element의 text 또는 빈 문자열
+        """
+        return element.text if element is not None and element.text else ""
+
+    # 추상 메서드 - 각 스크래퍼에서 구현 필요
+    @abstractmethod
+    def _extract_item_fields(self, item: ET.Element) -> dict:
+        """RSS item에서 필드를 추출합니다.
+
+        Args:
+            item: RSS item element
+
+        Returns:
+            추출된 필드 dict
+        """
+        pass
+
+    @abstractmethod
+    def _create_article_from_fields(self, fields: dict, keyword: str) -> Article:
+        """추출된 필드로 Article 객체를 생성합니다.
+
+        Args:
+            fields: _extract_item_fields에서 반환된 필드 dict
+            keyword: 검색 키워드
+
+        Returns:
+            Article 객체
+        """
+        pass
+
+    @abstractmethod
+    def get_source_name(self) -> str:
+        """뉴스 소스 이름 반환"""
+        pass
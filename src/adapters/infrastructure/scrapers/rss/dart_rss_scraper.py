@@ -1,196 +0,0 @@
-import httpx
-import re
-import xml.etree.ElementTree as ET
-from typing import List, Optional
-from datetime import datetime, timedelta
-import logging
-
-from domain.model import Article
-from ports.news_port import NewsRepository
-
-logger = logging.getLogger(__name__)
-
-
-class DartRssScraper(NewsRepository):
-    """DART 전자공시 RSS 피드에서 공시 정보를 가져오는 스크래퍼"""
-    
-    # RSS 네임스페이스
-    RSS_NAMESPACE = {'dc': 'http://purl.org/dc/elements/1.1/'}
-    
-    def __init__(self, rss_url: str = "https://dart.fss.or.kr/api/todayRSS.xml"):
-        self.rss_url = rss_url
-    
-    async def fetch_reports(self, keyword: str = "") -> List[Article]:
-        """RSS 피드에서 공시 정보를 가져옵니다.
-        
-        Args:
-            keyword: 필터링할 키워드 (제목 또는 회사명에서 검색)
-                    빈 문자열이면 모든 항목 반환
-        
-        Returns:
-            Article 리스트
-        """
-        articles = []
-        
-        # RSS XML 가져오기
-        root = await self._fetch_rss_content()
-        if root is None:
-            return articles
-        
-        # 각 item 처리
-        for item in root.findall('.//item'):
-            article = self._process_rss_item(item, keyword)
-            if article:
-                articles.append(article)
-        
-        return articles
-    
-    async def _fetch_rss_content(self) -> Optional[ET.Element]:
-        """RSS XML 콘텐츠를 가져와서 파싱합니다.
-        
-        Returns:
-            파싱된 XML root element, 실패시 None
-        """
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.rss_url, headers=headers, timeout=20)
-                response.raise_for_status()
-            
-            return ET.fromstring(response.content)
-        except Exception as e:
-            logger.error(f"RSS 가져오기 오류: {e}", exc_info=True)
-            return None
-    
-    def _process_rss_item(self, item: ET.Element, keyword: str) -> Optional[Article]:
-        """단일 RSS item을 처리하여 Article로 변환합니다.
-        
-        Args:
-            item: RSS item element
-            keyword: 필터링할 키워드
-            
-        Returns:
-            Article 객체, 필터링되거나 오류시 None
-        """
-        try:
-            # 필드 추출
-            fields = self._extract_item_fields(item)
-            
-            # 키워드 필터링
-            if keyword and not self._matches_keyword(
-                keyword, 
-                fields['title'], 
-                fields['creator'], 
-                fields['category']
-            ):
-                return None
-            
-            # Article 생성
-            return self._create_article_from_fields(fields, keyword)
-            
-        except Exception as e:
-            logger.debug(f"RSS 항목 파싱 오류: {e}")
-            return None
-    
-    def _extract_item_fields(self, item: ET.Element) -> dict:
-        """RSS item에서 필드를 추출합니다.
-        
-        Args:
-            item: RSS item element
-            
-        Returns:
-            추출된 필드 dict
-        """
-        return {
-            'title': self._get_element_text(item.find('title')),
-            'link': self._get_element_text(item.find('link')),
-            'category': self._get_element_text(item.find('category')),
-            'pub_date': self._get_element_text(item.find('pubDate')),
-            'creator': self._get_element_text(item.find('dc:creator', self.RSS_NAMESPACE)),
-            'guid': self._get_element_text(item.find('guid'))
-        }
-    
-    def _get_element_text(self, element: Optional[ET.Element]) -> str:
-        """XML Element에서 텍스트를 안전하게 추출합니다.
-        
-        Args:
-            element: XML Element (None 가능)
-            
-        Returns:
-            Element의 text 또는 빈 문자열
-        """
-        return element.text if element is not None and element.text else ""
-    
-    def _matches_keyword(self, keyword: str, title: str, creator: str, category: str) -> bool:
-        """키워드가 title, creator, category 중 하나에 포함되는지 확인합니다.
-        
-        Args:
-            keyword: 검색 키워드
-            title: 제목
-            creator: 회사명
-            category: 카테고리
-            
-        Returns:
-            매칭 여부
-        """
-        keyword_lower = keyword.lower()
-        return (keyword_lower in title.lower() or 
-                keyword_lower in creator.lower() or 
-                keyword_lower in category.lower())
-    
-    def _create_article_from_fields(self, fields: dict, keyword: str) -> Article:
-        """추출된 필드로 Article 객체를 생성합니다.
-        
-        Args:
-            fields: _extract_item_fields에서 반환된 필드 dict
-            keyword: 검색 키워드
-            
-        Returns:
-            Article 객체
-        """
-        article_id = self._extract_rcp_no(fields['guid'])
-        date_str = self._convert_date_format(fields['pub_date'])
-        full_title = f"({fields['category']}){fields['creator']} - {fields['title']}"
-        
-        return Article(
-            id=article_id,
-            title=full_title,
-            link=fields['link'],
-            date=date_str,
-            keyword=keyword if keyword else fields['category'],
-            source=self.get_source_name()
-        )
-    
-    def _extract_rcp_no(self, guid: str) -> int:
-        """GUID에서 rcpNo 추출
-        
-        Args:
-            guid: GUID 문자열 (예: "https://dart.fss.or.kr/api/link.jsp?rcpNo=20251205000173")
-            
-        Returns:
-            rcpNo (정수)
-        """
-        match = re.search(r'rcpNo=(\d+)', guid)
-        return int(match.group(1)) if match else 0
-    
-    def _convert_date_format(self, pub_date: str) -> str:
-        """RFC-822 날짜를 YYYY-MM-DD HH:MM 포맷으로 변환
-        
-        Args:
-            pub_date: RFC-822 형식 날짜 (예: "Fri, 05 Dec 2025 04:28:00 GMT")
-            
-        Returns:
-            변환된 날짜 문자열 (예: "2025-12-05 04:28")
-        """
-        try:
-            dt = datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %Z")
-            dt_kst = dt + timedelta(hours=9)
-            return dt_kst.strftime("%Y-%m-%d %H:%M")
-        except Exception as e:
-            logger.warning(f"날짜 변환 오류 '{pub_date}': {e}")
-            return pub_date
-    
-    def get_source_name(self) -> str:
-        return "DART"
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+from config import RssConfig
+
+
+class FeedWatermark:
+    """피드별 "이미 본 항목" 기준점
+
+    최신순 피드를 위에서부터 읽다가 이미 본 항목에 도달하면 멈출 수 있도록
+    직전 폴링까지 확인한 항목 키(링크)를 기억한다.
+    오래된 키부터 밀어내어 최대 max_keys개만 유지한다.
+    """
+
+    def __init__(self, max_keys: int = RssConfig.WATERMARK_SIZE):
+        self.max_keys = max_keys
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+
+    @property
+    def primed(self) -> bool:
+        """기준점이 있는지 (첫 폴링 전이거나 초기화 직후면 False)"""
+        return bool(self._keys)
+
+    def is_known(self, key: str) -> bool:
+        return key in self._keys
+
+    def add(self, key: str) -> None:
+        """확인한 항목 키 추가"""
+        if not key or key in self._keys:
+            return
+        self._keys[key] = None
+        if len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+
+    def reset(self) -> None:
+        """기준점 초기화 (다음 폴링은 피드 전체를 읽음)"""
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
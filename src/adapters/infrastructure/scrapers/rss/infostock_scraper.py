@@ -1,17 +1,36 @@
 import re
-import httpx
-from bs4 import BeautifulSoup
-from typing import List
+from typing import List, Optional
 import logging
 
 from domain.model import Article
+from domain.services.url_canonicalizer import absolute_url
 from ports.news_port import NewsRepository
+from adapters.infrastructure.http_client import HttpClient
+from adapters.infrastructure.parse_executor import ParseExecutor
+from adapters.infrastructure.scrapers.html_parser import HtmlParser
 
 logger = logging.getLogger(__name__)
 
 class InfostockScraper(NewsRepository):
     BASE_URL = "https://www.infostockdaily.co.kr"
     SEARCH_URL = "https://www.infostockdaily.co.kr/news/articleList.html"
+    NEWS_LIST_SELECTOR = ".list-block"
+
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        parse_executor: Optional[ParseExecutor] = None
+    ):
+        self.http_client = http_client or HttpClient()
+        self.parse_executor = parse_executor or ParseExecutor.inline()
+        self.html_parser = HtmlParser(self.NEWS_LIST_SELECTOR)
+
+    def __getstate__(self) -> dict:
+        # 프로세스 풀로 파싱을 넘길 때는 파싱에 필요한 상태만 전달
+        state = self.__dict__.copy()
+        state['http_client'] = None
+        state['parse_executor'] = None
+        return state
 
     async def fetch_reports(self, keyword: str) -> List[Article]:
         articles = []
@@ -28,71 +47,67 @@ class InfostockScraper(NewsRepository):
                 "sc_word": keyword
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(self.SEARCH_URL, headers=headers, data=data, timeout=20)
-                response.raise_for_status()
-                # Fix encoding issue
-                response.encoding = 'utf-8'
+            response = await self.http_client.post(self.SEARCH_URL, headers=headers, data=data, timeout=20)
+            response.raise_for_status()
+            # Fix encoding issue
+            response.encoding = 'utf-8'
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            items = soup.select(".list-block")
+            articles = await self.parse_executor.run(
+                self._parse_items, response.text, keyword, cpu_bound=True
+            )
             
-            for item in items:
-                try:
-                    # Title & Link
-                    title_tag = item.select_one(".list-titles a")
-                    if not title_tag:
-                        continue
-                        
-                    title = title_tag.text.strip()
-                    relative_link = title_tag['href']
-                    link = self.BASE_URL + relative_link
-                    
-                    # ID Extraction
-                    # Link format: /news/articleView.html?idxno=12345
-                    article_id = 0
-                    match = re.search(r'idxno=(\d+)', relative_link)
-                    if match:
-                        article_id = int(match.group(1))
-                    else:
-                        # Fallback if ID not found in URL (unlikely for this CMS)
-                        continue
-
-                    # Date
-                    # Format: "2025-12-04 16:16" or similar
-                    date_tag = item.select_one(".list-dated")
-                    date_str = ""
-                    if date_tag:
-                        raw_date = date_tag.text.strip()
-                        # "2024.12.04 16:20" -> "2024-12-04 16:20"
-                        if raw_date:
-                            date_str = raw_date.replace('.', '-', 2)
-                    
-                    # Clean up date string if it contains extra info (e.g. " | 기자명")
-                    # Usually it's just date/time or "Author | Date"
-                    # Let's try to extract just the date/time part if possible, or keep as is.
-                    # The user's code just prints it. We'll keep it as is for now, 
-                    # but typically we want "YYYY-MM-DD HH:MM" for consistency.
-                    # Example: "2024.12.04 16:20" or "기자명 | 2024.12.04 16:20"
-                    # Simple regex to find date pattern might be good, but let's stick to raw first.
-                    
-                    articles.append(Article(
-                        id=article_id,
-                        title=title,
-                        link=link,
-                        date=date_str,
-                        keyword=keyword,
-                        source=self.get_source_name()
-                    ))
-                    
-                except Exception as e:
-                    logger.debug(f"인포스탁 항목 파싱 오류: {e}")
-                    continue
-                    
         except Exception as e:
             logger.error(f"인포스탁 스크래핑 오류: {e}", exc_info=True)
             
         return articles
 
+    def _parse_items(self, html: str, keyword: str) -> List[Article]:
+        """검색 결과 HTML에서 기사 목록 파싱 (파싱 실행기에서 실행)"""
+        articles = []
+        items = self.html_parser.select(html)
+        
+        for item in items:
+            try:
+                # Title & Link
+                title_tag = item.select_one(".list-titles a")
+                if not title_tag:
+                    continue
+                    
+                title = title_tag.text.strip()
+                relative_link = title_tag['href']
+                link = absolute_url(relative_link, self.BASE_URL)
+                
+                # ID Extraction
+                # Link format: /news/articleView.html?idxno=12345
+                article_id = 0
+                match = re.search(r'idxno=(\d+)', relative_link)
+                if match:
+                    article_id = int(match.group(1))
+                else:
+                    # Fallback if ID not found in URL (unlikely for this CMS)
+                    continue
+
+                # Date
+                # Format: "2025-12-04 16:16" or similar
+                # "2024.12.04 16:20" 또는 "기자명 | 2024.12.04 16:20"
+                # (Article 생성 시 date_parser가 문자열 안의 날짜를 찾아 해석)
+                date_tag = item.select_one(".list-dated")
+                date_str = date_tag.text.strip() if date_tag else ""
+                
+                articles.append(Article(
+                    id=article_id,
+                    title=title,
+                    link=link,
+                    date=date_str,
+                    keyword=keyword,
+                    source=self.get_source_name()
+                ))
+                
+            except Exception as e:
+                logger.debug(f"인포스탁 항목 파싱 오류: {e}")
+                continue
+        
+        return articles
+
     def get_source_name(self) -> str:
         return "인포스탁"
@@ -0,0 +1,196 @@
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+import logging
+
+from domain.model import Article, stable_hash
+from domain.services.date_parser import parse_date
+from adapters.infrastructure.http_client import HttpClient
+from adapters.infrastructure.parse_executor import ParseExecutor
+from adapters.infrastructure.scrapers.rss.base_rss_scraper import BaseRssScraper
+from adapters.infrastructure.scrapers.rss.xml_backend import supports_pull_parsing
+
+logger = logging.getLogger(__name__)
+
+
+# RSS item 필드 이름 → 태그 (접두사는 RSS_NAMESPACES 기준)
+DEFAULT_FIELD_PATHS: Dict[str, str] = {
+    'title': 'title',
+    'link': 'link',
+    'guid': 'guid',
+    'no': 'no',
+    'category': 'category',
+    'pub_date': 'pubDate',
+    'author': 'author',
+    'creator': 'dc:creator',
+}
+
+RSS_NAMESPACES: Dict[str, str] = {
+    'dc': 'http://purl.org/dc/elements/1.1/',
+}
+
+
+@dataclass(frozen=True)
+class RssSourceSpec:
+    """RSS 소스 정의 (소스별 차이를 선언적으로 기술)
+
+    Attributes:
+        name: 소스 이름 (Article.source, TTS 안내에 사용)
+        url: RSS 피드 URL
+        id_field: 기사 ID를 추출할 필드 ('guid', 'no', 'link' 등)
+        id_pattern: ID 추출 정규식 (그룹 1 사용, 숫자가 아니면 해시). None이면 필드 값 전체를 정수로 사용
+        hash_unmatched: id_pattern이 매칭되지 않을 때 필드 값 해시를 ID로 사용 (False면 0)
+        date_format: 공용 날짜 파서(date_parser)가 해석하지 못할 때 시도할 strptime 포맷
+            (RSS pubDate, ISO 8601 등 알려진 형식과 시간대 표기는 자동으로 처리)
+        match_fields: 키워드를 검색할 필드
+        title_template: Article 제목 포맷 (필드 이름 치환)
+        default_keyword: 키워드 없이 조회할 때의 keyword 포맷 (비어있으면 소스 이름)
+        recover: malformed XML을 lxml 복구 모드로 파싱 (잘못된 엔티티 등, 한 번만 파싱)
+        field_paths: 필드 이름 → item 하위 태그 (기본값 DEFAULT_FIELD_PATHS)
+        user_agent: 요청 User-Agent (비어있으면 기본값)
+        incremental: 증분 파싱 사용 (최신순임을 확인한 피드만 켤 것, 실행 중 순서가 어긋나면 전체 파싱으로 전환)
+    """
+    name: str
+    url: str
+    id_field: str = 'link'
+    id_pattern: Optional[str] = None
+    hash_unmatched: bool = False
+    date_format: str = ""
+    match_fields: Tuple[str, ...] = ('title',)
+    title_template: str = "{title}"
+    default_keyword: str = ""
+    recover: bool = False
+    field_paths: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_FIELD_PATHS))
+    user_agent: str = ""
+    incremental: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RssSourceSpec":
+        """설정 파일(JSON)의 항목으로 스펙 생성"""
+        data = dict(data)
+        # 이전 설정의 시간대 보정 항목은 무시 (시간대는 날짜 문자열에서 읽음)
+        for legacy in ('strip_tz', 'tz_shift_hours'):
+            if data.pop(legacy, None) is not None:
+                logger.debug(f"RSS 소스 '{data.get('name')}': '{legacy}' 설정은 더 이상 사용하지 않습니다")
+        if 'match_fields' in data:
+            data['match_fields'] = tuple(data['match_fields'])
+        if 'field_paths' in data:
+            data['field_paths'] = {**DEFAULT_FIELD_PATHS, **data['field_paths']}
+        return cls(**data)
+
+
+class RssFeedScraper(BaseRssScraper):
+    """RssSourceSpec으로 동작하는 범용 RSS 스크래퍼
+
+    소스별 차이(URL, ID 필드/정규식, 날짜 포맷, 제목 포맷 등)는 스펙으로만 표현하고,
+    파싱 경로는 하나로 통일한다.
+    - 정규식/필드 태그는 생성 시 한 번만 컴파일
+    - item의 자식 element를 한 번만 순회하여 필요한 필드만 추출
+    """
+
+    def __init__(
+        self,
+        spec: RssSourceSpec,
+        http_client: Optional[HttpClient] = None,
+        parse_executor: Optional[ParseExecutor] = None
+    ):
+        super().__init__(http_client, parse_executor)
+        self.spec = spec
+        self.rss_url = spec.url
+        if spec.user_agent:
+            self.USER_AGENT = spec.user_agent
+        self.RECOVER = spec.recover
+        # 복구 모드 증분 파싱은 lxml이 있을 때만 가능 (없으면 전체 파싱)
+        self.INCREMENTAL = spec.incremental and supports_pull_parsing(spec.recover)
+
+        self._id_regex = re.compile(spec.id_pattern) if spec.id_pattern else None
+        self._date_formats = (spec.date_format,) if spec.date_format else ()
+
+        # 필요한 필드만 추출: 태그(네임스페이스 확장) → 필드 이름
+        needed = {'title', 'link', 'pub_date', spec.id_field, *spec.match_fields}
+        needed.update(re.findall(r'\{(\w+)\}', spec.title_template))
+        needed.update(re.findall(r'\{(\w+)\}', spec.default_keyword))
+        self._field_names = tuple(sorted(needed))
+        self._tag_to_field = {
+            self._expand_tag(spec.field_paths[name]): name
+            for name in self._field_names
+        }
+        self._link_tag = self._expand_tag(spec.field_paths['link'])
+
+    def get_source_name(self) -> str:
+        return self.spec.name
+
+    def _extract_item_fields(self, item: ET.Element) -> dict:
+        """item 자식 element를 한 번 순회하며 필요한 필드만 추출합니다."""
+        fields = dict.fromkeys(self._field_names, "")
+        tag_to_field = self._tag_to_field
+        for child in item:
+            name = tag_to_field.get(child.tag)
+            if name is not None and not fields[name] and child.text:
+                fields[name] = child.text
+        return fields
+
+    def _item_link(self, item: ET.Element) -> str:
+        return item.findtext(self._link_tag) or ""
+
+    def _item_ts(self, fields: dict) -> int:
+        # 증분 파싱에서 한 번 해석한 값을 Article 생성에 재사용
+        ts = fields.get('_ts')
+        if ts is None:
+            ts = fields['_ts'] = parse_date(fields['pub_date'], self.spec.name, self._date_formats)
+        return ts
+
+    def _match_text(self, fields: dict) -> str:
+        # 필드 경계를 넘는 매칭이 생기지 않도록 줄바꿈으로 구분
+        return "\n".join(fields[name] for name in self.spec.match_fields)
+
+    def _create_article_from_fields(self, fields: dict, keyword: str) -> Article:
+        spec = self.spec
+        if not keyword:
+            keyword = spec.default_keyword.format(**fields) if spec.default_keyword else spec.name
+
+        return Article(
+            id=self._extract_news_id(fields[spec.id_field]),
+            title=spec.title_template.format(**fields),
+            link=fields['link'],
+            date=fields['pub_date'],
+            keyword=keyword,
+            source=spec.name,
+            key=fields.get('_key', 0),  # 이미 본 기사 확인에서 계산한 키 (없으면 생성 시 계산)
+            ts=self._item_ts(fields)
+        )
+
+    def _extract_news_id(self, value: str) -> int:
+        """ID 필드에서 뉴스 ID 추출
+
+        Args:
+            value: ID 필드 값 (예: guid "2025120913415374072", link ".../view/2534246")
+
+        Returns:
+            뉴스 ID (숫자가 아니면 해시값, 추출 실패시 0)
+        """
+        if not value:
+            return 0
+
+        # 필드 값 전체가 ID (guid, no): 숫자가 아니면 0
+        if self._id_regex is None:
+            token = value.strip()
+            return int(token) if token.isdigit() else 0
+
+        match = self._id_regex.search(value)
+        if not match:
+            return stable_hash(value) if self.spec.hash_unmatched else 0
+
+        token = match.group(1)
+        if token.isdigit():
+            return int(token)
+        return stable_hash(token)  # 재시작해도 같은 양수 해시값
+
+    @staticmethod
+    def _expand_tag(path: str) -> str:
+        """'dc:creator' → '{http://purl.org/dc/elements/1.1/}creator'"""
+        if ':' in path:
+            prefix, local = path.split(':', 1)
+            return f"{{{RSS_NAMESPACES[prefix]}}}{local}"
+        return path
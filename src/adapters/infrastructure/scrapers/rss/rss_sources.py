@@ -0,0 +1,121 @@
+import json
+import os
+from typing import List, Optional
+import logging
+
+from config import DartConfig, RssConfig
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssSourceSpec
+
+logger = logging.getLogger(__name__)
+
+
+DART_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 기본 RSS 소스 정의
+RSS_SOURCES: List[RssSourceSpec] = [
+    RssSourceSpec(
+        name="뉴스핌",
+        url="http://rss.newspim.com/news/category/1",
+        id_pattern=r'/view/(\d+)',
+    ),
+    RssSourceSpec(
+        name="이데일리",
+        url="http://rss.edaily.co.kr/edaily_news.xml",
+        id_field='guid',
+        default_keyword="{category}",
+    ),
+    RssSourceSpec(
+        name="한국경제",
+        url="https://www.hankyung.com/feed/all-news",
+        id_pattern=r'/article/([a-zA-Z0-9]+)',
+    ),
+    RssSourceSpec(
+        name="매일경제",
+        url="https://www.mk.co.kr/rss/40300001/",
+        id_field='no',
+        default_keyword="{category}",
+    ),
+    RssSourceSpec(
+        name="연합뉴스",
+        url="https://www.yna.co.kr/rss/news.xml",
+        id_pattern=r'AKR(\d+)',
+        hash_unmatched=True,
+    ),
+    RssSourceSpec(
+        name="아시아경제",
+        url="https://www.asiae.co.kr/rss/all.htm",
+        id_field='guid',
+    ),
+    RssSourceSpec(
+        name="이투데이",
+        url="https://rss.etoday.co.kr/eto/etoday_news_all.xml",
+        id_pattern=r'/view/(\d+)',
+    ),
+    RssSourceSpec(
+        name="헤럴드경제",
+        url="http://rss.edaily.co.kr/edaily_news.xml",
+        id_pattern=r'/article/(\d+)',
+        default_keyword="{category}",
+    ),
+    RssSourceSpec(
+        name="서울경제",
+        url="https://www.sedaily.com/rss",
+        id_pattern=r'/NewsView/([A-Z0-9]+)',
+        recover=True,  # 잘못된 엔티티가 포함된 피드
+    ),
+    RssSourceSpec(
+        name="DART",
+        url=DartConfig.RSS_URL,
+        id_field='guid',
+        id_pattern=r'rcpNo=(\d+)',
+        match_fields=('title', 'creator', 'category'),
+        title_template="({category}){creator} - {title}",
+        default_keyword="{category}",
+        user_agent=DART_USER_AGENT,
+    ),
+]
+
+
+def get_rss_source(name: str) -> RssSourceSpec:
+    """이름으로 기본 RSS 소스 정의를 찾습니다.
+
+    Args:
+        name: 소스 이름 (예: "연합뉴스")
+
+    Returns:
+        RssSourceSpec
+
+    Raises:
+        KeyError: 해당 이름의 소스가 없을 때
+    """
+    for spec in RSS_SOURCES:
+        if spec.name == name:
+            return spec
+    raise KeyError(name)
+
+
+def load_rss_sources(filepath: Optional[str] = RssConfig.EXTRA_SOURCES_FILE) -> List[RssSourceSpec]:
+    """기본 RSS 소스와 설정 파일의 추가 소스를 합쳐서 반환합니다.
+
+    설정 파일의 항목 이름이 기본 소스와 같으면 기본 정의를 대체합니다.
+
+    Args:
+        filepath: 추가 소스 정의 JSON 파일 경로 (None이거나 없으면 기본 소스만)
+
+    Returns:
+        RssSourceSpec 리스트
+    """
+    sources = {spec.name: spec for spec in RSS_SOURCES}
+
+    if filepath and os.path.exists(filepath):
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            for entry in entries:
+                spec = RssSourceSpec.from_dict(entry)
+                sources[spec.name] = spec
+            logger.info(f"추가 RSS 소스 로드: {len(entries)}개 ({filepath})")
+        except Exception as e:
+            logger.error(f"RSS 소스 설정 로드 오류: {e}")
+
+    return list(sources.values())
@@ -0,0 +1,80 @@
+"""RSS XML 파싱 백엔드
+
+- 기본: 표준 xml.etree.ElementTree
+- 복구 모드(recover): lxml로 한 번만 파싱하고 lxml 트리를 그대로 사용
+  (잘못된 엔티티 등 malformed 피드용, 직렬화 후 재파싱하지 않음)
+
+lxml Element는 find/findall/iter/text/tag 등 ElementTree API를 그대로 지원하므로
+스크래퍼는 어느 백엔드의 트리인지 구분하지 않는다.
+"""
+import re
+import xml.etree.ElementTree as ET
+import logging
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+logger = logging.getLogger(__name__)
+
+LXML_AVAILABLE = lxml_etree is not None
+
+# 정의되지 않은 엔티티의 '&' (lxml이 없을 때 복구용)
+_BARE_AMPERSAND = re.compile(r'&(?!(amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)')
+
+
+def parse_xml(content: bytes, recover: bool = False):
+    """응답 본문을 XML 트리로 파싱합니다.
+
+    Args:
+        content: XML 바이트
+        recover: malformed XML 복구 모드
+
+    Returns:
+        root element (recover면 lxml Element, 아니면 ElementTree Element)
+    """
+    if not recover:
+        return ET.fromstring(content)
+
+    if LXML_AVAILABLE:
+        parser = lxml_etree.XMLParser(recover=True, encoding='utf-8')
+        return lxml_etree.fromstring(content, parser=parser)
+
+    logger.warning("lxml not installed, falling back to standard ET")
+    # lxml이 없으면 잘못된 엔티티만 이스케이프하여 파싱
+    xml_text = content.decode('utf-8', errors='replace')
+    xml_text = _BARE_AMPERSAND.sub('&amp;', xml_text)
+    return ET.fromstring(xml_text.encode('utf-8'))
+
+
+def supports_pull_parsing(recover: bool = False) -> bool:
+    """해당 모드에서 증분(pull) 파싱을 지원하는지"""
+    return not recover or LXML_AVAILABLE
+
+
+def pull_parser_is_thread_bound(recover: bool = False) -> bool:
+    """pull parser를 생성한 스레드에서만 사용할 수 있는지
+
+    lxml 파서는 생성한 스레드 밖에서 feed()하면 안 된다 (libxml2 스레드 제약).
+    조각마다 다른 작업 스레드에서 feed()하는 실행기로 넘기지 말 것.
+    """
+    return recover and LXML_AVAILABLE
+
+
+def create_pull_parser(recover: bool = False):
+    """증분 파싱용 pull parser 생성 (element 종료 이벤트)
+
+    feed(bytes) / read_events() 인터페이스는 두 백엔드가 같다.
+
+    Args:
+        recover: malformed XML 복구 모드 (lxml 필요)
+
+    Returns:
+        ElementTree.XMLPullParser 또는 lxml.etree.XMLPullParser
+    """
+    if not recover:
+        return ET.XMLPullParser(events=('end',))
+    if not LXML_AVAILABLE:
+        raise RuntimeError("복구 모드 증분 파싱에는 lxml이 필요합니다")
+    return lxml_etree.XMLPullParser(events=('end',), tag='item', recover=True, encoding='utf-8')
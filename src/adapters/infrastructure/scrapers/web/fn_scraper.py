@@ -2,6 +2,7 @@ import re
 from typing import Optional
 
 from domain.model import Article
+from domain.services.url_canonicalizer import absolute_url
 from adapters.infrastructure.scrapers.base_web_scraper import BaseWebScraper
 
 
@@ -25,8 +26,7 @@ class FnScraper(BaseWebScraper):
         link = title_elem.get('href', '')
         
         # 상대 경로를 절대 경로로 변환
-        if link and link.startswith('/'):
-            link = 'https://www.fnnews.com' + link
+        link = absolute_url(link, 'https://www.fnnews.com/')
         
         # ID 추출: /news/202512081501180804
         article_id = 0
@@ -39,9 +39,8 @@ class FnScraper(BaseWebScraper):
         date_elem = item.select_one('span.caption')
         date_str = ''
         if date_elem:
-            date_text = date_elem.get_text(strip=True)  # "2025-12-08 15:01:05"
-            # 이미 표준 형식이므로 그대로 사용
-            date_str = date_text
+            # "2025-12-08 15:01:05" (Article 생성 시 date_parser로 해석)
+            date_str = date_elem.get_text(strip=True)
         
         return Article(
             id=article_id,
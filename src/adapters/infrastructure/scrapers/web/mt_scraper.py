@@ -34,9 +34,8 @@ class MTScraper(BaseWebScraper):
         meta_span = item.select_one('div.meta span')
         date_str = ''
         if meta_span:
-            date_text = meta_span.get_text(strip=True)  # "2025.12.08 14:30"
-            # "2025.12.08 14:30" -> "2025-12-08 14:30"
-            date_str = self.normalize_date(date_text)
+            # "2025.12.08 14:30" (Article 생성 시 date_parser로 해석)
+            date_str = meta_span.get_text(strip=True)
         
         return Article(
             id=article_id,
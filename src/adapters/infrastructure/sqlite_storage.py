@@ -0,0 +1,204 @@
+import csv
+import glob
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+import logging
+
+from config import StorageConfig
+from domain.model import Article
+from ports.storage_port import StorageRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key      INTEGER PRIMARY KEY,   -- Article.key (중복이면 저장 시 무시)
+    id       INTEGER NOT NULL,
+    title    TEXT NOT NULL,
+    link     TEXT NOT NULL,
+    date     TEXT NOT NULL,
+    keyword  TEXT NOT NULL DEFAULT '',
+    source   TEXT NOT NULL DEFAULT '',
+    saved_at TEXT NOT NULL          -- "YYYY-MM-DD HH:MM:SS"
+);
+CREATE INDEX IF NOT EXISTS idx_articles_date_source_keyword ON articles (date, source, keyword);
+CREATE INDEX IF NOT EXISTS idx_articles_saved_at ON articles (saved_at, key);
+"""
+
+INSERT_SQL = (
+    "INSERT OR IGNORE INTO articles (key, id, title, link, date, keyword, source, saved_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# logs/report_YYYYMMDD.csv
+_CSV_DATE = re.compile(r'report_(\d{4})(\d{2})(\d{2})\.csv$')
+
+
+class SqliteStorage(StorageRepository):
+    """SQLite(WAL) 기사 저장소
+
+    - 한 주기에 발견한 기사를 트랜잭션 하나로 일괄 저장 (save_articles)
+    - Article.key가 기본 키라 이미 저장된 기사는 INSERT 단계에서 걸러짐
+    - 오늘 저장한 키는 (saved_at, key) 인덱스 범위 조회 한 번 (파일 전체 재파싱 없음)
+    - WAL 모드라 저장 중에도 다른 연결의 읽기가 막히지 않음
+    """
+
+    def __init__(
+        self,
+        db_path: str = StorageConfig.DB_PATH,
+        csv_dir: Optional[str] = StorageConfig.CSV_DIR if StorageConfig.IMPORT_CSV_ON_CREATE else None
+    ):
+        """
+        Args:
+            db_path: DB 파일 경로 (":memory:" 가능)
+            csv_dir: DB를 새로 만들 때 가져올 일별 CSV 폴더 (None이면 가져오지 않음)
+        """
+        self.db_path = db_path
+        created = db_path == ":memory:" or not os.path.exists(db_path)
+        base_dir = os.path.dirname(db_path)
+        if base_dir:
+            os.makedirs(base_dir, exist_ok=True)
+
+        # 모니터 스레드(asyncio.to_thread)와 이벤트 루프에서 함께 쓰므로 lock으로 직렬화
+        # close()도 같은 lock 안에서 하고, 닫힌 뒤의 저장/조회는 하지 않음 (종료 중 저장 스레드와 경합)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋마다 fsync하지 않아도 안전
+        self._conn.executescript(SCHEMA)
+
+        if created and csv_dir:
+            self.import_csv_dir(csv_dir)
+
+    def flush(self) -> None:
+        """저장할 때마다 커밋하므로 남은 기록이 없음"""
+        pass
+
+    def close(self) -> None:
+        """DB 연결 종료 (진행 중인 저장이 끝난 뒤 닫힘, 이후 저장은 무시)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._conn.close()
+
+    def load_today_keys(self) -> Set[int]:
+        """오늘 저장된 기사 고유 키 로드 (인덱스 범위 조회)"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        try:
+            with self._lock:
+                if self._closed:
+                    return set()
+                rows = self._conn.execute(
+                    "SELECT key FROM articles WHERE saved_at >= ?", (today,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"DB 로드 오류: {e}")
+            return set()
+        return {row[0] for row in rows}
+
+    def save_article(self, article: Article) -> None:
+        self.save_articles([article])
+
+    def save_articles(self, articles: Iterable[Article]) -> int:
+        """기사 일괄 저장 (트랜잭션 하나, 이미 있는 키는 무시)
+
+        Args:
+            articles: 저장할 기사 목록
+
+        Returns:
+            새로 저장된 기사 수
+        """
+        saved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [self._to_row(article, saved_at) for article in articles]
+        if not rows:
+            return 0
+        return self._insert(rows)
+
+    def import_csv_dir(self, csv_dir: str = StorageConfig.CSV_DIR) -> int:
+        """기존 일별 CSV(report_YYYYMMDD.csv)를 모두 가져옴 (여러 번 실행해도 중복 없음)
+
+        Args:
+            csv_dir: CSV 폴더
+
+        Returns:
+            새로 저장된 기사 수
+        """
+        paths = sorted(glob.glob(os.path.join(csv_dir, "report_*.csv")))
+        total = sum(self.import_csv(path) for path in paths)
+        if paths:
+            logger.info(f"CSV 가져오기 완료: 파일 {len(paths)}개, 기사 {total}건")
+        return total
+
+    def import_csv(self, path: str) -> int:
+        """CsvStorage 형식 CSV 파일 하나를 가져옴
+
+        열: ID, Title, Link, Date, Keyword, SavedAt[, Source[, Key]]
+        Key 열이 없는 이전 형식은 링크(와 출처)로 키를 다시 계산한다.
+
+        Args:
+            path: CSV 파일 경로
+
+        Returns:
+            새로 저장된 기사 수
+        """
+        match = _CSV_DATE.search(os.path.basename(path))
+        file_date = "-".join(match.groups()) if match else ""
+
+        rows: List[tuple] = []
+        try:
+            with open(path, mode='r', encoding='utf-8', newline='') as f:
+                for row in csv.reader(f):
+                    if len(row) < 5 or not row[0].lstrip('-').isdigit():
+                        continue
+                    saved_at = row[5] if len(row) > 5 and row[5] else f"{file_date} 00:00:00"
+                    source = row[6] if len(row) > 6 else ""
+                    key = int(row[7]) if len(row) > 7 and row[7].lstrip('-').isdigit() else 0
+                    article = Article(
+                        id=int(row[0]),
+                        title=row[1],
+                        link=row[2],
+                        date=row[3],
+                        keyword=row[4],
+                        source=source,
+                        key=key,
+                    )
+                    rows.append(self._to_row(article, saved_at))
+        except Exception as e:
+            logger.error(f"CSV 가져오기 오류 ({path}): {e}")
+            return 0
+
+        return self._insert(rows) if rows else 0
+
+    def _insert(self, rows: List[tuple]) -> int:
+        """행 목록을 트랜잭션 하나로 INSERT OR IGNORE"""
+        try:
+            with self._lock:
+                if self._closed:
+                    logger.warning(f"DB가 닫힌 뒤의 저장 요청 무시: {len(rows)}건")
+                    return 0
+                before = self._conn.total_changes
+                with self._conn:
+                    self._conn.executemany(INSERT_SQL, rows)
+                return self._conn.total_changes - before
+        except sqlite3.Error as e:
+            logger.error(f"DB 저장 오류: {e}")
+            return 0
+
+    @staticmethod
+    def _to_row(article: Article, saved_at: str) -> tuple:
+        return (
+            article.key,
+            article.id,
+            article.title,
+            article.link,
+            article.date,
+            article.keyword,
+            article.source,
+            saved_at,
+        )
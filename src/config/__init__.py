@@ -1,4 +1,4 @@
 from .logging_config import setup_logging, get_logger
-from .config import Config, DartConfig
+from .config import Config, DartConfig, HttpConfig, ParseConfig, HtmlConfig, SchedulerConfig, RssConfig, KeywordConfig, StorageConfig, SeenConfig, TimelineConfig
 
-__all__ = ['setup_logging', 'get_logger', 'Config', 'DartConfig']
+__all__ = ['setup_logging', 'get_logger', 'Config', 'DartConfig', 'HttpConfig', 'ParseConfig', 'HtmlConfig', 'SchedulerConfig', 'RssConfig', 'KeywordConfig', 'StorageConfig', 'SeenConfig', 'TimelineConfig']
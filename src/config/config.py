@@ -13,3 +13,117 @@ class DartConfig:
     # 모니터링할 카테고리 (빈 문자열이면 전체, 특정 카테고리면 필터링)
     # 옵션: "유가", "코스닥", "코넥스", "기타" 또는 ""
     CATEGORY_FILTER = ""  # 전체 모니터링 (알림 폭주 주의!)
+
+
+class HttpConfig:
+    """공유 HTTP 클라이언트 설정"""
+    TIMEOUT = 20  # seconds
+    MAX_CONNECTIONS = 50
+    MAX_CONNECTIONS_PER_HOST = 4  # 동일 호스트 동시 요청 수 제한
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 120  # seconds (폴링 간격보다 길게 유지)
+    HTTP2 = True  # h2 패키지가 없으면 HTTP/1.1로 동작
+
+
+class ParseConfig:
+    """파싱 실행기 설정 (HTML/XML 파싱을 이벤트 루프 밖에서 실행)"""
+    MAX_WORKERS = 4       # 스레드 풀 크기 (0이면 이벤트 루프에서 직접 파싱)
+    PROCESS_WORKERS = 0   # BeautifulSoup 위주 소스용 프로세스 풀 크기 (0이면 스레드 풀 사용)
+
+
+class HtmlConfig:
+    """웹 스크래퍼 HTML 파싱 설정"""
+    PARSER = "lxml"  # BeautifulSoup 파서 ("lxml" 또는 "html.parser")
+    PARTIAL = True   # 뉴스 목록 영역만 파싱 (SoupStrainer)
+
+
+class SchedulerConfig:
+    """소스별 적응형 폴링 스케줄러 설정 (단위: 초)"""
+    MIN_INTERVAL = 15
+    MAX_INTERVAL = 300        # 유휴 소스만 이 간격까지 늘림
+    QUIET_MAX_INTERVAL = Config.CHECK_INTERVAL  # 새 항목이 없을 때 늘리는 간격의 상한
+    IDLE_AFTER = 30 * 60      # 이 시간 동안 새 항목이 없으면 유휴 소스
+    INITIAL_INTERVAL = Config.CHECK_INTERVAL
+    TIGHTEN_FACTOR = 0.5      # 새 항목이 있으면 간격을 이 비율로 줄임
+    BACKOFF_FACTOR = 1.5      # 새 항목이 없으면 간격을 이 비율로 늘림
+    CADENCE_FRACTION = 0.5    # 관측된 평균 발행 간격의 이 비율 이내로 폴링
+    SMOOTHING = 0.3           # 발행 간격 지수이동평균 가중치
+
+    # 소스별 집중 시간대 ("HH:MM", "HH:MM") - 이 시간에는 BURST_MAX_INTERVAL 이하로 폴링
+    BURST_WINDOWS = {
+        "DART": [("15:00", "18:30")],  # 장 마감 전후 공시 집중
+    }
+    BURST_MAX_INTERVAL = 30
+
+
+class RssConfig:
+    """RSS 소스 설정"""
+    # 추가 RSS 소스 정의 파일 (없으면 기본 소스만 사용)
+    # 형식: [{"name": "...", "url": "...", "id_field": "link", "id_pattern": "/view/(\\d+)"}, ...]
+    EXTRA_SOURCES_FILE = "config/rss_sources.json"
+
+    # 증분 파싱: 이미 본 항목이 연속으로 이 개수만큼 나오면 피드 읽기를 중단
+    # (수정되어 위로 올라온 기존 기사 하나 때문에 멈추지 않도록 1보다 크게)
+    INCREMENTAL_KNOWN_STREAK = 2
+    # 증분 파싱 중 앞 항목보다 이만큼(초) 넘게 새로운 항목이 나오면 최신순이 아닌 피드로 보고 전체 파싱으로 전환
+    INCREMENTAL_ORDER_TOLERANCE = 60
+    INCREMENTAL_ORDER_CHECK_EVERY = 20  # 이 폴링 수마다 한 번은 중단 없이 끝까지 읽으며 순서 확인
+    WATERMARK_SIZE = 1000  # 소스별로 기억할 항목 키 수
+
+
+class KeywordConfig:
+    """감시 항목 매칭 설정"""
+    # 별칭 그룹 파일 (없으면 별칭 없음) - 그룹 안의 어느 표기로 등록해도 모든 표기가 매칭됨
+    # 형식: [["삼성전자", "삼전"], ["SK하이닉스", "하이닉스", "하닉"], ...]
+    ALIASES_FILE = "config/aliases.json"
+
+    # 이 접두어로 시작하는 항목만 쿼리 문법(AND/OR/NOT, 따옴표, 괄호, =단어, /정규식/)으로 해석
+    # 나머지는 괄호/따옴표/-/| 등이 있어도 전체를 하나의 문구로 검색 (예: "삼성전자(우)")
+    # 예: "q:삼성 AND 반도체", "q:삼성전자 -우선주"
+    QUERY_PREFIX = "q:"
+
+    # [단독], 【속보】, <포토> 같은 말머리는 매칭에서 제외
+    # 아래 목록에 있는 말머리만 제거 ([삼성전자], <LG엔솔>처럼 괄호 안의 회사명/종목명은 매칭 대상)
+    STRIP_BRACKET_TAGS = True
+    BRACKET_TAGS = (
+        "단독", "속보", "긴급", "종합", "1보", "2보", "3보",
+        "포토", "사진", "영상", "그래픽", "인터뷰", "사설", "칼럼", "기고",
+    )
+
+    # 상장 회사 마스터 (없으면 종목명은 입력한 문자열 그대로 검색)
+    # 형식: ticker,name,corp_code,former_names (former_names는 '|'로 구분)
+    # KRX KIND 상장법인목록(회사명, 종목코드) 형식도 읽을 수 있음
+    COMPANY_MASTER_FILE = "config/krx_companies.csv"
+    # KRX/DART에서 내려받은 목록을 이 경로에 두면 시작할 때 마스터로 가져옴
+    # (마스터보다 새 파일일 때만, 회사명이 바뀐 종목은 이전 회사명을 유지)
+    COMPANY_IMPORT_FILE = "config/krx_download.csv"
+
+
+class StorageConfig:
+    """수집 기사 저장소 설정"""
+    BACKEND = "sqlite"  # "sqlite" 또는 "csv" (일별 logs/report_YYYYMMDD.csv)
+    DB_PATH = "logs/articles.db"
+    CSV_DIR = "logs"
+    # DB를 처음 만들 때 CSV_DIR의 기존 일별 CSV를 한 번 가져옴
+    IMPORT_CSV_ON_CREATE = True
+
+    # CSV 저장: 행을 모아 두었다가 이 개수 또는 시간이 지나면 한 번에 기록 (주기 끝에는 항상 기록)
+    CSV_FLUSH_ROWS = 100
+    CSV_FLUSH_INTERVAL = 1.0  # seconds
+
+
+class SeenConfig:
+    """이미 본 기사 집합 설정 (하루 하나의 Bloom filter, 여러 날 보관)"""
+    DAYS = 7                    # 보관 일수 (오늘 포함) - 며칠 뒤 피드에 다시 올라와도 알리지 않음
+    CAPACITY_PER_DAY = 20000    # 하루 예상 기사 수 (넘으면 오탐률 상승)
+    ERROR_RATE = 1e-6           # 하루 filter 오탐률 (오탐된 새 기사는 알림이 생략됨)
+    DIRECTORY = "logs/seen"     # mmap filter 파일 폴더 (None이면 메모리에만)
+
+
+class TimelineConfig:
+    """화면 기사 목록 설정"""
+    MAX_ITEMS = 5000                        # 최대 표시 기사 수 (0이면 제한 없음)
+    EVICTION = "oldest"                     # 초과 시 제거: "oldest"(가장 오래된 기사) 또는 "tail"(맨 아래 행)
+    PRIORITY_HOSTS = ("dart.fss.or.kr",)    # 링크에 이 호스트가 있으면 목록 위쪽에 표시 (DART 우선)
+    CHUNK_SIZE = 256
+    RECENT_SECONDS = 300                    # 이 시간 이내 기사는 강조 표시
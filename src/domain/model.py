@@ -1,11 +1,145 @@
-from dataclasses import dataclass
+import hashlib
+import sys
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Optional
+
+from domain.services.date_parser import format_kst, parse_date
+from domain.services.url_canonicalizer import default_canonicalizer
+
+
+def stable_hash(text: str, bits: int = 31) -> int:
+    """프로세스와 무관하게 항상 같은 양수 해시 (내장 hash()는 실행마다 달라짐)
+
+    Args:
+        text: 해시할 문자열
+        bits: 결과 비트 수 (기본 31: 기존 ID 범위)
+
+    Returns:
+        0 이상 2**bits 미만의 정수
+    """
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') & ((1 << bits) - 1)
+
+
+def article_key(source: str, link: str) -> int:
+    """기사 고유 키: 정규화한 URL(UrlCanonicalizer)의 64비트 지문
+
+    재시작해도 같은 값이다. URL이면 호스트가 네임스페이스가 되어 http/https, 모바일 주소,
+    추적 파라미터가 달라도, 다른 피드로 들어와도 같은 키가 된다.
+    URL이 아닌 식별자(GUID 등)는 출처 이름으로 구분한다.
+    SQLite INTEGER에 그대로 들어가도록 부호 있는 64비트 정수로 반환한다.
+
+    Args:
+        source: 뉴스 출처 이름
+        link: 기사 링크 (절대 URL)
+
+    Returns:
+        부호 있는 64비트 정수
+    """
+    canonical = default_canonicalizer.canonicalize(link)
+    identity = canonical if '://' in link else f"{source}\x1f{canonical}"
+    data = identity.encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big', signed=True)
+
 
-@dataclass(frozen=True)
 class Article:
-    """뉴스 기사 정보를 담는 불변 객체"""
-    id: int
-    title: str
-    link: str
-    date: str
-    keyword: str = ""
-    source: str = ""  # 뉴스 출처 (예: "이데일리", "연합뉴스")
+    """뉴스 기사 정보를 담는 불변 객체 (__slots__)
+
+    key는 link(와 source)로 자동 계산되는 고유 키로, 중복 제거와 저장에 사용한다.
+    id는 언론사가 부여한 기사 번호 (출처마다 체계가 달라 중복 판단에 쓰지 않음).
+
+    날짜는 생성할 때 한 번 해석하여(date_parser) epoch 초(ts)로 보관하고,
+    표시용 문자열(date)은 처음 읽을 때 "YYYY-MM-DD HH:MM"으로 만든다.
+    해석할 수 없는 날짜는 ts=0으로 두고 원래 문자열을 그대로 보여준다.
+    source/keyword는 기사마다 같은 값이 반복되므로 intern하여 공유한다.
+    """
+    __slots__ = ('id', 'title', 'link', 'keyword', 'source', 'key', 'ts', '_date')
+
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        link: str,
+        date: str = "",
+        keyword: str = "",
+        source: str = "",  # 뉴스 출처 (예: "이데일리", "연합뉴스")
+        key: int = 0,      # article_key(source, link), 0이면 생성 시 계산
+        ts: Optional[int] = None  # epoch 초, None이면 date에서 계산
+    ):
+        if ts is None:
+            ts = parse_date(date, source) if date else 0
+        init = object.__setattr__
+        init(self, 'id', id)
+        init(self, 'title', title)
+        init(self, 'link', link)
+        init(self, 'keyword', sys.intern(keyword) if keyword else "")
+        init(self, 'source', sys.intern(source) if source else "")
+        init(self, 'key', key or article_key(source, link))
+        init(self, 'ts', ts)
+        init(self, '_date', None if ts else date)
+
+    @property
+    def date(self) -> str:
+        """표시용 날짜 ("YYYY-MM-DD HH:MM", 처음 읽을 때 만들어 보관)"""
+        if self._date is None:
+            object.__setattr__(self, '_date', format_kst(self.ts))
+        return self._date
+
+    def replace(self, **changes) -> "Article":
+        """일부 필드만 바꾼 새 기사 (link/source가 바뀌면 key도 다시 계산)"""
+        fields = {
+            'id': self.id,
+            'title': self.title,
+            'link': self.link,
+            'keyword': self.keyword,
+            'source': self.source,
+        }
+        if 'date' not in changes:
+            fields['date'] = "" if self.ts else self._date
+            fields['ts'] = self.ts
+        if 'key' not in changes and 'link' not in changes and 'source' not in changes:
+            fields['key'] = self.key
+        fields.update(changes)
+        return Article(**fields)
+
+    def _values(self) -> tuple:
+        return (self.id, self.title, self.link, self.date, self.keyword, self.source, self.key)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not Article:
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        # 프로세스 풀에서 돌려받을 때 (__setattr__을 거치지 않고 __init__으로 복원)
+        raw_date = "" if self.ts else self._date
+        return (Article, (self.id, self.title, self.link, raw_date, self.keyword, self.source, self.key, self.ts))
+
+    def __repr__(self) -> str:
+        return (
+            f"Article(id={self.id!r}, title={self.title!r}, link={self.link!r}, date={self.date!r}, "
+            f"keyword={self.keyword!r}, source={self.source!r}, key={self.key!r})"
+        )
+
+
+@dataclass(frozen=True)
+class ListedCompany:
+    """상장 회사 정보 (KRX 종목 마스터)"""
+    ticker: str                     # 6자리 종목코드 (예: "005930")
+    name: str                       # 현재 회사명
+    corp_code: str = ""             # DART 고유번호 (8자리)
+    former_names: tuple = ()        # 이전 회사명 (사명 변경 전 표기)
+
+    @property
+    def names(self) -> tuple:
+        """현재 회사명과 이전 회사명"""
+        return (self.name,) + tuple(self.former_names)
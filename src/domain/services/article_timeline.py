@@ -0,0 +1,203 @@
+import time
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+import logging
+
+from config import TimelineConfig
+from domain.model import Article
+
+logger = logging.getLogger(__name__)
+
+# 정렬 키: (-타임스탬프, 추가 순번) - 최신이 앞, 같은 시각이면 먼저 들어온 기사가 앞
+SortKey = Tuple[int, int]
+
+
+def host_priority(hosts: Tuple[str, ...] = TimelineConfig.PRIORITY_HOSTS) -> Callable[[Article], int]:
+    """링크에 hosts 중 하나가 들어 있으면 1 (위에 표시), 아니면 0"""
+    def priority(article: Article) -> int:
+        return 1 if any(host in article.link for host in hosts) else 0
+    return priority
+
+
+class _SortedChunks:
+    """정렬 키 순으로 유지되는 청크 리스트 (삽입은 이분 탐색 두 번 + 청크 하나 안의 이동)"""
+
+    def __init__(self, chunk_size: int):
+        self._chunk_size = chunk_size
+        self._keys: List[List[SortKey]] = []
+        self._items: List[List[Article]] = []
+        self._maxes: List[SortKey] = []   # 청크별 마지막 키
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Article]:
+        for chunk in self._items:
+            yield from chunk
+
+    def insert(self, key: SortKey, item: Article) -> None:
+        self._len += 1
+        if not self._maxes:
+            self._keys.append([key])
+            self._items.append([item])
+            self._maxes.append(key)
+            return
+
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            i -= 1  # 가장 큰 키: 마지막 청크 끝
+        keys, items = self._keys[i], self._items[i]
+        j = bisect_right(keys, key)
+        keys.insert(j, key)
+        items.insert(j, item)
+        self._maxes[i] = keys[-1]
+
+        if len(keys) > self._chunk_size * 2:
+            half = self._chunk_size
+            self._keys[i:i + 1] = [keys[:half], keys[half:]]
+            self._items[i:i + 1] = [items[:half], items[half:]]
+            self._maxes[i:i + 1] = [keys[half - 1], keys[-1]]
+
+    def last_key(self) -> Optional[SortKey]:
+        return self._maxes[-1] if self._maxes else None
+
+    def pop_last(self) -> Article:
+        self._len -= 1
+        self._keys[-1].pop()
+        item = self._items[-1].pop()
+        if self._keys[-1]:
+            self._maxes[-1] = self._keys[-1][-1]
+        else:
+            del self._keys[-1], self._items[-1], self._maxes[-1]
+        return item
+
+    def iter_keyed(self) -> Iterator[Tuple[SortKey, Article]]:
+        for keys, items in zip(self._keys, self._items):
+            yield from zip(keys, items)
+
+    def islice(self, start: int, stop: int) -> Iterator[Article]:
+        """start~stop 구간 (앞의 청크는 길이만 보고 건너뜀)"""
+        for chunk in self._items:
+            if start >= len(chunk):
+                start -= len(chunk)
+                stop -= len(chunk)
+                continue
+            if stop <= 0:
+                return
+            yield from islice(chunk, start, min(stop, len(chunk)))
+            stop -= len(chunk)
+            start = 0
+
+
+class ArticleTimeline:
+    """화면 표시 순서로 유지되는 기사 목록 (우선순위 높은 출처 먼저, 그 안에서 최신순)
+
+    - 정렬 키(우선순위, Article.ts)는 추가할 때 한 번만 계산
+    - 우선순위마다 정렬된 청크 리스트를 두어 추가는 O(log n) 탐색 + 청크 하나 안의 이동
+      (매 주기 전체 목록을 두 번 정렬하지 않음)
+    - 최대 개수를 넘으면 eviction 정책에 따라 하나씩 제거
+      "oldest": 우선순위와 관계없이 가장 오래된 기사, "tail": 화면 맨 아래 기사
+    - 읽기는 이터레이터/구간(slice)으로 복사 없이
+    """
+
+    def __init__(
+        self,
+        max_items: int = TimelineConfig.MAX_ITEMS,
+        eviction: str = TimelineConfig.EVICTION,
+        priority: Optional[Callable[[Article], int]] = None,
+        chunk_size: int = TimelineConfig.CHUNK_SIZE
+    ):
+        """
+        Args:
+            max_items: 최대 보관 기사 수 (0이면 제한 없음)
+            eviction: 초과 시 제거 정책 ("oldest" 또는 "tail")
+            priority: 기사 → 우선순위 (클수록 위, 기본: TimelineConfig.PRIORITY_HOSTS 링크 우선)
+            chunk_size: 청크 기본 크기
+        """
+        if eviction not in ("oldest", "tail"):
+            raise ValueError(f"알 수 없는 eviction 정책: {eviction}")
+        self.max_items = max_items
+        self.eviction = eviction
+        self._priority = priority or host_priority()
+        self._chunk_size = chunk_size
+        self._groups: Dict[int, _SortedChunks] = {}
+        self._order: List[int] = []   # 표시 순서의 우선순위 (내림차순)
+        self._seq = 0
+        self.version = 0              # 내용이 바뀔 때마다 증가 (화면 갱신 판단용)
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self._groups.values())
+
+    def __iter__(self) -> Iterator[Article]:
+        """표시 순서로 순회"""
+        for priority in self._order:
+            yield from self._groups[priority]
+
+    def add(self, article: Article) -> List[Article]:
+        """기사 추가
+
+        Returns:
+            최대 개수를 넘어 제거된 기사 목록
+        """
+        priority = self._priority(article)
+        group = self._groups.get(priority)
+        if group is None:
+            group = self._groups[priority] = _SortedChunks(self._chunk_size)
+            insort(self._order, priority, key=lambda value: -value)
+
+        self._seq += 1
+        group.insert((-article.ts, self._seq), article)
+        self.version += 1
+
+        evicted = []
+        while self.max_items and len(self) > self.max_items:
+            evicted.append(self._evict())
+        return evicted
+
+    def slice(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Article]:
+        """표시 순서 start~stop 구간 (화면에 보이는 범위만 읽을 때)"""
+        if stop is None:
+            stop = len(self)
+        for priority in self._order:
+            group = self._groups[priority]
+            if start < len(group) and stop > 0:
+                yield from group.islice(start, stop)
+            start = max(0, start - len(group))
+            stop -= len(group)
+            if stop <= 0:
+                return
+
+    def recent(self, seconds: float, now: Optional[float] = None) -> Set[str]:
+        """최근 seconds초 이내 기사 링크 (그룹마다 최신순이라 오래된 기사가 나오면 중단)"""
+        cutoff = (now if now is not None else time.time()) - seconds
+        links = set()
+        for group in self._groups.values():
+            for (negative_ts, _), article in group.iter_keyed():
+                if -negative_ts < cutoff:
+                    break
+                links.add(article.link)
+        return links
+
+    def clear(self) -> None:
+        self._groups.clear()
+        self._order.clear()
+        self.version += 1
+
+    def _evict(self) -> Article:
+        """정책에 따라 기사 하나 제거"""
+        if self.eviction == "tail":
+            priority = next(p for p in reversed(self._order) if len(self._groups[p]))
+        else:
+            # 그룹마다 마지막이 가장 오래된 기사: 키(-ts, seq)가 가장 큰 그룹
+            priority = max(
+                (p for p in self._order if len(self._groups[p])),
+                key=lambda p: self._groups[p].last_key()
+            )
+        article = self._groups[priority].pop_last()
+        if not len(self._groups[priority]):
+            del self._groups[priority]
+            self._order.remove(priority)
+        logger.debug(f"타임라인 최대 개수 초과로 제거: {article.title[:30]}")
+        return article
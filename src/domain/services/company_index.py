@@ -0,0 +1,99 @@
+import re
+from typing import Dict, Iterable, Optional
+import logging
+
+from domain.model import ListedCompany
+from domain.services.keyword_query import KeywordQuery
+from domain.services.title_normalizer import TitleNormalizer
+
+logger = logging.getLogger(__name__)
+
+# 종목코드: 6자리 (KRX 신규 코드는 영문 포함, 앞의 'A'는 KRX 표기)
+_TICKER = re.compile(r'^A?([0-9][0-9A-Z]{5})$')
+
+# 회사명 조회 시 무시할 법인 표기
+_CORP_MARKERS = re.compile(r'\(주\)|㈜|주식회사')
+
+
+class CompanyIndex:
+    """상장 회사 마스터 색인 (종목코드 / 회사명 → 회사)
+
+    - 종목코드, 정규화한 회사명(이전 회사명 포함)은 해시 색인: 조회는 입력 길이에 비례
+    - 감시 목록의 종목 항목(회사명 또는 종목코드)을 현재/이전 회사명 OR 쿼리로 바꿔준다
+      (DART 공시는 제출인 필드도 매칭하므로 같은 쿼리로 회사명이 바뀐 종목의 공시도 찾는다)
+    """
+
+    def __init__(self, companies: Iterable[ListedCompany] = (), normalizer: Optional[TitleNormalizer] = None):
+        """
+        Args:
+            companies: 상장 회사 목록
+            normalizer: 회사명 정규화기 (없으면 기본 정규화)
+        """
+        self.normalizer = normalizer or TitleNormalizer()
+        self._by_ticker: Dict[str, ListedCompany] = {}
+        self._by_name: Dict[str, ListedCompany] = {}
+        for company in companies:
+            self.add(company)
+
+    def __len__(self) -> int:
+        return len(self._by_ticker)
+
+    def add(self, company: ListedCompany) -> None:
+        """회사 추가 (같은 종목코드면 대체, 회사명이 겹치면 현재 회사명이 우선)"""
+        self._by_ticker[company.ticker] = company
+        for name in reversed(company.names):
+            key = self._name_key(name)
+            if key:
+                self._by_name[key] = company
+
+    @staticmethod
+    def normalize_ticker(text: str, pad: bool = False) -> str:
+        """종목코드 표기 정규화 ("A005930" → "005930", 종목코드가 아니면 빈 문자열)
+
+        감시 항목은 6자리(앞에 A 가능)만 종목코드로 본다 ("20"은 숫자 키워드).
+
+        Args:
+            text: 종목코드 표기
+            pad: 6자리보다 짧은 숫자를 앞에 0을 채워 종목코드로 볼지
+                 (엑셀을 거친 상장법인목록의 "5930" 같은 열 값에만 사용)
+        """
+        text = text.strip().upper()
+        if pad and text.isdigit() and len(text) < 6:
+            text = text.zfill(6)
+        match = _TICKER.match(text)
+        return match.group(1) if match else ""
+
+    def get(self, ticker: str) -> Optional[ListedCompany]:
+        """종목코드로 조회"""
+        return self._by_ticker.get(self.normalize_ticker(ticker))
+
+    def resolve(self, term: str) -> Optional[ListedCompany]:
+        """종목코드 또는 회사명(이전 회사명, 띄어쓰기/법인 표기 차이 무시)으로 조회
+
+        Args:
+            term: 감시 항목 (회사명 또는 종목코드)
+
+        Returns:
+            ListedCompany, 없으면 None
+        """
+        ticker = self.normalize_ticker(term)
+        if ticker and ticker in self._by_ticker:
+            return self._by_ticker[ticker]
+        return self._by_name.get(self._name_key(term))
+
+    def query_for(self, term: str) -> Optional[KeywordQuery]:
+        """감시 항목이 상장 회사면 현재/이전 회사명 중 하나라도 포함되면 일치하는 쿼리
+
+        Args:
+            term: 감시 항목 (회사명 또는 종목코드)
+
+        Returns:
+            KeywordQuery, 상장 회사가 아니면 None
+        """
+        company = self.resolve(term)
+        if company is None:
+            return None
+        return KeywordQuery.any_of(term, company.names, search_text=company.name)
+
+    def _name_key(self, name: str) -> str:
+        return self.normalizer.pattern(_CORP_MARKERS.sub('', name))
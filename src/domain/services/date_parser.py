@@ -0,0 +1,192 @@
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 기사 시각은 모두 한국 표준시 기준 (실행 환경의 시간대와 무관)
+KST = timezone(timedelta(hours=9), "KST")
+KST_OFFSET = 9 * 3600
+DAY = 24 * 3600
+
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1
+    )
+}
+
+# 시간대 약어 → UTC 기준 초 (표기가 없으면 KST)
+_ZONES = {'GMT': 0, 'UTC': 0, 'UT': 0, 'Z': 0, 'KST': KST_OFFSET}
+
+# "Tue, 09 Dec 2025 14:25:17 +0900" / "09 Dec 2025 05:25:17 GMT" (RSS pubDate, RFC 822)
+_RFC822 = re.compile(
+    r'(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{4})\s+'
+    r'(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([+-]\d{2}:?\d{2}|[A-Za-z]{1,4})?'
+)
+
+# "2025-12-08 15:01:05", "2025.12.08 14:30", "2025-12-08T14:30:00+09:00", "2025/12/08", "기자 | 2025.12.08 14:30"
+_NUMERIC = re.compile(
+    r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})\.?'
+    r'(?:[ T]+(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\.\d+)?)?\s*(Z|[+-]\d{2}:?\d{2})?'
+)
+
+# 파싱 결과: (연, 월, 일, 시, 분, 초, UTC 기준 초) - 실패하면 None
+Fields = Tuple[int, int, int, int, int, int, int]
+
+
+def _zone_offset(zone: Optional[str]) -> Optional[int]:
+    """"+0900", "+09:00", "GMT", "KST" → UTC 기준 초 (없으면 KST, 모르는 약어면 None)"""
+    if not zone:
+        return KST_OFFSET
+    if zone[0] in '+-':
+        digits = zone[1:].replace(':', '')
+        seconds = int(digits[:2]) * 3600 + int(digits[2:4]) * 60
+        return -seconds if zone[0] == '-' else seconds
+    return _ZONES.get(zone.upper())
+
+
+def _parse_rfc822(text: str) -> Optional[Fields]:
+    match = _RFC822.search(text)
+    if not match:
+        return None
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = _MONTHS.get(month_name[:3].lower())
+    offset = _zone_offset(zone)
+    if month is None or offset is None:
+        return None
+    return int(year), month, int(day), int(hour), int(minute), int(second or 0), offset
+
+
+def _parse_numeric(text: str) -> Optional[Fields]:
+    match = _NUMERIC.search(text)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, zone = match.groups()
+    return (
+        int(year), int(month), int(day),
+        int(hour or 0), int(minute or 0), int(second or 0),
+        _zone_offset(zone),
+    )
+
+
+# 자동 감지 순서 (숫자 형식이 더 흔함)
+PARSERS: Tuple[Tuple[str, Callable[[str], Optional[Fields]]], ...] = (
+    ('numeric', _parse_numeric),
+    ('rfc822', _parse_rfc822),
+)
+
+
+def _epoch(fields: Fields) -> int:
+    """(연, 월, 일, 시, 분, 초, UTC 기준 초) → epoch 초 (datetime 객체 생성 없이 계산)"""
+    year, month, day, hour, minute, second, offset = fields
+    if not (1 <= month <= 12 and 1 <= day <= 31 and hour < 24 and minute < 60 and second < 61):
+        raise ValueError(f"잘못된 날짜 값: {fields}")
+    # 그레고리력 날짜 → 1970-01-01 기준 일수 (days_from_civil)
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    days = era * 146097 + doe - 719468
+    return days * DAY + hour * 3600 + minute * 60 + second - offset
+
+
+class DateParser:
+    """기사 날짜 파서 (모든 스크래퍼 공용)
+
+    - 알려진 형식(RSS pubDate, "YYYY-MM-DD HH:MM[:SS]", "YYYY.MM.DD HH:MM", ISO 8601)은
+      정규식 한 번 + 정수 계산으로 해석 (strptime/datetime 생성 없음)
+    - 소스마다 처음 성공한 형식을 기억하여 다음부터 그 형식부터 시도
+    - 문자열의 시간대(+0900, GMT 등)를 반영하고, 표기가 없으면 KST로 본다
+    - 알려진 형식이 모두 실패하면 소스가 지정한 strptime 형식을 시도
+    - 결과는 epoch 초 (실패하면 0 - 날짜를 모르는 기사로 취급)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._detected: Dict[str, Callable[[str], Optional[Fields]]] = {}
+        self._warned: set = set()
+
+    def parse(self, text: str, source: str = "", formats: Iterable[str] = ()) -> int:
+        """날짜 문자열 → epoch 초
+
+        Args:
+            text: 날짜 문자열
+            source: 소스 이름 (형식 감지 결과 캐시 키)
+            formats: 알려진 형식이 모두 실패할 때 시도할 strptime 형식
+
+        Returns:
+            epoch 초 (해석할 수 없으면 0)
+        """
+        if not text:
+            return 0
+
+        parser = self._detected.get(source)
+        if parser is not None:
+            ts = self._apply(parser, text)
+            if ts:
+                return ts
+
+        for name, candidate in PARSERS:
+            if candidate is parser:
+                continue
+            ts = self._apply(candidate, text)
+            if ts:
+                if source:
+                    with self._lock:
+                        self._detected[source] = candidate
+                    logger.debug(f"날짜 형식 감지: {source} → {name}")
+                return ts
+
+        for date_format in formats:
+            ts = self._parse_strptime(text, date_format)
+            if ts:
+                return ts
+
+        if source not in self._warned:
+            self._warned.add(source)
+            logger.warning(f"날짜 변환 오류 ({source or '알 수 없는 소스'}): '{text}'")
+        return 0
+
+    @staticmethod
+    def _apply(parser: Callable[[str], Optional[Fields]], text: str) -> int:
+        fields = parser(text)
+        if fields is None:
+            return 0
+        try:
+            return _epoch(fields)
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _parse_strptime(text: str, date_format: str) -> int:
+        try:
+            parsed = datetime.strptime(text.strip(), date_format)
+        except ValueError:
+            return 0
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=KST)
+        return int(parsed.timestamp())
+
+
+# 공용 인스턴스 (소스별 형식 감지 결과를 모든 스크래퍼가 공유)
+default_date_parser = DateParser()
+
+
+def parse_date(text: str, source: str = "", formats: Iterable[str] = ()) -> int:
+    """공용 파서로 날짜 문자열 → epoch 초 (실패하면 0)"""
+    return default_date_parser.parse(text, source, formats)
+
+
+def format_kst(ts: int) -> str:
+    """epoch 초 → KST "YYYY-MM-DD HH:MM" """
+    return datetime.fromtimestamp(ts, KST).strftime("%Y-%m-%d %H:%M")
+
+
+def kst_day_start(ts: Optional[float] = None) -> int:
+    """ts(기본: 현재)가 속한 KST 날짜의 0시 epoch 초"""
+    if ts is None:
+        ts = datetime.now(KST).timestamp()
+    return int((ts + KST_OFFSET) // DAY * DAY - KST_OFFSET)
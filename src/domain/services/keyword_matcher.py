@@ -0,0 +1,270 @@
+import threading
+from collections import Counter, deque
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+from domain.services.keyword_query import Atom, KeywordQuery, compile_query
+from domain.services.title_normalizer import TitleNormalizer
+
+logger = logging.getLogger(__name__)
+
+# 트라이/출력 항목: (atom, 매칭된 표기의 글자 수 - 별칭마다 다름)
+Output = Tuple[Atom, int]
+
+# (전이, 실패 링크, 출력, {atom: 해당 atom을 쓰는 항목}, 항상 평가할 항목, {항목: 쿼리})
+Automaton = Tuple[
+    List[Dict[str, int]],
+    List[int],
+    List[Tuple[Output, ...]],
+    Dict[Atom, Tuple[str, ...]],
+    Tuple[str, ...],
+    Dict[str, KeywordQuery],
+]
+
+
+class KeywordMatcher:
+    """감시 항목(키워드/종목명) 다중 매칭기 (Aho-Corasick 오토마톤 + 쿼리 프로그램)
+
+    제목을 한 번만 정규화(TitleNormalizer)하고 한 번만 훑어서 모든 항목의 리터럴을 찾은 뒤,
+    리터럴이 걸린 항목(과 NOT/정규식 항목)의 쿼리 프로그램만 평가한다.
+    항목 수가 늘어도 item당 비용은 제목 길이와 걸린 항목 수에 비례한다
+    (기존: 키워드마다 `keyword.lower() in title.lower()`).
+
+    - 항목은 keyword_query로 컴파일 ("q:" 접두어 항목만 쿼리 문법, 나머지는 전체가 하나의 문구)
+    - 항목 추가/삭제는 트라이에 바로 반영하고, 실패 링크는 다음 find() 때 한 번 다시 계산
+    - find()는 컴파일된 오토마톤 스냅샷만 읽으므로 파싱 스레드에서 호출해도 안전
+    - 대소문자/전각/띄어쓰기 차이 무시 (공백은 건너뛰며 매칭, 결과는 등록한 원래 항목)
+    - 별칭 그룹의 다른 표기도 같은 리터럴로 매칭 (트라이에 미리 삽입)
+    - 같은 항목을 여러 번 추가하면 그만큼 삭제해야 빠진다 (키워드/종목명 중복)
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str] = (),
+        compiler: Callable[[str], KeywordQuery] = compile_query,
+        normalizer: Optional[TitleNormalizer] = None
+    ):
+        """
+        Args:
+            terms: 초기 감시 항목 목록 (빈 문자열은 무시)
+            compiler: 항목 → 쿼리 컴파일 함수 (KeywordStorage.compile로 캐시 공유 가능)
+            normalizer: 제목/패턴 정규화기 (별칭 포함, 없으면 별칭 없는 기본 정규화)
+        """
+        self._lock = threading.Lock()
+        self._compiler = compiler
+        self.normalizer = normalizer or TitleNormalizer()
+        self._counts: Counter = Counter()
+        self._queries: Dict[str, KeywordQuery] = {}
+        self._atom_counts: Counter = Counter()
+        self._root: dict = {}                       # 트라이: {문자: 자식 노드}, 노드의 '' 키에 출력 집합
+        self._automaton: Automaton = ([{}], [0], [()], {}, (), {})
+        self._dirty = False
+        self.version = 0
+        for term in terms:
+            self.add(term)
+
+    @property
+    def terms(self) -> List[str]:
+        """등록된 감시 항목 목록 (등록 순서)"""
+        with self._lock:
+            return list(self._counts)
+
+    def add(self, term: str) -> None:
+        """감시 항목 추가 (쿼리 컴파일 후 리터럴을 트라이에 삽입)"""
+        if not term:
+            return
+        with self._lock:
+            self._counts[term] += 1
+            if self._counts[term] > 1:
+                return
+            query = self._compiler(term)
+            self._queries[term] = query
+            for atom in query.literals:
+                self._atom_counts[atom] += 1
+                if self._atom_counts[atom] == 1:
+                    self._insert_atom(atom)
+            self._changed()
+
+    def remove(self, term: str) -> None:
+        """감시 항목 삭제 (다른 항목이 쓰지 않는 리터럴은 트라이에서 제거)"""
+        with self._lock:
+            if self._counts.get(term, 0) == 0:
+                return
+            self._counts[term] -= 1
+            if self._counts[term] > 0:
+                return
+            del self._counts[term]
+
+            query = self._queries.pop(term)
+            for atom in query.literals:
+                self._atom_counts[atom] -= 1
+                if self._atom_counts[atom] == 0:
+                    del self._atom_counts[atom]
+                    self._remove_atom(atom)
+            self._changed()
+
+    def sync(self, terms: Iterable[str]) -> None:
+        """감시 항목 목록을 주어진 목록과 같게 맞춤 (바뀐 항목만 추가/삭제)
+
+        Args:
+            terms: 새 감시 항목 목록 (키워드 + 종목명, 중복 가능)
+        """
+        target = Counter(term for term in terms if term)
+        with self._lock:
+            current = Counter(self._counts)
+        for term, count in (current - target).items():
+            for _ in range(count):
+                self.remove(term)
+        for term, count in (target - current).items():
+            for _ in range(count):
+                self.add(term)
+
+    def search_terms(self, term: str) -> Tuple[str, ...]:
+        """사이트 검색(웹 스크래퍼)에 보낼 검색어 목록 (KeywordQuery.search_texts, 문구 항목이면 그대로)"""
+        return self._query(term).search_texts
+
+    def needs_filter(self, term: str) -> bool:
+        """사이트 검색 결과를 제목으로 다시 확인해야 하는 항목인지 (KeywordQuery.needs_filter)"""
+        return self._query(term).needs_filter
+
+    def _query(self, term: str) -> KeywordQuery:
+        with self._lock:
+            query = self._queries.get(term)
+        return query or self._compiler(term)
+
+    def find(self, text: str) -> Set[str]:
+        """텍스트와 일치하는 모든 감시 항목 반환
+
+        Args:
+            text: 검색 대상 (제목 등, 여러 필드는 줄바꿈으로 이어 붙여 전달)
+
+        Returns:
+            일치한 항목 집합 (없으면 빈 집합)
+        """
+        goto, fail, output, by_atom, always, queries = self._compiled()
+        normalized = self.normalizer.normalize(text)
+
+        atom_hits: Set[Atom] = set()
+        state = 0
+        for end, ch in enumerate(normalized):
+            if ch == ' ':
+                continue  # 띄어쓰기 차이 무시 (패턴에는 공백이 없음)
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for atom, length in output[state]:
+                    if atom[1] and not self._at_word_boundary(normalized, end, length):
+                        continue
+                    atom_hits.add(atom)
+
+        if not atom_hits and not always:
+            return set()
+
+        candidates = set(always)
+        for atom in atom_hits:
+            candidates.update(by_atom[atom])
+        return {term for term in candidates if queries[term].matches(atom_hits, normalized)}
+
+    @staticmethod
+    def _at_word_boundary(text: str, end: int, length: int) -> bool:
+        """end에서 끝나는 length글자(공백 제외) 매칭의 앞뒤가 글자/숫자가 아닌지"""
+        start = end
+        for _ in range(length - 1):
+            start -= 1
+            while text[start] == ' ':
+                start -= 1
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        return end + 1 >= len(text) or not text[end + 1].isalnum()
+
+    def _atom_forms(self, atom: Atom) -> Tuple[str, ...]:
+        """리터럴의 트라이 표기 (정규화한 패턴과 별칭들)"""
+        form = self.normalizer.pattern(atom[0])
+        return self.normalizer.variants(form) if form else ()
+
+    def _insert_atom(self, atom: Atom) -> None:
+        """트라이에 리터럴(과 별칭 표기) 삽입 (lock 안에서 호출)"""
+        for form in self._atom_forms(atom):
+            node = self._root
+            for ch in form:
+                node = node.setdefault(ch, {})
+            node.setdefault('', set()).add((atom, len(form)))
+
+    def _remove_atom(self, atom: Atom) -> None:
+        """트라이에서 리터럴(과 별칭 표기) 제거하고 빈 가지 정리 (lock 안에서 호출)"""
+        for form in self._atom_forms(atom):
+            path = [self._root]
+            for ch in form:
+                path.append(path[-1][ch])
+            path[-1][''].discard((atom, len(form)))
+            if not path[-1]['']:
+                del path[-1]['']
+            # 자식도 리터럴도 없는 노드는 위로 올라가며 제거
+            for parent, ch, node in zip(reversed(path[:-1]), reversed(form), reversed(path[1:])):
+                if node:
+                    break
+                del parent[ch]
+
+    def _changed(self) -> None:
+        """트라이 변경 표시 (lock 안에서 호출)"""
+        self._dirty = True
+        self.version += 1
+
+    def _compiled(self) -> Automaton:
+        """현재 트라이의 오토마톤 반환 (바뀌었으면 다시 컴파일)"""
+        if not self._dirty:
+            return self._automaton
+        with self._lock:
+            if self._dirty:
+                self._automaton = self._compile()
+                self._dirty = False
+            return self._automaton
+
+    def _compile(self) -> Automaton:
+        """트라이에서 전이/실패 링크/출력 테이블 생성 (BFS, lock 안에서 호출)
+
+        출력에는 실패 링크로 이어지는 접미사 리터럴까지 합쳐 두어
+        find()가 상태마다 실패 링크를 따라 올라가지 않도록 한다.
+        """
+        goto: List[Dict[str, int]] = [{}]
+        fail: List[int] = [0]
+        output: List[Tuple[Output, ...]] = [()]
+
+        queue = deque([(self._root, 0)])
+        while queue:
+            node, state = queue.popleft()
+            for ch, child in node.items():
+                if ch == '':
+                    continue
+                child_state = len(goto)
+                goto[state][ch] = child_state
+
+                # 실패 링크: 부모의 실패 상태에서 같은 문자로 갈 수 있는 가장 긴 접미사
+                child_fail = 0
+                if state:
+                    back = fail[state]
+                    while back and ch not in goto[back]:
+                        back = fail[back]
+                    child_fail = goto[back].get(ch, 0)
+
+                goto.append({})
+                fail.append(child_fail)
+                output.append(tuple(child.get('', ())) + output[child_fail])
+                queue.append((child, child_state))
+
+        by_atom: Dict[Atom, List[str]] = {}
+        for term, query in self._queries.items():
+            for atom in query.literals:
+                by_atom.setdefault(atom, []).append(term)
+        always = tuple(term for term, query in self._queries.items() if query.always)
+
+        logger.debug(f"키워드 매칭기 컴파일: 항목 {len(self._queries)}개, 상태 {len(goto)}개")
+        return (
+            goto,
+            fail,
+            output,
+            {atom: tuple(terms) for atom, terms in by_atom.items()},
+            always,
+            dict(self._queries),
+        )
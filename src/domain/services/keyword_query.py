@@ -0,0 +1,359 @@
+import re
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Iterable, List, Tuple
+import logging
+
+from config import KeywordConfig
+
+logger = logging.getLogger(__name__)
+
+# 리터럴 atom: (소문자 텍스트, 단어 경계 필요 여부)
+Atom = Tuple[str, bool]
+
+# 컴파일된 매칭 프로그램: (매칭된 리터럴 atom 집합, 정규화된 텍스트) → 일치 여부
+Program = Callable[[AbstractSet[Atom], str], bool]
+
+_OPERATOR_WORDS = {'AND', 'OR', 'NOT'}
+_WORD_STOP = set('()|"')
+
+
+class QuerySyntaxError(ValueError):
+    """감시 항목 쿼리 문법 오류"""
+    pass
+
+
+@dataclass(frozen=True)
+class KeywordQuery:
+    """컴파일된 감시 항목 쿼리
+
+    Attributes:
+        text: 원래 감시 항목 문자열
+        literals: 쿼리에 쓰인 리터럴 atom (KeywordMatcher 오토마톤에 등록)
+        program: 매칭 프로그램 (리터럴 매칭 결과와 텍스트로 판정)
+        always: 리터럴이 하나도 매칭되지 않아도 일치할 수 있는지 (NOT/정규식)
+        search_texts: 사이트 검색에 보낼 검색어 목록 - 일치하는 제목은 이 중 하나를 반드시 포함
+            (OR는 가지마다 하나, 비어 있으면 NOT/정규식만 있어 검색 페이지로 찾을 수 없음)
+    """
+    text: str
+    literals: Tuple[Atom, ...]
+    program: Program
+    always: bool = False
+    search_texts: Tuple[str, ...] = ()
+
+    @property
+    def needs_filter(self) -> bool:
+        """사이트 검색 결과를 제목으로 다시 확인해야 하는지
+
+        리터럴 하나(단어 경계 없음)로만 이루어진 쿼리는 검색 결과가 곧 일치 결과다 (기존 동작).
+        """
+        return self.always or len(self.literals) != 1 or self.literals[0][1]
+
+    @classmethod
+    def literal(cls, text: str, phrase: str = "") -> "KeywordQuery":
+        """항목 전체를 하나의 부분 문자열로 검색하는 쿼리 (기존 동작)
+
+        Args:
+            text: 원래 감시 항목 문자열
+            phrase: 검색할 문구 (없으면 text 전체)
+        """
+        phrase = phrase or text
+        atom = (phrase.lower(), False)
+        return cls(text, (atom,), lambda hits, _text: atom in hits, search_texts=(phrase,))
+
+    @classmethod
+    def any_of(cls, text: str, phrases: Iterable[str], search_text: str = "") -> "KeywordQuery":
+        """문구 중 하나라도 포함되면 일치하는 쿼리 (종목코드 → 현재/이전 회사명 등)
+
+        Args:
+            text: 원래 감시 항목 문자열
+            phrases: 검색할 문구 목록
+            search_text: 사이트 검색어 (없으면 첫 문구)
+        """
+        phrases = [phrase for phrase in phrases if phrase]
+        if not phrases:
+            return cls.literal(text)
+        atoms = tuple(dict.fromkeys((phrase.lower(), False) for phrase in phrases))
+        return cls(
+            text,
+            atoms,
+            lambda hits, _text: any(atom in hits for atom in atoms),
+            search_texts=(search_text or phrases[0],),
+        )
+
+    def matches(self, hits: AbstractSet[Atom], text: str) -> bool:
+        """
+        Args:
+            hits: 텍스트에서 매칭된 리터럴 atom 집합
+            text: 정규화된 검색 텍스트 (정규식 atom용, TitleNormalizer.normalize)
+
+        Returns:
+            일치 여부
+        """
+        return self.program(hits, text)
+
+
+def parse_query(text: str, prefix: str = KeywordConfig.QUERY_PREFIX) -> KeywordQuery:
+    """감시 항목 문자열을 쿼리로 컴파일합니다.
+
+    쿼리 문법은 prefix(기본 "q:")로 시작하는 항목에만 적용한다. 그 밖의 항목은
+    괄호/따옴표/-/| 등이 있어도 전체를 하나의 문구로 검색한다 (기존 동작,
+    예: "삼성전자(우)", "-S&P", "한화솔루션|큐셀"은 그대로 문구).
+
+    문법 (prefix 뒤, 연산자가 하나도 없으면 나머지 전체를 하나의 문구로 검색):
+        "삼성 전자"      문구 (따옴표 안은 공백 포함 그대로)
+        삼성 AND 반도체  AND (AND, 또는 다른 연산자/따옴표가 있는 항목에서는 공백도 AND:
+                         "삼성" 반도체. 삼성 반도체처럼 단어만 있으면 전체가 하나의 문구)
+        삼성 | 하이닉스  OR (| 또는 OR)
+        -우선주          NOT (-, ! 또는 NOT)
+        =LG              단어 경계 (앞뒤가 글자/숫자가 아닐 때만, ="LG 전자"도 가능)
+        /삼성\\w*전자/    정규식 (대소문자 무시)
+        ( ... )          묶음
+
+    우선순위: NOT > AND > OR
+
+    예: q:삼성 AND 반도체, q:삼성전자 -우선주, q:(LG | SK) 배터리
+
+    Args:
+        text: 감시 항목 문자열
+        prefix: 쿼리 문법을 쓰는 항목의 접두어 (대소문자 무시, 빈 문자열이면 모든 항목에 문법 적용)
+
+    Returns:
+        KeywordQuery
+
+    Raises:
+        QuerySyntaxError: 문법 오류 (짝이 맞지 않는 괄호/따옴표, 잘못된 정규식 등)
+    """
+    stripped = text.strip()
+    if prefix:
+        if stripped[:len(prefix)].lower() != prefix.lower():
+            return KeywordQuery.literal(stripped)
+        stripped = stripped[len(prefix):].strip()
+
+    tokens = _tokenize(stripped)
+    if not tokens:
+        raise QuerySyntaxError(f"빈 쿼리: {text!r}")
+
+    # 연산자/문구/경계/정규식이 없으면 공백을 포함한 전체가 하나의 문구
+    if all(kind == 'word' for kind, _ in tokens):
+        return KeywordQuery.literal(text, stripped)
+
+    parser = _Parser(tokens)
+    node = parser.parse()
+
+    literals: List[Atom] = []
+    _collect_literals(node, literals)
+    return KeywordQuery(
+        text=text,
+        literals=tuple(dict.fromkeys(literals)),
+        program=_compile(node),
+        always=_can_match_without_literals(node),
+        search_texts=_search_literals(node),
+    )
+
+
+def compile_query(text: str) -> KeywordQuery:
+    """parse_query와 같지만 문법 오류면 경고 후 접두어 뒤 전체를 문구로 검색"""
+    try:
+        return parse_query(text)
+    except QuerySyntaxError as e:
+        logger.warning(f"쿼리 문법 오류, 문구로 검색합니다: {e}")
+        stripped = text.strip()
+        prefix = KeywordConfig.QUERY_PREFIX
+        if prefix and stripped[:len(prefix)].lower() == prefix.lower():
+            return KeywordQuery.literal(text, stripped[len(prefix):].strip() or stripped)
+        return KeywordQuery.literal(stripped)
+
+
+def _tokenize(text: str) -> List[Tuple[str, object]]:
+    """쿼리 문자열 → [(종류, 값)]
+
+    종류: 'word'(일반 단어), 'lit'(atom), 're'(정규식), '(' / ')' / 'AND' / 'OR' / 'NOT'
+    """
+    tokens: List[Tuple[str, object]] = []
+    i, n = 0, len(text)
+    while i < n:
+        ch = text[i]
+        if ch.isspace():
+            i += 1
+            continue
+        if ch in '()':
+            tokens.append((ch, None))
+            i += 1
+            continue
+        if ch == '|':
+            tokens.append(('OR', None))
+            i += 1
+            continue
+        if ch in '-!':
+            tokens.append(('NOT', None))
+            i += 1
+            continue
+
+        boundary = ch == '='
+        if boundary:
+            i += 1
+            if i >= n or text[i].isspace():
+                raise QuerySyntaxError(f"'=' 뒤에 단어가 없습니다: {text!r}")
+            ch = text[i]
+
+        if ch == '"':
+            end = text.find('"', i + 1)
+            if end < 0:
+                raise QuerySyntaxError(f"따옴표가 닫히지 않았습니다: {text!r}")
+            phrase = text[i + 1:end]
+            if not phrase:
+                raise QuerySyntaxError(f"빈 문구: {text!r}")
+            tokens.append(('lit', (phrase.lower(), boundary)))
+            i = end + 1
+            continue
+
+        if ch == '/':
+            if boundary:
+                raise QuerySyntaxError(f"정규식에는 '='를 쓸 수 없습니다: {text!r}")
+            end = i + 1
+            while end < n and text[end] != '/':
+                end += 2 if text[end] == '\\' else 1
+            if end >= n:
+                raise QuerySyntaxError(f"정규식이 닫히지 않았습니다: {text!r}")
+            try:
+                pattern = re.compile(text[i + 1:end].replace('\\/', '/'), re.IGNORECASE)
+            except re.error as e:
+                raise QuerySyntaxError(f"잘못된 정규식 {text[i:end + 1]!r}: {e}") from e
+            tokens.append(('re', pattern))
+            i = end + 1
+            continue
+
+        end = i
+        while end < n and not text[end].isspace() and text[end] not in _WORD_STOP:
+            end += 1
+        word = text[i:end]
+        i = end
+        if word in _OPERATOR_WORDS and not boundary:
+            tokens.append((word, None))
+        elif boundary:
+            tokens.append(('lit', (word.lower(), True)))
+        else:
+            tokens.append(('word', word))
+    return tokens
+
+
+class _Parser:
+    """재귀 하강 파서 (토큰 → 노드)
+
+    노드: ('lit', atom) / ('re', pattern) / ('not', node) / ('and', [nodes]) / ('or', [nodes])
+    """
+
+    def __init__(self, tokens: List[Tuple[str, object]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self):
+        node = self._or()
+        if self.pos < len(self.tokens):
+            raise QuerySyntaxError(f"예상하지 못한 '{self._peek()}'")
+        return node
+
+    def _peek(self):
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _or(self):
+        nodes = [self._and()]
+        while self._peek() == 'OR':
+            self.pos += 1
+            nodes.append(self._and())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def _and(self):
+        nodes = [self._unary()]
+        while self._peek() not in (None, 'OR', ')'):
+            if self._peek() == 'AND':
+                self.pos += 1
+            nodes.append(self._unary())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def _unary(self):
+        kind = self._peek()
+        if kind is None:
+            raise QuerySyntaxError("쿼리가 연산자로 끝납니다")
+        if kind == 'NOT':
+            self.pos += 1
+            return ('not', self._unary())
+        if kind == '(':
+            self.pos += 1
+            node = self._or()
+            if self._peek() != ')':
+                raise QuerySyntaxError("괄호가 닫히지 않았습니다")
+            self.pos += 1
+            return node
+
+        _, value = self.tokens[self.pos]
+        self.pos += 1
+        if kind == 'word':
+            return ('lit', (value.lower(), False))
+        if kind in ('lit', 're'):
+            return (kind, value)
+        raise QuerySyntaxError(f"예상하지 못한 '{kind}'")
+
+
+def _collect_literals(node, literals: List[Atom]) -> None:
+    kind = node[0]
+    if kind == 'lit':
+        literals.append(node[1])
+    elif kind == 'not':
+        _collect_literals(node[1], literals)
+    elif kind in ('and', 'or'):
+        for child in node[1]:
+            _collect_literals(child, literals)
+
+
+def _search_literals(node) -> Tuple[str, ...]:
+    """일치하는 텍스트가 반드시 하나는 포함하는 리터럴 목록 (사이트 검색어, 없으면 빈 튜플)
+
+    AND는 자식 중 목록이 가장 짧은 것(같으면 앞쪽), OR는 모든 자식의 목록을 합친다
+    (자식 하나라도 목록이 없으면 없음). NOT/정규식은 검색어가 될 수 없다.
+    """
+    kind = node[0]
+    if kind == 'lit':
+        return (node[1][0],)
+    if kind == 'and':
+        covers = [cover for cover in map(_search_literals, node[1]) if cover]
+        return min(covers, key=len) if covers else ()
+    if kind == 'or':
+        covers = [_search_literals(child) for child in node[1]]
+        if not all(covers):
+            return ()
+        return tuple(dict.fromkeys(literal for cover in covers for literal in cover))
+    return ()
+
+
+def _can_match_without_literals(node) -> bool:
+    """리터럴 매칭 없이도 참이 될 수 있는지 (보수적으로 판단)"""
+    kind = node[0]
+    if kind == 'lit':
+        return False
+    if kind in ('re', 'not'):
+        return True
+    if kind == 'and':
+        return all(_can_match_without_literals(child) for child in node[1])
+    return any(_can_match_without_literals(child) for child in node[1])
+
+
+def _compile(node) -> Program:
+    """노드를 클로저로 컴파일 (매칭 시 트리를 다시 해석하지 않음)"""
+    kind = node[0]
+    if kind == 'lit':
+        atom = node[1]
+        return lambda hits, _text: atom in hits
+    if kind == 're':
+        search = node[1].search
+        return lambda _hits, text: search(text) is not None
+    if kind == 'not':
+        inner = _compile(node[1])
+        return lambda hits, text: not inner(hits, text)
+
+    # 리터럴(집합 조회)을 정규식보다 먼저 평가
+    children = sorted(node[1], key=lambda child: child[0] != 'lit')
+    programs = tuple(_compile(child) for child in children)
+    if kind == 'and':
+        return lambda hits, text: all(program(hits, text) for program in programs)
+    return lambda hits, text: any(program(hits, text) for program in programs)
@@ -1,12 +1,15 @@
 import asyncio
 from datetime import datetime
-from typing import Set
+from typing import Optional
 import logging
 
 from config import Config
 from ports.news_port import NewsRepository
 from ports.storage_port import StorageRepository
 from ports.alert_port import AlertSystem
+from domain.services.date_parser import kst_day_start
+from domain.services.poll_scheduler import PollScheduler
+from domain.services.seen_filter import RollingSeenSet
 
 logger = logging.getLogger(__name__)
 
@@ -15,43 +18,47 @@ class MonitorService:
         self,
         news_repo: NewsRepository,
         storage_repo: StorageRepository,
-        alert_system: AlertSystem
+        alert_system: AlertSystem,
+        seen_keys: Optional[RollingSeenSet] = None
     ):
         self.news_repo = news_repo
         self.storage_repo = storage_repo
         self.alert_system = alert_system
-        self.seen_ids: Set[int] = set()
+        # 처리한 기사의 Article.key (여러 날 보관, 자정에 비우지 않음)
+        self.seen_keys = seen_keys if seen_keys is not None else RollingSeenSet()
+        self.scheduler = PollScheduler()
+        get_source_name = getattr(news_repo, 'get_source_name', None)
+        self.source_name = get_source_name() if get_source_name else type(news_repo).__name__
 
     async def run(self):
         """메인 감시 루프를 실행한다 (비동기)."""
         logger.info(f"모니터 서비스 시작 ({Config.START_HOUR}:00 ~ {Config.END_HOUR}:00)")
         
-        # 초기화: 오늘 이미 수집한 기사 ID 로드
-        self.seen_ids = self.storage_repo.load_today_ids()
-        logger.info(f"저장된 ID {len(self.seen_ids)}개 로드 완료")
+        # 초기화: 오늘 이미 수집한 기사 키 추가 (filter 파일이 없던 경우 대비)
+        self.seen_keys.update(self.storage_repo.load_today_keys())
+        logger.info(f"본 기사 키 {len(self.seen_keys)}개 ({self.seen_keys.days}일) 로드 완료")
+
+        loop = asyncio.get_running_loop()
+        self.scheduler.register(self.source_name, loop.time())
 
         while True:
-            # 시작 시간 기록
-            start_time = asyncio.get_running_loop().time()
-            
+            new_count = 0
             try:
                 # 동기 작업인 스캔 로직을 별도 스레드에서 실행하여 이벤트 루프 차단 방지
-                await asyncio.to_thread(self._scan_process)
+                new_count = await asyncio.to_thread(self._scan_process)
             except Exception as e:
                 logger.error(f"모니터 루프 오류: {e}", exc_info=True)
             
-            # 경과 시간 계산 및 대기 (정확히 60초 간격 유지)
-            elapsed = asyncio.get_running_loop().time() - start_time
-            wait_time = max(0, Config.CHECK_INTERVAL - elapsed)
-            
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            else:
-                # 작업 시간이 간격을 초과한 경우 즉시 다음 작업 수행 (혹은 약간의 텀)
-                await asyncio.sleep(0)
+            # 새 기사 수에 따라 다음 폴링 간격 조정 (발행이 활발하면 짧게, 조용하면 길게)
+            self.scheduler.record(self.source_name, new_count, loop.time())
+            await asyncio.sleep(self.scheduler.seconds_until_next(loop.time()))
 
-    def _scan_process(self):
-        """실제 크롤링 및 알림 처리를 수행하는 동기 메서드"""
+    def _scan_process(self) -> int:
+        """실제 크롤링 및 알림 처리를 수행하는 동기 메서드
+        
+        Returns:
+            새로 발견한 기사 수
+        """
         now = datetime.now()
         today_str = now.strftime("%Y-%m-%d")
         
@@ -60,36 +67,42 @@ class MonitorService:
             self._last_check_date = today_str
             
         if self._last_check_date != today_str:
-            logger.info(f"날짜 변경: {self._last_check_date} -> {today_str}. 캐시 초기화")
-            self.seen_ids.clear()
+            logger.info(f"날짜 변경: {self._last_check_date} -> {today_str}. 지난 filter 정리")
+            self.seen_keys.roll(now.date())
             self._last_check_date = today_str
         
         # 운영 시간 체크
         if not (Config.START_HOUR <= now.hour < Config.END_HOUR):
             logger.debug(f"운영 시간 외 ({now.strftime('%H:%M')})")
-            return
+            return 0
 
         logger.debug(f"스캔 중... {now.strftime('%H:%M:%S')}")
         
         # 기사 조회
         articles = self.news_repo.fetch_reports(Config.KEYWORD)
         
-        today_str = now.strftime("%Y-%m-%d")
+        today_start = kst_day_start()
+        new_articles = []
         
         for article in articles:
-            # 날짜 필터링: 오늘 작성된 기사만 처리
-            # article.date 형식: "2025-12-02 10:22"
-            if not article.date.startswith(today_str):
+            # 날짜 필터링: 오늘(KST) 작성된 기사만 처리
+            if not today_start <= article.ts < today_start + 24 * 3600:
                 continue
 
-            if article.id not in self.seen_ids:
+            if article.key not in self.seen_keys:
                 logger.info(f"새 기사 발견: {article.title}")
                 
                 # 알림 발송
                 self.alert_system.send_notification(article)
                 
-                # 저장
-                self.storage_repo.save_article(article)
-                
                 # 메모리 업데이트
-                self.seen_ids.add(article.id)
+                self.seen_keys.add(article.key)
+                new_articles.append(article)
+        
+        # 저장 (주기당 한 번 일괄 저장)
+        if new_articles:
+            saved = self.storage_repo.save_articles(new_articles)
+            if saved < len(new_articles):
+                logger.debug(f"새 기사 {len(new_articles)}개 중 {saved}개 저장 (나머지는 이미 저장됨)")
+        
+        return len(new_articles)
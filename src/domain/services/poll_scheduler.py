@@ -0,0 +1,173 @@
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, time as dt_time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+from config import SchedulerConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceSchedule:
+    """소스별 폴링 상태"""
+    interval: float
+    next_due: float
+    last_new_at: Optional[float] = None
+    avg_gap: Optional[float] = None  # 새 항목 사이 평균 간격 (지수이동평균)
+    last_activity: float = 0.0       # 마지막으로 새 항목이 나온 시각 (없으면 등록 시각)
+    burst_windows: List[Tuple[dt_time, dt_time]] = field(default_factory=list)
+
+
+class PollScheduler:
+    """소스별 다음 폴링 시각을 관리하는 적응형 스케줄러
+
+    - 소스마다 독립된 폴링 간격과 다음 예정 시각을 가진다.
+    - 발행 주기는 감시 항목 매칭 여부와 관계없이 소스에 새로 올라온 항목 수로 학습한다
+      (매칭된 기사만 세면 발행이 잦아도 감시 항목이 드문 소스가 조용해 보임).
+    - 새 항목이 나오면 간격을 줄이고, 최근 발행 주기(평균 간격)에 맞춰 상한을 둔다.
+    - 새 항목이 없으면 간격을 늘리되 QUIET_MAX_INTERVAL(기본 CHECK_INTERVAL)까지만 늘린다.
+      IDLE_AFTER 동안 새 항목이 없는 소스만 MAX_INTERVAL까지 늘린다.
+    - 집중 시간대(BURST_WINDOWS)에는 BURST_MAX_INTERVAL 이하로 유지한다
+      (시간대가 열리면 다음 폴링 결과를 기다리지 않고 바로 앞당김).
+
+    시각(now)은 단조 증가 시계(예: loop.time())를 사용한다.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = SchedulerConfig.MIN_INTERVAL,
+        max_interval: float = SchedulerConfig.MAX_INTERVAL,
+        quiet_max_interval: float = SchedulerConfig.QUIET_MAX_INTERVAL,
+        idle_after: float = SchedulerConfig.IDLE_AFTER,
+        initial_interval: float = SchedulerConfig.INITIAL_INTERVAL,
+        tighten_factor: float = SchedulerConfig.TIGHTEN_FACTOR,
+        backoff_factor: float = SchedulerConfig.BACKOFF_FACTOR,
+        cadence_fraction: float = SchedulerConfig.CADENCE_FRACTION,
+        smoothing: float = SchedulerConfig.SMOOTHING,
+        burst_windows: Optional[Dict[str, Sequence[Tuple[str, str]]]] = None,
+        burst_max_interval: float = SchedulerConfig.BURST_MAX_INTERVAL,
+        wall_clock: Callable[[], datetime] = datetime.now,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.quiet_max_interval = quiet_max_interval
+        self.idle_after = idle_after
+        self.initial_interval = initial_interval
+        self.tighten_factor = tighten_factor
+        self.backoff_factor = backoff_factor
+        self.cadence_fraction = cadence_fraction
+        self.smoothing = smoothing
+        self.burst_windows = SchedulerConfig.BURST_WINDOWS if burst_windows is None else burst_windows
+        self.burst_max_interval = burst_max_interval
+        self.wall_clock = wall_clock
+        self._sources: Dict[str, SourceSchedule] = {}
+
+    def register(self, source: str, now: float) -> None:
+        """소스 등록 (즉시 폴링 대상)"""
+        if source in self._sources:
+            return
+
+        windows = [
+            (self._parse_hhmm(start), self._parse_hhmm(end))
+            for start, end in self.burst_windows.get(source, ())
+        ]
+        self._sources[source] = SourceSchedule(
+            interval=self._clamp(self.initial_interval),
+            next_due=now,
+            last_activity=now,
+            burst_windows=windows,
+        )
+
+    def due_sources(self, now: float) -> List[str]:
+        """폴링 시각이 된 소스 목록"""
+        self._apply_burst_windows()
+        return [name for name, schedule in self._sources.items() if schedule.next_due <= now]
+
+    def mark_started(self, source: str) -> None:
+        """폴링 시작 표시 - 결과가 기록될 때까지 폴링 대상에서 제외"""
+        self._sources[source].next_due = math.inf
+
+    def record(self, source: str, new_count: int, now: float) -> float:
+        """폴링 결과를 반영하여 다음 간격을 계산합니다.
+
+        Args:
+            source: 소스 이름
+            new_count: 이번 폴링에서 소스에 새로 올라온 항목 수 (감시 항목 매칭 여부 무관)
+            now: 현재 시각 (단조 시계)
+
+        Returns:
+            새 폴링 간격 (초)
+        """
+        schedule = self._sources[source]
+
+        if new_count > 0:
+            # 발행 주기 학습: 직전 새 기사 이후 경과 시간을 기사 수로 나눈 값
+            if schedule.last_new_at is not None:
+                gap = (now - schedule.last_new_at) / new_count
+                if schedule.avg_gap is None:
+                    schedule.avg_gap = gap
+                else:
+                    schedule.avg_gap = self.smoothing * gap + (1 - self.smoothing) * schedule.avg_gap
+            schedule.last_new_at = now
+            schedule.last_activity = now
+
+            interval = schedule.interval * self.tighten_factor
+            if schedule.avg_gap is not None:
+                interval = min(interval, schedule.avg_gap * self.cadence_fraction)
+        else:
+            interval = schedule.interval * self.backoff_factor
+            # 유휴 소스가 아니면 기존 고정 주기(CHECK_INTERVAL)보다 늦게 폴링하지 않음
+            if now - schedule.last_activity < self.idle_after:
+                interval = min(interval, self.quiet_max_interval)
+
+        interval = self._clamp(interval)
+        if schedule.burst_windows and self._in_burst_window(schedule):
+            interval = min(interval, max(self.min_interval, self.burst_max_interval))
+
+        if interval != schedule.interval:
+            logger.debug(f"{source} 폴링 간격 {schedule.interval:.0f}s -> {interval:.0f}s (새 항목 {new_count}건)")
+
+        schedule.interval = interval
+        schedule.next_due = now + interval
+        return interval
+
+    def seconds_until_next(self, now: float) -> float:
+        """가장 빠른 다음 폴링까지 남은 시간 (초)"""
+        if not self._sources:
+            return self.initial_interval
+        self._apply_burst_windows()
+        next_due = min(schedule.next_due for schedule in self._sources.values())
+        if next_due == math.inf:
+            return self.initial_interval
+        return max(0.0, next_due - now)
+
+    def interval_of(self, source: str) -> float:
+        """소스의 현재 폴링 간격"""
+        return self._sources[source].interval
+
+    def _clamp(self, interval: float) -> float:
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def _apply_burst_windows(self) -> None:
+        """집중 시간대가 열린 소스는 간격을 BURST_MAX_INTERVAL 이하로 줄이고 다음 폴링을 앞당김"""
+        cap = max(self.min_interval, self.burst_max_interval)
+        for source, schedule in self._sources.items():
+            if schedule.interval <= cap or not schedule.burst_windows or schedule.next_due == math.inf:
+                continue
+            if not self._in_burst_window(schedule):
+                continue
+            last_polled = schedule.next_due - schedule.interval
+            logger.debug(f"{source} 집중 시간대 시작: 폴링 간격 {schedule.interval:.0f}s -> {cap:.0f}s")
+            schedule.interval = cap
+            schedule.next_due = last_polled + cap
+
+    def _in_burst_window(self, schedule: SourceSchedule) -> bool:
+        current = self.wall_clock().time()
+        return any(start <= current <= end for start, end in schedule.burst_windows)
+
+    @staticmethod
+    def _parse_hhmm(value: str) -> dt_time:
+        hour, minute = value.split(":")
+        return dt_time(int(hour), int(minute))
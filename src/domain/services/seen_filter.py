@@ -0,0 +1,217 @@
+import math
+import mmap
+import os
+import re
+import struct
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional
+import logging
+
+from config import SeenConfig
+
+logger = logging.getLogger(__name__)
+
+# 파일 헤더: 매직, 비트 수, 해시 수, 추가한 항목 수
+_HEADER = struct.Struct('<8sQIQ')
+_MAGIC = b'NMBLOOM1'
+_COUNT_OFFSET = 8 + 8 + 4
+
+_MASK64 = (1 << 64) - 1
+
+# seen_YYYYMMDD.bloom
+_FILE_DATE = re.compile(r'^seen_(\d{8})\.bloom$')
+
+
+class BloomFilter:
+    """64비트 키용 Bloom filter (파일 경로를 주면 mmap으로 저장)
+
+    - 오탐률 error_rate, 예상 항목 수 capacity로 비트 수/해시 수를 정한다
+    - Article.key는 이미 균등한 64비트 지문이라 다시 해시하지 않고 상/하위 32비트로 이중 해싱
+    - mmap 파일은 다시 열면 그대로 사용 (읽어 들이는 과정 없음)
+    """
+
+    def __init__(self, capacity: int, error_rate: float, path: Optional[str] = None):
+        """
+        Args:
+            capacity: 예상 항목 수 (넘으면 오탐률이 올라감)
+            error_rate: 목표 오탐률 (예: 1e-6)
+            path: 저장 파일 (None이면 메모리에만)
+        """
+        self.capacity = capacity
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.path = path
+
+        size = _HEADER.size + (self.num_bits + 7) // 8
+        if path is None:
+            self._bits = bytearray(size)
+            _HEADER.pack_into(self._bits, 0, _MAGIC, self.num_bits, self.num_hashes, 0)
+        else:
+            self._bits = self._map(path, size)
+
+    def _map(self, path: str, size: int) -> mmap.mmap:
+        """파일을 mmap (없거나 설정이 다르면 새로 만듦)"""
+        reuse = False
+        if os.path.exists(path) and os.path.getsize(path) == size:
+            with open(path, 'rb') as f:
+                magic, num_bits, num_hashes, _ = _HEADER.unpack(f.read(_HEADER.size))
+            reuse = (magic, num_bits, num_hashes) == (_MAGIC, self.num_bits, self.num_hashes)
+            if not reuse:
+                logger.info(f"Bloom filter 설정이 달라 새로 만듭니다: {path}")
+
+        mode = 'r+b' if reuse else 'w+b'
+        with open(path, mode) as f:
+            if not reuse:
+                f.truncate(size)
+                f.write(_HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, 0))
+                f.flush()
+            return mmap.mmap(f.fileno(), size)
+
+    def __len__(self) -> int:
+        """추가한 항목 수 (이미 있던 항목은 세지 않음)"""
+        return struct.unpack_from('<Q', self._bits, _COUNT_OFFSET)[0]
+
+    def __contains__(self, key: int) -> bool:
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, key: int) -> bool:
+        """키 추가
+
+        Returns:
+            새 항목이면 True (이미 있던 것으로 판정되면 False)
+        """
+        bits = self._bits
+        added = False
+        for position in self._positions(key):
+            index = position >> 3
+            mask = 1 << (position & 7)
+            if not bits[index] & mask:
+                bits[index] |= mask
+                added = True
+        if added:
+            struct.pack_into('<Q', bits, _COUNT_OFFSET, len(self) + 1)
+        return added
+
+    def flush(self) -> None:
+        """mmap 변경 내용을 파일에 기록"""
+        if isinstance(self._bits, mmap.mmap):
+            self._bits.flush()
+
+    def close(self) -> None:
+        if isinstance(self._bits, mmap.mmap) and not self._bits.closed:
+            self._bits.flush()
+            self._bits.close()
+
+    def _positions(self, key: int):
+        """이중 해싱으로 만든 비트 위치 (헤더 뒤부터)"""
+        key &= _MASK64
+        h1 = key & 0xFFFFFFFF
+        h2 = (key >> 32) | 1
+        offset = _HEADER.size * 8
+        for i in range(self.num_hashes):
+            yield offset + (h1 + i * h2) % self.num_bits
+
+
+class RollingSeenSet:
+    """여러 날에 걸친 "이미 본 기사" 집합 (하루 하나의 Bloom filter, 기간이 지나면 삭제)
+
+    자정에 비우는 set과 달리 다음 날 피드에 다시 올라온 기사를 알리지 않고,
+    메모리는 보관 일수 × 하루 용량으로 고정된다. 파일은 mmap이라 재시작해도 바로 이어서 쓴다.
+    오탐(처음 보는 기사를 본 것으로 판정)은 error_rate 이하로, 해당 기사는 알림이 생략된다.
+    """
+
+    def __init__(
+        self,
+        days: int = SeenConfig.DAYS,
+        capacity: int = SeenConfig.CAPACITY_PER_DAY,
+        error_rate: float = SeenConfig.ERROR_RATE,
+        directory: Optional[str] = SeenConfig.DIRECTORY,
+        today: Optional[date] = None
+    ):
+        """
+        Args:
+            days: 보관 일수 (오늘 포함)
+            capacity: 하루 예상 항목 수
+            error_rate: 하루 filter의 오탐률 (전체 오탐률은 최대 days배)
+            directory: filter 파일 폴더 (None이면 메모리에만, 재시작하면 비어 있음)
+            today: 기준 날짜 (기본: 오늘)
+        """
+        self.days = days
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.directory = directory
+        self._filters: Dict[date, BloomFilter] = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.today = today or datetime.now().date()
+        self.roll(self.today)
+
+    def __contains__(self, key: int) -> bool:
+        # 새 기사는 대부분 첫 filter에서 몇 비트 만에 걸러짐, 본 기사는 주로 오늘 filter에 있음
+        for bloom in self._filters.values():
+            if key in bloom:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        """보관 중인 항목 수 (날마다 센 값의 합)"""
+        return sum(len(bloom) for bloom in self._filters.values())
+
+    def add(self, key: int) -> None:
+        """오늘 filter에 키 추가"""
+        bloom = self._filters[self.today]
+        if bloom.add(key) and len(bloom) == self.capacity:
+            logger.warning(f"오늘 본 기사 수가 filter 용량({self.capacity})에 도달 - 오탐률이 올라갑니다")
+
+    def update(self, keys: Iterable[int]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def roll(self, today: date) -> None:
+        """기준 날짜 변경: 기간이 지난 filter는 닫고 파일 삭제, 보관 기간 안의 filter 열기"""
+        self.today = today
+        window = {today - timedelta(days=offset) for offset in range(self.days)}
+
+        for day in [day for day in self._filters if day not in window]:
+            self._filters.pop(day).close()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                match = _FILE_DATE.match(name)
+                if not match:
+                    continue
+                day = datetime.strptime(match.group(1), "%Y%m%d").date()
+                if day not in window:
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError as e:
+                        logger.debug(f"지난 filter 삭제 실패: {name} - {e}")
+
+        # 오늘 → 과거 순 (조회 시 오늘 filter를 먼저 확인)
+        filters = {}
+        for day in sorted(window, reverse=True):
+            bloom = self._filters.get(day)
+            if bloom is None:
+                path = self._path(day)
+                if day != today and (path is None or not os.path.exists(path)):
+                    continue
+                bloom = BloomFilter(self.capacity, self.error_rate, path)
+            filters[day] = bloom
+        self._filters = filters
+
+    def flush(self) -> None:
+        for bloom in self._filters.values():
+            bloom.flush()
+
+    def close(self) -> None:
+        for bloom in self._filters.values():
+            bloom.close()
+        self._filters = {}
+
+    def _path(self, day: date) -> Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, f"seen_{day.strftime('%Y%m%d')}.bloom")
@@ -0,0 +1,102 @@
+import html
+import re
+import unicodedata
+from typing import Dict, Iterable, Sequence, Tuple
+import logging
+
+from config import KeywordConfig
+
+logger = logging.getLogger(__name__)
+
+# 전각 ASCII(！~～) → 반각, 전각 공백 → 공백
+_WIDTH_TABLE = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+_WIDTH_TABLE[0x3000] = 0x20
+_WIDE_CHARS = re.compile('[\uff01-\uff5e\u3000]')  # translate()는 글자마다 dict 조회라 있을 때만 실행
+
+# 줄바꿈(필드 구분자)을 제외한 공백 연속
+_SPACES = re.compile(r'[^\S\n]+')
+
+# 말머리 괄호 쌍: [] 【】 <> 〈〉 《》 「」 『』
+_TAG_BRACKETS = ('[]', '【】', '<>', '〈〉', '《》', '「」', '『』')
+
+
+class TitleNormalizer:
+    """매칭용 제목 정규화 (item당 한 번)
+
+    언론사마다 다른 표기를 같은 형태로 맞춘다.
+    - HTML 엔티티 해제 (&amp; → &)
+    - NFC 정규화 (조합형 한글 → 완성형)
+    - 전각 → 반각 (ＳＫ → SK)
+    - 말머리 제거 ([단독], 【속보】, <포토> 등 BRACKET_TAGS에 있는 것만, 괄호 안의 회사명 등은 유지)
+    - 소문자, 공백 연속 → 공백 하나 (줄바꿈은 필드 구분자로 유지)
+
+    띄어쓰기 차이("삼성 전자" / "삼성전자")는 KeywordMatcher가 공백을 건너뛰며 매칭하여 처리한다.
+
+    별칭 그룹(예: ["삼성전자", "삼전"])은 미리 색인하여, 그룹 안의 한 표기를 등록하면
+    모든 표기가 오토마톤에 함께 들어간다 (item당 매칭 비용은 별칭 수와 무관).
+    """
+
+    def __init__(
+        self,
+        aliases: Iterable[Iterable[str]] = (),
+        strip_tags: bool = KeywordConfig.STRIP_BRACKET_TAGS,
+        tags: Sequence[str] = KeywordConfig.BRACKET_TAGS,
+    ):
+        """
+        Args:
+            aliases: 별칭 그룹 목록 (그룹 안의 표기는 서로 같은 것으로 취급)
+            strip_tags: 말머리 제거 여부
+            tags: 말머리로 볼 괄호 내용 (이 목록에 있는 것만 제거, 대소문자/앞뒤 공백 무시)
+        """
+        self._tag_pattern = None
+        if strip_tags and tags:
+            words = '|'.join(re.escape(tag) for tag in sorted(tags, key=len, reverse=True))
+            self._tag_pattern = re.compile('|'.join(
+                f'{re.escape(pair[0])} *(?:{words}) *{re.escape(pair[1])}'
+                for pair in _TAG_BRACKETS
+            ), re.IGNORECASE)
+
+        # 별칭 색인: 표기(패턴 형태) → 같은 그룹의 모든 표기
+        self._alias_index: Dict[str, Tuple[str, ...]] = {}
+        for group in aliases:
+            forms = tuple(dict.fromkeys(form for form in map(self.pattern, group) if form))
+            for form in forms:
+                merged = self._alias_index.get(form, ()) + forms
+                self._alias_index[form] = tuple(dict.fromkeys(merged))
+
+    def normalize(self, text: str) -> str:
+        """매칭용 텍스트로 정규화 (말머리 제거 포함)
+
+        Args:
+            text: 제목 등 원문 (여러 필드는 줄바꿈으로 구분)
+
+        Returns:
+            정규화된 소문자 텍스트
+        """
+        if '&' in text:
+            text = html.unescape(text)
+        if not unicodedata.is_normalized('NFC', text):
+            text = unicodedata.normalize('NFC', text)
+        if _WIDE_CHARS.search(text):
+            text = text.translate(_WIDTH_TABLE)
+        if self._tag_pattern is not None and text:
+            text = self._tag_pattern.sub(' ', text)
+        return _SPACES.sub(' ', text.lower()).strip(' ')
+
+    def pattern(self, term: str) -> str:
+        """검색어를 오토마톤 패턴 형태로 정규화 (말머리 제거 없음, 공백 제거)
+
+        Args:
+            term: 키워드/문구
+
+        Returns:
+            공백 없는 정규화 문자열 (빈 문자열이면 매칭 불가)
+        """
+        if '&' in term:
+            term = html.unescape(term)
+        term = unicodedata.normalize('NFC', term).translate(_WIDTH_TABLE).lower()
+        return ''.join(term.split())
+
+    def variants(self, form: str) -> Tuple[str, ...]:
+        """패턴과 같은 그룹의 모든 표기 (별칭이 없으면 자기 자신만)"""
+        return self._alias_index.get(form, (form,))
@@ -0,0 +1,144 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 모든 호스트에서 제거하는 추적용 쿼리 파라미터 (광고/분석 도구가 붙이는 것만)
+# cid, ref, from 같은 이름은 사이트에 따라 기사 식별자일 수 있으므로 UrlRule.drop_params로 사이트별 지정
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'dclid'})
+TRACKING_PREFIXES = ('utm_',)
+
+# 규칙이 없는 호스트에서 같은 사이트로 보는 접두사 (모바일/데스크톱/AMP)
+HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+
+
+@dataclass(frozen=True)
+class UrlRule:
+    """사이트별 URL 정규화 규칙
+
+    Attributes:
+        host: 정규화 키의 호스트 이름 (키 네임스페이스)
+        aliases: 같은 사이트로 볼 호스트 (모바일/데스크톱/뉴스 서브도메인 등)
+        id_pattern: 경로+쿼리에서 기사 ID를 뽑는 정규식 (그룹 1), 매칭되면 키는 "host/ID"
+        keep_params: 남길 쿼리 파라미터 (None이면 추적용 파라미터만 제거)
+        drop_params: 이 사이트에서 추가로 제거할 추적용 파라미터 (keep_params가 없을 때)
+    """
+    host: str
+    aliases: Tuple[str, ...] = ()
+    id_pattern: Optional[str] = None
+    keep_params: Optional[Tuple[str, ...]] = None
+    drop_params: Tuple[str, ...] = ()
+
+
+# 수집 소스별 규칙 (같은 기사가 모바일/데스크톱, 다른 경로 형식으로 들어오는 경우)
+DEFAULT_URL_RULES: Tuple[UrlRule, ...] = (
+    UrlRule("newspim.com", ("www.newspim.com", "m.newspim.com", "rss.newspim.com"), r'/view/(\d+)'),
+    UrlRule("edaily.co.kr", ("www.edaily.co.kr", "m.edaily.co.kr"), r'newsId=(\w+)'),
+    UrlRule("hankyung.com", ("www.hankyung.com", "m.hankyung.com", "plus.hankyung.com"), r'/article/(\w+)'),
+    UrlRule("mk.co.kr", ("www.mk.co.kr", "m.mk.co.kr"), r'/news/[\w-]+/(\d+)'),
+    UrlRule("yna.co.kr", ("www.yna.co.kr", "m.yna.co.kr"), r'(AKR\d+)', drop_params=('input', 'site')),
+    UrlRule("asiae.co.kr", ("view.asiae.co.kr", "www.asiae.co.kr", "m.asiae.co.kr"), r'(?:/article/|idxno=)(\w+)'),
+    UrlRule("etoday.co.kr", ("www.etoday.co.kr", "m.etoday.co.kr"), r'(?:/view/|idxno=)(\d+)'),
+    UrlRule("heraldcorp.com", ("biz.heraldcorp.com", "news.heraldcorp.com", "mbiz.heraldcorp.com",
+                               "m.heraldcorp.com", "www.heraldcorp.com"), r'(?:/article/|ud=)(\w+)'),
+    UrlRule("sedaily.com", ("www.sedaily.com", "m.sedaily.com"), r'/NewsView(?:Amp)?/(\w+)'),
+    UrlRule("dart.fss.or.kr", ("dart.fss.or.kr", "m.dart.fss.or.kr"), r'rcpNo=(\d+)'),
+    UrlRule("mt.co.kr", ("news.mt.co.kr", "www.mt.co.kr", "m.mt.co.kr", "mt.co.kr"), r'(\d{10,})'),
+    UrlRule("fnnews.com", ("www.fnnews.com", "m.fnnews.com"), r'/news/(\d+)'),
+    UrlRule("infostockdaily.co.kr", ("www.infostockdaily.co.kr", "m.infostockdaily.co.kr"), r'idxno=(\d+)'),
+)
+
+
+def absolute_url(link: str, base: str) -> str:
+    """상대 링크를 기준 URL로 절대 URL로 변환 (이미 절대 URL이면 그대로)"""
+    link = link.strip()
+    return urljoin(base, link) if link else link
+
+
+class UrlCanonicalizer:
+    """중복 판단용 URL 정규화
+
+    같은 기사가 http/https, 모바일/데스크톱 호스트, 추적 파라미터, 경로 형식만 다르게
+    들어와도 하나의 키가 되도록 한다. 키는 스킴 없이 "호스트/경로?정렬된쿼리" 또는
+    사이트 규칙의 기사 ID로 만든 "호스트/ID" 형태 (호스트가 네임스페이스 역할).
+
+    - 호스트 → 규칙 조회는 dict 한 번 (기사 수와 무관)
+    - 규칙이 없는 사이트: www./m. 접두사 제거, 공통 추적 파라미터(utm_*, fbclid 등)만 제거,
+      쿼리 정렬, fragment 제거
+    """
+
+    def __init__(self, rules: Iterable[UrlRule] = DEFAULT_URL_RULES):
+        """
+        Args:
+            rules: 사이트별 규칙 (같은 호스트가 여러 규칙에 있으면 뒤의 규칙 우선)
+        """
+        self._rules: Dict[str, Tuple[UrlRule, Optional[re.Pattern]]] = {}
+        for rule in rules:
+            compiled = (rule, re.compile(rule.id_pattern) if rule.id_pattern else None)
+            for host in (rule.host, *rule.aliases):
+                self._rules[host] = compiled
+
+    def canonicalize(self, link: str, base: str = "") -> str:
+        """링크의 정규화 키 문자열
+
+        Args:
+            link: 기사 링크 (상대 링크면 base 기준으로 해석)
+            base: 상대 링크의 기준 URL
+
+        Returns:
+            정규화 키 (URL이 아니면 앞뒤 공백만 제거한 원래 값, 빈 링크면 빈 문자열)
+        """
+        link = link.strip()
+        if not link:
+            return ""
+        if base:
+            link = urljoin(base, link)
+
+        try:
+            parts = urlsplit(link)
+            host = parts.hostname
+        except ValueError:
+            return link
+        if not host:
+            return link.split('#', 1)[0]
+
+        rule, id_regex = self._rules.get(host, (None, None))
+        namespace = rule.host if rule else self._strip_host_prefix(host)
+
+        if id_regex is not None:
+            tail = f"{parts.path}?{parts.query}" if parts.query else parts.path
+            match = id_regex.search(tail)
+            if match:
+                return f"{namespace}/{match.group(1)}"
+
+        params = [
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if self._keep_param(name, rule)
+        ]
+        params.sort()
+        path = parts.path.rstrip('/') or '/'
+        return f"{namespace}{path}?{urlencode(params)}" if params else f"{namespace}{path}"
+
+    @staticmethod
+    def _strip_host_prefix(host: str) -> str:
+        for prefix in HOST_PREFIXES:
+            if host.startswith(prefix) and host.count('.') > 1:
+                return host[len(prefix):]
+        return host
+
+    @staticmethod
+    def _keep_param(name: str, rule: Optional[UrlRule]) -> bool:
+        if rule is not None and rule.keep_params is not None:
+            return name in rule.keep_params
+        lowered = name.lower()
+        if rule is not None and lowered in rule.drop_params:
+            return False
+        return lowered not in TRACKING_PARAMS and not lowered.startswith(TRACKING_PREFIXES)
+
+
+# 기본 규칙으로 만든 공용 인스턴스 (Article.key 계산에 사용)
+default_canonicalizer = UrlCanonicalizer()
@@ -1,6 +1,6 @@
 import flet as ft
 import webbrowser
-from typing import List
+from typing import Dict, Iterable, List
 from domain.model import Article
 
 
@@ -11,6 +11,7 @@ class ArticleTable(ft.Column):
         super().__init__()
         self.spacing = 0
         self.expand = True
+        self._rows: Dict[int, ft.DataRow] = {}  # Article.key → 표시 중인 행
         
         # DataTable 생성
         self.data_table = ft.DataTable(
@@ -59,74 +60,107 @@ class ArticleTable(ft.Column):
             )
         ]
     
-    def set_articles(self, articles: List[Article], highlighted_links: set = None):
-        """기사 목록을 테이블에 표시"""
-        self.data_table.rows.clear()
+    def set_articles(self, articles: Iterable[Article], highlighted_links: set = None):
+        """기사 목록을 테이블에 표시 (리스트 또는 ArticleTimeline, 주어진 순서 그대로)
         
+        행은 Article.key로 보관하여 다음 호출에서 재사용한다.
+        - 새 기사만 행을 만들어 주어진 순서의 자리에 넣음
+        - 기존 행은 하이라이트가 바뀐 경우에만 배경색을 바꿈
+        - 목록에서 빠진 기사(최대 개수 초과로 제거 등)의 행은 삭제
+        같은 행 객체를 유지하므로 update() 시 Flet은 추가/삭제된 행과 바뀐 속성만 페이지로 보낸다.
+        """
         if highlighted_links is None:
             highlighted_links = set()
         
+        previous = self._rows
+        self._rows = {}
+        rows = []
+        
         for article in articles:
-            # 출처: article.source 직접 사용
-            source = article.source if article.source else "알 수 없음"
-            
             # 하이라이트 여부
-            is_highlighted = article.link in highlighted_links
-            bg_color = ft.Colors.YELLOW_50 if is_highlighted else None
+            bg_color = ft.Colors.YELLOW_50 if article.link in highlighted_links else None
             
-            # DataRow 생성 (순서: 시간, 제목, 키워드, 출처)
-            row = ft.DataRow(
-                cells=[
-                    ft.DataCell(
-                        ft.Container(
-                            content=ft.Text(
-                                article.date, 
-                                size=12,
-                                text_align=ft.TextAlign.CENTER
-                            ),
-                            padding=5,
-                            alignment=ft.alignment.center,
-                        )
-                    ),
-                    ft.DataCell(
-                        ft.Container(
-                            content=ft.Text(
-                                article.title,
-                                size=14,
-                                max_lines=2,
-                                overflow=ft.TextOverflow.ELLIPSIS,
-                                text_align=ft.TextAlign.LEFT,
-                            ),
-                            padding=5,
-                        )
-                    ),
-                    ft.DataCell(
-                        ft.Container(
-                            content=ft.Text(
-                                article.keyword if article.keyword else "-",
-                                size=12,
-                                color=ft.Colors.BLUE,
-                                text_align=ft.TextAlign.CENTER,
-                            ),
-                            padding=5,
-                            alignment=ft.alignment.center,
-                        )
-                    ),
-                    ft.DataCell(
-                        ft.Container(
-                            content=ft.Text(
-                                source, 
-                                size=13, 
-                                weight=ft.FontWeight.NORMAL,
-                                text_align=ft.TextAlign.CENTER
-                            ),
-                            padding=5,
-                            alignment=ft.alignment.center,
-                        )
-                    ),
-                ],
-                on_select_changed=lambda e, link=article.link: webbrowser.open(link),
-                color=bg_color,
-            )
+            row = previous.get(article.key)
+            if row is None or article.key in self._rows:
+                row = self._build_row(article)
+            if row.color != bg_color:
+                row.color = bg_color
             
-            self.data_table.rows.append(row)
+            self._rows.setdefault(article.key, row)
+            rows.append(row)
+        
+        if rows != self.data_table.rows:
+            self.data_table.rows = rows
+    
+    def set_highlights(self, highlighted_links: set) -> List[ft.DataRow]:
+        """행 목록은 그대로 두고 하이라이트(배경색)만 갱신 (최근 기사 하이라이트 만료 시)
+        
+        Returns:
+            배경색이 바뀐 행 목록 (이 행들만 update하면 됨)
+        """
+        changed = []
+        for row in self._rows.values():
+            bg_color = ft.Colors.YELLOW_50 if row.data in highlighted_links else None
+            if row.color != bg_color:
+                row.color = bg_color
+                changed.append(row)
+        return changed
+    
+    def _build_row(self, article: Article) -> ft.DataRow:
+        """기사 한 건의 DataRow 생성 (순서: 시간, 제목, 키워드, 출처)"""
+        # 출처: article.source 직접 사용
+        source = article.source if article.source else "알 수 없음"
+        
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(
+                            article.date, 
+                            size=12,
+                            text_align=ft.TextAlign.CENTER
+                        ),
+                        padding=5,
+                        alignment=ft.alignment.center,
+                    )
+                ),
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(
+                            article.title,
+                            size=14,
+                            max_lines=2,
+                            overflow=ft.TextOverflow.ELLIPSIS,
+                            text_align=ft.TextAlign.LEFT,
+                        ),
+                        padding=5,
+                    )
+                ),
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(
+                            article.keyword if article.keyword else "-",
+                            size=12,
+                            color=ft.Colors.BLUE,
+                            text_align=ft.TextAlign.CENTER,
+                        ),
+                        padding=5,
+                        alignment=ft.alignment.center,
+                    )
+                ),
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(
+                            source, 
+                            size=13, 
+                            weight=ft.FontWeight.NORMAL,
+                            text_align=ft.TextAlign.CENTER
+                        ),
+                        padding=5,
+                        alignment=ft.alignment.center,
+                    )
+                ),
+            ],
+            on_select_changed=lambda e, link=article.link: webbrowser.open(link),
+            data=article.link,  # 하이라이트 갱신용
+        )
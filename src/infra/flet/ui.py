@@ -12,23 +12,26 @@ import logging
 
 from adapters.infrastructure.scrapers.web.mt_scraper import MTScraper
 from adapters.infrastructure.scrapers.web.fn_scraper import FnScraper
-from adapters.infrastructure.scrapers.rss.newspim_rss_scraper import NewspimRssScraper
-from adapters.infrastructure.scrapers.rss.edaily_rss_scraper import EdailyRssScraper
-from adapters.infrastructure.scrapers.rss.hankyung_rss_scraper import HankyungRssScraper
-from adapters.infrastructure.scrapers.rss.mk_rss_scraper import MKRssScraper
-from adapters.infrastructure.scrapers.rss.yonhap_rss_scraper import YonhapRssScraper
-from adapters.infrastructure.scrapers.rss.asiae_rss_scraper import AsiaeRssScraper
-from adapters.infrastructure.scrapers.rss.etoday_rss_scraper import EtodayRssScraper
-from adapters.infrastructure.scrapers.rss.herald_rss_scraper import HeraldRssScraper
-from adapters.infrastructure.scrapers.rss.seoul_rss_scraper import SeoulRssScraper  # lxml recover 모드로 수정
 from adapters.infrastructure.scrapers.rss.infostock_scraper import InfostockScraper
-from adapters.infrastructure.scrapers.rss.dart_rss_scraper import DartRssScraper
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper
+from adapters.infrastructure.scrapers.rss.rss_sources import get_rss_source, load_rss_sources
 from adapters.infrastructure.keyword_storage import KeywordStorage
+from adapters.infrastructure.company_master import load_company_index
+from adapters.infrastructure.sqlite_storage import SqliteStorage
+from adapters.infrastructure.csv_storage import CsvStorage
+from adapters.infrastructure.http_client import HttpClient
+from adapters.infrastructure.parse_executor import ParseExecutor
 from adapters.infrastructure.win_toast import WinToast
 from adapters.infrastructure.tts_service import TTSService
 from infra.flet.views.main_view import MainView
+from domain.services.poll_scheduler import PollScheduler
+from domain.services.keyword_matcher import KeywordMatcher
+from domain.services.title_normalizer import TitleNormalizer
+from domain.services.seen_filter import RollingSeenSet
+from domain.services.article_timeline import ArticleTimeline
 from domain.model import Article
-from config import DartConfig
+from domain.services.date_parser import kst_day_start
+from config import StorageConfig
 
 logger = logging.getLogger(__name__)
 
@@ -59,37 +62,44 @@ def main(page: ft.Page):
     # State
     is_monitoring = False
     scrapers = [
-        NewspimRssScraper(), 
+        RssFeedScraper(get_rss_source("뉴스핌")),
         InfostockScraper(),
-        DartRssScraper(DartConfig.RSS_URL)
+        RssFeedScraper(get_rss_source("DART"))
     ]
-    storage = KeywordStorage()
+    # 기본 RSS 소스 + config/rss_sources.json 추가 소스
+    rss_sources = load_rss_sources()
+    # 상장 회사 마스터가 있으면 종목명/종목코드를 현재/이전 회사명으로 검색
+    storage = KeywordStorage(companies=load_company_index())
+    # 수집 기사 저장소 (재시작해도 오늘 이미 알린 기사는 다시 알리지 않음)
+    if StorageConfig.BACKEND == "sqlite":
+        article_store = SqliteStorage()
+    else:
+        article_store = CsvStorage(StorageConfig.CSV_DIR)
     tts = TTSService()
     
     # Load initial keywords
     initial_data = storage.load()
     initial_keywords = initial_data.get("keywords", [])
     initial_stock_names = initial_data.get("stock_names", [])
+    
+    # 감시 목록(키워드 + 종목명) 다중 매칭기 - 모든 RSS 스크래퍼가 공유 (별칭 포함)
+    matcher = KeywordMatcher(
+        initial_keywords + initial_stock_names,
+        compiler=storage.compile,
+        normalizer=TitleNormalizer(storage.load_aliases())
+    )
 
     def pre_generate_audio():
         logger.info("키워드 오디오 사전 생성 중...")
         # Pre-generate audio for sources
-        tts.generate_audio("뉴스핌")
+        for spec in rss_sources:
+            tts.generate_audio(spec.name)
         tts.generate_audio("인포스탁")
-        tts.generate_audio("DART")
-        tts.generate_audio("이데일리")
-        tts.generate_audio("한국경제")
-        tts.generate_audio("매일경제")
         tts.generate_audio("머니투데이")
-        tts.generate_audio("연합뉴스")
-        tts.generate_audio("아시아경제")
-        tts.generate_audio("이투데이")
-        tts.generate_audio("헤럴드경제")
-        tts.generate_audio("서울경제")
         tts.generate_audio("파이낸셜뉴스")
         
         for k in initial_keywords + initial_stock_names:
-            tts.generate_audio(k)
+            tts.generate_audio(storage.display_name(k))
             
     threading.Thread(target=pre_generate_audio, daemon=True).start()
     
@@ -122,6 +132,7 @@ def main(page: ft.Page):
     def on_exit(icon, item):
         nonlocal is_monitoring
         is_monitoring = False
+        article_store.close()
         icon.stop()
         page.window_destroy()
 
@@ -166,15 +177,17 @@ def main(page: ft.Page):
         """키워드 변경 시 호출되는 콜백 함수
         
         - JSON 파일에 저장
+        - 키워드 매칭기에 추가/삭제된 항목만 반영
         - TTS 오디오를 백그라운드 스레드에서 비동기 생성 (UI 차단 방지)
         """
         storage.save(keywords, stock_names)
+        matcher.sync(keywords + stock_names)
         
         # TTS 오디오 생성을 백그라운드 스레드에서 실행하여 UI 딜레이 방지
         def generate_audio_async():
             for k in keywords + stock_names:
                 try:
-                    tts.generate_audio(k)
+                    tts.generate_audio(storage.display_name(k))
                 except Exception as e:
                     logger.debug(f"'{k}' 오디오 생성 오류: {e}")
         
@@ -190,25 +203,31 @@ def main(page: ft.Page):
     page.add(view)
     
     async def monitor_loop():
+        # 모니터링 세션 동안 모든 스크래퍼가 하나의 커넥션 풀과 파싱 실행기를 공유
+        http_client = HttpClient()
+        parse_executor = ParseExecutor()
+        try:
+            await run_monitor(http_client, parse_executor)
+        finally:
+            await http_client.aclose()
+            parse_executor.shutdown()
+            await asyncio.to_thread(article_store.flush)
+    
+    async def run_monitor(http_client: HttpClient, parse_executor: ParseExecutor):
         nonlocal is_monitoring
-        all_articles = []
-        current_links = set()
+        timeline = ArticleTimeline()  # 표시 순서(DART 우선, 최신순)로 유지, 최대 개수 초과 시 오래된 기사 제거
+        # 이미 본 기사의 Article.key (정규화 URL 지문) - 여러 날 보관하여 다음 날 다시 올라온 기사도 무시
+        current_keys = RollingSeenSet()
+        current_keys.update(article_store.load_today_keys())
         
         # 스크래퍼 초기화
         scrapers = [
-            NewspimRssScraper(),
-            EdailyRssScraper(),
-            HankyungRssScraper(),
-            MKRssScraper(),
-            MTScraper(),
-            YonhapRssScraper(),
-            AsiaeRssScraper(),
-            EtodayRssScraper(),
-            HeraldRssScraper(),
-            SeoulRssScraper(),  # lxml recover 모드로 수정
-            FnScraper(),
-            InfostockScraper(),
-            DartRssScraper()
+            RssFeedScraper(spec, http_client=http_client, parse_executor=parse_executor)
+            for spec in rss_sources
+        ] + [
+            MTScraper(http_client=http_client, parse_executor=parse_executor),
+            FnScraper(http_client=http_client, parse_executor=parse_executor),
+            InfostockScraper(http_client=http_client, parse_executor=parse_executor),
         ]
         
         # Baseline fetch - get current articles but don't display them
@@ -224,113 +243,177 @@ def main(page: ft.Page):
 
         await view.update_status("초기 데이터 수집 중... (화면에 표시되지 않음)")
         try:
-            for term in search_terms:
-                if not is_monitoring: break
-                
-                # 모든 스크래퍼를 병렬로 실행하여 베이스라인 수집
-                tasks = [scraper.fetch_reports(term) for scraper in scrapers]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+            # 모든 스크래퍼를 병렬로 실행하여 베이스라인 수집 (소스당 피드 1회 요청)
+            tasks = [scraper.fetch_reports_many(search_terms, matcher) for scraper in scrapers]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.debug(f"베이스라인 가져오기 오류: {result}")
+                    continue
                 
-                for result in results:
-                    if isinstance(result, Exception):
-                        logger.debug(f"베이스라인 가져오기 오류: {result}")
-                        continue
-                    
-                    articles = result
+                for articles in result.values():
                     for article in articles:
-                        current_links.add(article.link)
+                        current_keys.add(article.key)
         except Exception as e:
             logger.error(f"베이스라인 가져오기 오류: {e}")
             
         await view.update_status(f"모니터링 시작... ({datetime.now().strftime('%H:%M:%S')}) - 새로운 기사 대기 중")
 
-        while is_monitoring:
-            keywords = view.get_keywords()
-            stock_names = view.get_stock_names()
-            search_terms = keywords + stock_names
+        # 소스별 적응형 폴링 스케줄러 (등록 직후 모든 소스가 폴링 대상)
+        loop = asyncio.get_running_loop()
+        scheduler = PollScheduler()
+        for scraper in scrapers:
+            scheduler.register(scraper.get_source_name(), loop.time())
+        
+        # 진행 중인 요청 {task: (scraper, 요청 시점의 search_terms)}
+        # 느린 소스는 다음 주기로 이월되고 다른 소스의 처리를 막지 않음
+        in_flight = {}
+        
+        async def handle_result(scraper, terms: List[str], result) -> int:
+            """소스 하나의 결과를 즉시 처리 (중복 제거, 알림, TTS, 화면 갱신)
             
-            if not search_terms:
-                 await view.update_status("키워드 또는 종목명을 추가해주세요.")
-                 await view.set_monitoring_state(False)
-                 break
+            Returns:
+                새 기사 수
+            """
+            if isinstance(result, Exception):
+                logger.debug(f"스크래퍼 오류: {scraper.get_source_name()} - {result}")
+                return 0
             
+            new_articles = []  # [(article, term)]
+            now = datetime.now()
+            today_start = kst_day_start()
+            today_end = today_start + 24 * 3600
+            if current_keys.today != now.date():
+                current_keys.roll(now.date())
             
-            try:
-                new_articles_this_cycle = []  # Track new articles in this cycle
+            # 결과 처리 (키워드 순서 유지)
+            for term in terms:
+                for article in result.get(term, []):
+                    # 날짜 필터링: 오늘(KST) 기사가 아니면 무시 (날짜를 모르면 ts=0)
+                    if not today_start <= article.ts < today_end:
+                        continue
+
+                    if article.key not in current_keys:
+                        timeline.add(article)
+                        current_keys.add(article.key)
+                        new_articles.append((article, term))
+                        
+                        # Send notification
+                        try:
+                            if toaster:
+                                logger.info(f"알림 전송: {article.source} - {article.title[:30]}...")
+                                toaster.send_notification(article)
+                            else:
+                                logger.warning("toaster가 None이어서 알림을 전송할 수 없습니다")
+                        except Exception as e:
+                            logger.error(f"알림 오류: {e}", exc_info=True)
+            
+            if new_articles:
+                logger.debug(f"새 기사 {len(new_articles)}개 발견")
+                # 소스 결과 하나당 한 번 일괄 저장
+                saved = await asyncio.to_thread(article_store.save_articles, [article for article, _ in new_articles])
+                if saved < len(new_articles):
+                    logger.debug(f"  저장 {saved}개 (나머지는 이미 저장됨)")
+                for article, term in new_articles:
+                    logger.debug(f"  - {article.source}: {term} ({article.title[:30]}...)")
                 
-                today_str = datetime.now().strftime("%Y-%m-%d")
+                platform_groups = {}  # {platform_name: [keyword1, keyword2, ...]} 시간순
                 
-                for term in search_terms:
-                    if not is_monitoring: break
-                    
-                    # 모든 스크래퍼를 병렬로 실행
-                    tasks = [scraper.fetch_reports(term) for scraper in scrapers]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # 결과 처리
-                    for result in results:
-                        if isinstance(result, Exception):
-                            logger.debug(f"스크래퍼 오류: {result}")
-                            continue
+                for article, term in new_articles:
+                    # article에서 source 사용 (스크래퍼가 이미 설정함)
+                    source_name = article.source if article.source else "알 수 없음"
                         
-                        articles = result
-                        for article in articles:
-                            # 날짜 필터링: 오늘 기사가 아니면 무시
-                            if not article.date:
-                                continue
-                                
-                            # 날짜 형식 정규화 (YYYY.MM.DD -> YYYY-MM-DD) 및 오늘 날짜 확인
-                            article_date = article.date.replace('.', '-')
-                            if not article_date.startswith(today_str):
-                                continue
+                    if source_name not in platform_groups:
+                        platform_groups[source_name] = []
+                    platform_groups[source_name].append(storage.display_name(term))  # 시간순으로 추가 (중복 허용)
+                
+                # Play TTS: platform name once, then all keywords in chronological order
+                for platform_name, platform_keywords in platform_groups.items():
+                    logger.debug(f"TTS 재생: {platform_name} + {platform_keywords}")
+                    tts.play_sequence([platform_name] + platform_keywords)
+                
+                await view.set_timeline(timeline)
+            
+            await view.update_status(f"업데이트 완료 ({datetime.now().strftime('%H:%M:%S')}, {scraper.get_source_name()}) - 총 {len(timeline)}건")
+            
+            # 소스별 조건부 요청(304) / 콘텐츠 지문 적중 통계
+            source_name = scraper.get_source_name()
+            cache_stats = http_client.cache_stats().get(source_name)
+            if cache_stats:
+                logger.debug(f"캐시 통계 {source_name}: {cache_stats}")
+            fingerprints = getattr(scraper, 'fingerprints', None)
+            if fingerprints:
+                for stats_source, stats in fingerprints.stats().items():
+                    logger.debug(f"지문 캐시 통계 {stats_source}: {stats}")
+            
+            return len(new_articles)
 
-                            if article.link not in current_links:
-                                all_articles.append(article)
-                                current_links.add(article.link)
-                                new_articles_this_cycle.append((article, term))
-                                
-                                # Send notification
-                                try:
-                                    if toaster:
-                                        logger.info(f"알림 전송: {article.source} - {article.title[:30]}...")
-                                        toaster.send_notification(article)
-                                    else:
-                                        logger.warning("toaster가 None이어서 알림을 전송할 수 없습니다")
-                                except Exception as e:
-                                    logger.error(f"알림 오류: {e}", exc_info=True)
+        try:
+            while is_monitoring:
+                keywords = view.get_keywords()
+                stock_names = view.get_stock_names()
+                search_terms = keywords + stock_names
                 
-                 # Group new articles by platform and play TTS
-                if new_articles_this_cycle:
-                    logger.debug(f"새 기사 {len(new_articles_this_cycle)}개 발견")
-                    for article, term in new_articles_this_cycle:
-                        logger.debug(f"  - {article.source}: {term} ({article.title[:30]}...)")
-                    
-                    platform_groups = {}  # {platform_name: [keyword1, keyword2, ...]} 시간순
-                    
-                    for article, term in new_articles_this_cycle:
-                        # article에서 source 사용 (스크래퍼가 이미 설정함)
-                        source_name = article.source if article.source else "알 수 없음"
-                            
-                        if source_name not in platform_groups:
-                            platform_groups[source_name] = []
-                        platform_groups[source_name].append(term)  # 시간순으로 추가 (중복 허용)
+                if not search_terms:
+                     await view.update_status("키워드 또는 종목명을 추가해주세요.")
+                     await view.set_monitoring_state(False)
+                     break
+                
+                # 폴링 시각이 된 소스 요청 시작 (진행 중인 소스는 제외됨)
+                due_names = set(scheduler.due_sources(loop.time()))
+                for scraper in scrapers:
+                    source_name = scraper.get_source_name()
+                    if source_name in due_names:
+                        scheduler.mark_started(source_name)
+                        # 이미 본 기사는 스크래퍼가 링크만 확인하고 건너뜀 (Article 생성 없음)
+                        task = asyncio.create_task(scraper.fetch_reports_many(search_terms, matcher, current_keys))
+                        in_flight[task] = (scraper, search_terms)
+                
+                # 가장 먼저 끝나는 소스 또는 다음 폴링 시각까지 대기 (중지 확인을 위해 최대 1초)
+                wait_time = min(1.0, scheduler.seconds_until_next(loop.time()))
+                if in_flight:
+                    done, _ = await asyncio.wait(
+                        set(in_flight),
+                        timeout=wait_time,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                else:
+                    await asyncio.sleep(wait_time)
+                    done = set()
+                
+                # 완료된 소스부터 즉시 처리
+                for task in done:
+                    scraper, terms = in_flight.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        result = e
                     
-                    # Play TTS: platform name once, then all keywords in chronological order
-                    for platform_name, keywords in platform_groups.items():
-                        logger.debug(f"TTS 재생: {platform_name} + {keywords}")
-                        tts.play_sequence([platform_name] + keywords)
+                    new_count = 0
+                    try:
+                        new_count = await handle_result(scraper, terms, result)
+                    except Exception as e:
+                        await view.update_status(f"오류 발생: {str(e)}")
                     
-                # Sort by date descending (newest first)
-                all_articles.sort(key=lambda x: x.date, reverse=True)
-                
-                await view.set_articles(all_articles)
-                await view.update_status(f"업데이트 완료 ({datetime.now().strftime('%H:%M:%S')}) - 총 {len(all_articles)}건")
+                    # 소스에 새로 올라온 항목 수(감시 항목 매칭 여부 무관)로 다음 폴링 시각 갱신
+                    # 스크래퍼가 알 수 없으면(첫 폴링, 오류) 새 기사 수 사용
+                    new_items = scraper.last_new_items if not isinstance(result, Exception) else None
+                    scheduler.record(
+                        scraper.get_source_name(),
+                        new_items if new_items is not None else new_count,
+                        loop.time()
+                    )
                 
-            except Exception as e:
-                await view.update_status(f"오류 발생: {str(e)}")
-            
-            # Wait for 60 seconds
-            for _ in range(60):
-                if not is_monitoring:
-                    break
-                await asyncio.sleep(1)
+                # 최근 기사 하이라이트가 만료되면 새 기사가 없어도 화면 갱신 (바뀐 경우에만 전송)
+                try:
+                    await view.refresh_timeline(timeline)
+                except Exception as e:
+                    logger.debug(f"화면 갱신 오류: {e}")
+        finally:
+            # 모니터링 종료 시 진행 중인 요청 취소
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            current_keys.close()
@@ -5,8 +5,10 @@ from infra.flet.components.control_panel import ControlPanel
 from infra.flet.components.article_table import ArticleTable
 from infra.flet.components.status_bar import StatusBar
 from domain.model import Article
+from domain.services.article_timeline import ArticleTimeline
+from config import TimelineConfig
 
-from datetime import datetime, timedelta
+import time
 
 class MainView(ft.Column):
     def __init__(self, on_start_stop: Callable[[bool], None], 
@@ -23,13 +25,16 @@ class MainView(ft.Column):
             on_change=lambda _: self._handle_change()
         )
         self.stock_manager = KeywordManager(
-            label="종목명 추가", 
+            label="종목명/종목코드 추가", 
             initial_keywords=initial_stock_names,
             on_change=lambda _: self._handle_change()
         )
         self.control_panel = ControlPanel(on_start_stop=on_start_stop)
         self.status_bar = StatusBar()
         self.article_table = ArticleTable()
+        # 마지막으로 표시한 타임라인 버전과 하이라이트 링크 (refresh_timeline 변경 확인용)
+        self._shown_version = -1
+        self._shown_recent: set = set()
         
         self.controls = [
             ft.Row(
@@ -54,17 +59,11 @@ class MainView(ft.Column):
     def _get_recent_links(self, articles: List[Article]) -> set:
         """최근 5분 이내 기사 링크 반환"""
         recent_links = set()
-        now = datetime.now()
+        cutoff = time.time() - 5 * 60
         
         for article in articles:
-            try:
-                # date_str format: "YYYY-MM-DD HH:MM"
-                article_date = datetime.strptime(article.date, "%Y-%m-%d %H:%M")
-                diff = now - article_date
-                if diff <= timedelta(minutes=5):
-                    recent_links.add(article.link)
-            except Exception:
-                pass
+            if article.ts and article.ts >= cutoff:
+                recent_links.add(article.link)
         
         return recent_links
 
@@ -76,7 +75,7 @@ class MainView(ft.Column):
             # DART면 1, 아니면 0 (reverse=True이므로 1이 먼저)
             source_priority = 1 if is_dart else 0
             # 시간은 역순 (최신이 먼저)
-            return (source_priority, article.date)
+            return (source_priority, article.ts)
         
         sorted_articles = sorted(articles, key=sort_key, reverse=True)
         
@@ -84,9 +83,35 @@ class MainView(ft.Column):
         self.article_table.set_articles(sorted_articles, highlighted_links)
         self.article_table.update()
 
+    async def set_timeline(self, timeline: ArticleTimeline):
+        """이미 표시 순서로 정렬된 타임라인 표시 (다시 정렬하지 않음)"""
+        highlighted_links = timeline.recent(TimelineConfig.RECENT_SECONDS)
+        self.article_table.set_articles(timeline, highlighted_links)
+        self.article_table.update()
+        self._shown_version = timeline.version
+        self._shown_recent = highlighted_links
+
+    async def refresh_timeline(self, timeline: ArticleTimeline):
+        """타임라인이 바뀌었거나 최근 기사 하이라이트가 만료된 경우에만 다시 표시 (주기적으로 호출)
+
+        기사 목록이 그대로면 하이라이트가 바뀐 행만 고쳐서 그 행만 페이지로 보낸다.
+        """
+        if timeline.version != self._shown_version:
+            await self.set_timeline(timeline)
+            return
+
+        highlighted_links = timeline.recent(TimelineConfig.RECENT_SECONDS)
+        if highlighted_links == self._shown_recent:
+            return
+        for row in self.article_table.set_highlights(highlighted_links):
+            row.update()
+        self._shown_recent = highlighted_links
+
     def clear_results(self):
         self.article_table.set_articles([])
         self.article_table.update()
+        self._shown_version = -1
+        self._shown_recent = set()
 
     async def update_status(self, msg: str):
         self.status_bar.update_status(msg)
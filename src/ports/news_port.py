@@ -1,10 +1,139 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Awaitable, Callable, Container, Dict, Iterable, List, Optional, Tuple
+import logging
+
 from domain.model import Article
+from domain.services.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+# (검색어, 그 검색어를 쓰는 감시 항목들) → 검색 결과
+SearchFetcher = Callable[[str, Tuple[str, ...]], Awaitable[List[Article]]]
+
 
 class NewsRepository(ABC):
+    # 직전 fetch_reports_many에서 소스에 새로 올라온 항목 수 (감시 항목 매칭 여부 무관, 모르면 None)
+    # 폴링 스케줄러가 발행 주기를 학습하는 데 사용
+    last_new_items: Optional[int] = None
+    _newest_ts: Optional[int] = None  # 검색 결과 중 가장 최신 기사 시각 (새 항목 판단 기준)
+
     @abstractmethod
     async def fetch_reports(self, keyword: str) -> List[Article]:
         """키워드로 기사를 검색하여 반환한다."""
         pass
 
+    async def fetch_reports_many(
+        self,
+        keywords: List[str],
+        matcher: Optional[KeywordMatcher] = None,
+        seen: Optional[Container[int]] = None
+    ) -> Dict[str, List[Article]]:
+        """여러 키워드로 기사를 검색하여 키워드별로 반환한다.
+
+        기본 구현은 검색어마다 fetch_reports를 한 번씩 호출한다 (검색 페이지 기반 소스, fetch_query_results).
+        쿼리 항목(AND/OR/NOT 등)은 리터럴로 검색한 뒤 제목으로 쿼리 전체를 확인한다.
+        피드 전체를 받아 로컬에서 필터링하는 소스는 피드를 한 번만 요청하고
+        matcher(키워드 목록으로 컴파일된 다중 매칭기)로 항목당 한 번만 매칭하도록 재정의한다.
+        seen(이미 본 Article.key 집합)에 있는 기사는 결과에서 제외한다
+        (피드 소스는 item 링크만 읽고 건너뛰어 필드 추출/Article 생성을 하지 않는다).
+        """
+        results, fetched = await fetch_query_results(
+            keywords, matcher, seen, lambda search, _queries: self.fetch_reports(search)
+        )
+        self._record_new_items(fetched)
+        return results
+
+    def _record_new_items(self, articles: Iterable[Article]) -> None:
+        """검색 결과 중 직전 폴링의 가장 최신 기사보다 새로운 기사 수를 last_new_items에 기록
+
+        검색 결과는 감시 항목과 제목이 일치하지 않는 기사도 포함하므로 소스의 발행 빈도를 반영한다.
+        첫 폴링은 기준이 없어 None으로 둔다.
+
+        Args:
+            articles: 이번 폴링의 검색 결과 (쿼리 필터링 전, 중복 가능)
+        """
+        newest = self._newest_ts
+        latest = newest or 0
+        new_keys = set()
+        for article in articles:
+            if newest is not None and article.ts > newest:
+                new_keys.add(article.key)
+            latest = max(latest, article.ts)
+        self.last_new_items = len(new_keys) if newest is not None else None
+        self._newest_ts = latest or newest
+
+
+async def fetch_query_results(
+    keywords: List[str],
+    matcher: Optional[KeywordMatcher],
+    seen: Optional[Container[int]],
+    fetch: SearchFetcher
+) -> Tuple[Dict[str, List[Article]], List[Article]]:
+    """검색 페이지 소스의 감시 항목별 결과 (폴링당 검색어마다 한 번만 요청)
+
+    - 여러 항목이 같은 검색어를 쓰면 한 번만 검색하고 그 결과를 항목마다 따로 확인한다
+    - OR 쿼리는 가지마다 검색하여 결과를 합친다
+    - 검색어가 없는 쿼리(NOT/정규식만)는 검색하지 않는다 (빈 결과)
+
+    Args:
+        keywords: 감시 항목 목록
+        matcher: 감시 목록 매칭기 (없으면 항목을 그대로 검색)
+        seen: 이미 본 기사 키(Article.key) 집합
+        fetch: (검색어, 그 검색어를 쓰는 항목들) → 검색 결과
+
+    Returns:
+        ({항목: 일치하고 아직 보지 않은 기사}, 이번 폴링의 전체 검색 결과 - 필터링 전)
+    """
+    plan: Dict[str, Tuple[str, ...]] = {}
+    users: Dict[str, List[str]] = {}
+    for keyword in keywords:
+        searches = matcher.search_terms(keyword) if matcher else (keyword,)
+        if not searches:
+            logger.debug(f"검색어가 없는 쿼리는 검색 페이지 소스에서 제외: {keyword}")
+        plan[keyword] = searches
+        for search in searches:
+            queries = users.setdefault(search, [])
+            if keyword not in queries:
+                queries.append(keyword)
+
+    fetched: Dict[str, List[Article]] = {}
+    for search, queries in users.items():
+        fetched[search] = await fetch(search, tuple(queries))
+
+    results: Dict[str, List[Article]] = {}
+    for keyword, searches in plan.items():
+        if len(searches) == 1:
+            articles = fetched[searches[0]]
+        else:
+            # OR 가지별 결과 합치기 (같은 기사는 한 번만)
+            merged: Dict[int, Article] = {}
+            for search in searches:
+                for article in fetched[search]:
+                    merged.setdefault(article.key, article)
+            articles = list(merged.values())
+        results[keyword] = filter_query_results(keyword, articles, matcher, seen)
+    return results, [article for articles in fetched.values() for article in articles]
+
+
+def filter_query_results(
+    keyword: str,
+    articles: List[Article],
+    matcher: Optional[KeywordMatcher],
+    seen: Optional[Container[int]] = None
+) -> List[Article]:
+    """사이트 검색 결과 중 쿼리 항목과 일치하고 아직 보지 않은 기사만 남긴다.
+
+    Args:
+        keyword: 감시 항목 (쿼리)
+        articles: 검색 결과
+        matcher: 감시 목록 매칭기
+        seen: 이미 본 기사 키(Article.key) 집합
+
+    Returns:
+        리터럴 하나로 된 항목이면 articles, 아니면 제목이 쿼리와 일치하는 기사 (seen에 있는 기사 제외)
+    """
+    if seen is not None:
+        articles = [article for article in articles if article.key not in seen]
+    if matcher is None or not matcher.needs_filter(keyword):
+        return articles
+    return [article for article in articles if keyword in matcher.find(article.title)]
@@ -1,14 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import Set
+from typing import Iterable, Set
 from domain.model import Article
 
 class StorageRepository(ABC):
     @abstractmethod
-    def load_today_ids(self) -> Set[int]:
-        """오늘 저장된 기사 ID 목록을 불러온다."""
+    def load_today_keys(self) -> Set[int]:
+        """오늘 저장된 기사 고유 키(Article.key) 목록을 불러온다."""
         pass
 
     @abstractmethod
     def save_article(self, article: Article) -> None:
         """기사 정보를 저장소에 저장한다."""
         pass
+
+    def save_articles(self, articles: Iterable[Article]) -> int:
+        """한 주기에 발견한 기사들을 한 번에 저장하고 저장한 기사 수를 반환한다.
+
+        기본 구현은 save_article 반복 (일괄 저장을 지원하는 저장소는 재정의,
+        이미 저장된 기사를 거르는 저장소는 새로 저장된 수만 반환)
+        """
+        count = 0
+        for article in articles:
+            self.save_article(article)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """버퍼에 남은 기록을 저장소에 반영한다 (버퍼가 없는 저장소는 아무것도 하지 않음)."""
+        pass
+
+    def close(self) -> None:
+        """남은 기록을 반영하고 저장소를 닫는다."""
+        self.flush()
@@ -3,10 +3,11 @@ import asyncio
 import sys
 sys.path.insert(0, 'src')
 
-from adapters.infrastructure.scrapers.rss.seoul_rss_scraper import SeoulRssScraper
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper
+from adapters.infrastructure.scrapers.rss.rss_sources import get_rss_source
 
 async def test_seoul_rss():
-    scraper = SeoulRssScraper()
+    scraper = RssFeedScraper(get_rss_source("서울경제"))
     
     print("서울경제 RSS 피드 가져오기...")
     articles = await scraper.fetch_reports("태안")
@@ -0,0 +1,93 @@
+"""Article 메모리 벤치마크
+
+기존 Article(__slots__ 없는 frozen dataclass, 날짜 문자열 보관)과
+현재 Article(__slots__, epoch 타임스탬프, source/keyword intern, 표시 날짜는 읽을 때 생성)의
+기사당 메모리를 비교한다.
+
+피드를 파싱할 때처럼 기사마다 source/keyword/date 문자열이 새로 만들어지는 상황을 재현한다.
+
+사용법:
+    python tests/bench_article_memory.py [--counts 10000 100000]
+"""
+import argparse
+import gc
+import sys
+import os
+import tracemalloc
+from dataclasses import dataclass
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from domain.model import Article, article_key
+
+
+@dataclass(frozen=True)
+class LegacyArticle:
+    """기존 Article (비교용)"""
+    id: int
+    title: str
+    link: str
+    date: str
+    keyword: str = ""
+    source: str = ""
+    key: int = 0
+
+    def __post_init__(self):
+        if not self.key:
+            object.__setattr__(self, 'key', article_key(self.source, self.link))
+
+
+SOURCES = ["뉴스핌", "이데일리", "한국경제", "매일경제", "연합뉴스", "DART"]
+KEYWORDS = ["삼성전자", "SK하이닉스", "리포트 브리핑", "반도체", "2차전지"]
+
+
+def raw_fields(i: int) -> tuple:
+    """파싱 결과처럼 매번 새로 만들어지는 필드 문자열"""
+    return (
+        i,
+        f"[단독] 삼성전자, 반도체 업황 회복에 {i}번째 증설 검토",
+        f"https://www.newspim.com/news/view/2025120{i:07d}",
+        f"2025-12-{1 + i % 28:02d} {i % 24:02d}:{i % 60:02d}",
+        "".join(KEYWORDS[i % len(KEYWORDS)]),   # join: 항목마다 다른 문자열 객체
+        "".join(SOURCES[i % len(SOURCES)]),
+    )
+
+
+def measure(cls, count: int, touch_date: bool = False) -> float:
+    """count개 생성 후 남아 있는 메모리 / count (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = []
+    for i in range(count):
+        article_id, title, link, date, keyword, source = raw_fields(i)
+        items.append(cls(article_id, title, link, date, keyword, source))
+    if touch_date:
+        for item in items:
+            item.date
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Article 메모리 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'기사 수':>10} {'기존':>12} {'현재':>12} {'현재+date':>12} {'절감':>8}")
+    for count in args.counts:
+        legacy = measure(LegacyArticle, count)
+        current = measure(Article, count)
+        touched = measure(Article, count, touch_date=True)
+        print(
+            f"{count:>10,} {legacy:>10.0f} B {current:>10.0f} B {touched:>10.0f} B "
+            f"{(1 - current / legacy) * 100:>7.1f}%"
+        )
+    print("(현재+date: 모든 기사의 표시 날짜를 한 번씩 읽은 뒤 - 화면에 표시된 기사만 해당)")
+
+
+if __name__ == "__main__":
+    main()
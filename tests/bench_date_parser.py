@@ -0,0 +1,103 @@
+"""날짜 파싱 벤치마크
+
+스크래퍼마다 따로 있던 기존 변환(rsplit + strptime + strftime, GMT에 9시간 더하기,
+'.' → '-' 치환)과 공용 date_parser(형식 자동 감지 + 소스별 캐시 + 정규식/정수 계산)를 비교한다.
+
+코퍼스는 실제 피드/페이지에서 나오는 형식의 날짜 문자열이다.
+
+사용법:
+    python tests/bench_date_parser.py [--items 10000] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import os
+import timeit
+from datetime import datetime, timedelta
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from domain.services.date_parser import DateParser, format_kst
+
+
+def make_corpus(items: int) -> list:
+    """(소스, 날짜 문자열) 목록 - 소스별 실제 형식"""
+    random.seed(0)
+    base = datetime(2025, 12, 9, 7, 0, 0)
+    corpus = []
+    for i in range(items):
+        dt = base + timedelta(seconds=random.randint(0, 11 * 3600))
+        kind = i % 6
+        if kind == 0:    # 연합뉴스/한국경제/뉴스핌 RSS
+            corpus.append(("연합뉴스", dt.strftime("%a, %d %b %Y %H:%M:%S") + " +0900"))
+        elif kind == 1:  # 매일경제 RSS (+09:00)
+            corpus.append(("매일경제", dt.strftime("%a, %d %b %Y %H:%M:%S") + " +09:00"))
+        elif kind == 2:  # DART RSS (GMT)
+            corpus.append(("DART", (dt - timedelta(hours=9)).strftime("%a, %d %b %Y %H:%M:%S") + " GMT"))
+        elif kind == 3:  # 머니투데이 검색 페이지
+            corpus.append(("머니투데이", dt.strftime("%Y.%m.%d %H:%M")))
+        elif kind == 4:  # 파이낸셜뉴스 검색 페이지
+            corpus.append(("파이낸셜뉴스", dt.strftime("%Y-%m-%d %H:%M:%S")))
+        else:            # 인포스탁 목록 ("기자명 | 날짜")
+            corpus.append(("인포스탁", "홍길동 기자 | " + dt.strftime("%Y.%m.%d %H:%M")))
+    return corpus
+
+
+def legacy_convert(source: str, text: str) -> str:
+    """기존 스크래퍼별 변환 (표시 문자열 반환)"""
+    if source == "DART":
+        dt = datetime.strptime(text, "%a, %d %b %Y %H:%M:%S %Z") + timedelta(hours=9)
+        return dt.strftime("%Y-%m-%d %H:%M")
+    if source in ("연합뉴스", "매일경제"):
+        value = text.strip()
+        if '+' in value:
+            value = value.rsplit(' ', 1)[0]
+        return datetime.strptime(value, "%a, %d %b %Y %H:%M:%S").strftime("%Y-%m-%d %H:%M")
+    if source == "파이낸셜뉴스":
+        return text
+    return text.replace('.', '-', 2)
+
+
+def legacy_to_ts(source: str, text: str) -> float:
+    """기존 변환 결과를 다시 파싱해야 타임스탬프를 얻을 수 있었음 (인포스탁 형식은 실패)"""
+    try:
+        return datetime.fromisoformat(legacy_convert(source, text)).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜 파싱 벤치마크")
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.items)
+
+    # 정확도: 기존 변환과 같은 표시 문자열인지 (인포스탁은 기존 변환이 원문을 그대로 남김)
+    date_parser = DateParser()
+    mismatches = [
+        (source, text) for source, text in corpus
+        if source != "인포스탁" and format_kst(date_parser.parse(text, source)) != legacy_convert(source, text)[:16]
+    ]
+    failed = sum(1 for source, text in corpus if not date_parser.parse(text, source))
+    print(f"코퍼스 {len(corpus):,}개, 기존 변환과 불일치 {len(mismatches)}개, 해석 실패 {failed}개")
+    for source, text in mismatches[:5]:
+        print(f"  불일치: {source} '{text}'")
+
+    cases = {
+        "기존 (표시 문자열)": lambda: [legacy_convert(s, t) for s, t in corpus],
+        "기존 + 타임스탬프": lambda: [legacy_to_ts(s, t) for s, t in corpus],
+        "date_parser (소스 캐시)": lambda: [date_parser.parse(t, s) for s, t in corpus],
+        "date_parser (캐시 없음)": lambda: [date_parser.parse(t) for s, t in corpus],
+        "date_parser + 표시 문자열": lambda: [format_kst(date_parser.parse(t, s)) for s, t in corpus],
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        rate = len(corpus) / best
+        print(f"  {name:<26} {best * 1000:8.1f}ms  {rate:>12,.0f}개/초")
+
+
+if __name__ == "__main__":
+    main()
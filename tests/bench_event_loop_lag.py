@@ -0,0 +1,149 @@
+"""이벤트 루프 지연(lag) 벤치마크
+
+모니터링 한 사이클(RSS 10개 + 웹 검색 3개)을 합성 응답으로 실행하면서
+이벤트 루프가 얼마나 멈추는지 측정한다. 파싱을 루프에서 직접 할 때(inline)와
+ParseExecutor 스레드/프로세스 풀로 넘길 때를 비교한다.
+
+측정 방법: 5ms마다 깨어나는 ticker 코루틴의 실제 지연(예정 시각 대비 늦은 시간)
+
+사용법:
+    python tests/bench_event_loop_lag.py [--cycles 5] [--rss-items 150] [--web-kb 300]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import os
+import time
+from datetime import datetime
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import httpx
+
+from adapters.infrastructure.http_client import HttpClient
+from adapters.infrastructure.parse_executor import ParseExecutor
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper
+from adapters.infrastructure.scrapers.rss.rss_sources import RSS_SOURCES
+from adapters.infrastructure.scrapers.rss.infostock_scraper import InfostockScraper
+from adapters.infrastructure.scrapers.web.fn_scraper import FnScraper
+from adapters.infrastructure.scrapers.web.mt_scraper import MTScraper
+
+TICK = 0.005
+
+
+def make_rss(items: int) -> bytes:
+    pub_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S') + " +0900"
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>'
+             '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>']
+    for i in range(items):
+        parts.append(
+            f"<item><title>삼성전자 반도체 기사 {i}</title>"
+            f"<link>https://news.example.com/view/{100000 + i}?rcpNo={i}</link>"
+            f"<guid>{100000 + i}</guid><no>{i}</no><category>경제</category>"
+            f"<dc:creator>기자{i}</dc:creator><description>{'본문 요약 ' * 40}</description>"
+            f"<pubDate>{pub_date}</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode('utf-8')
+
+
+def make_search_page(size_kb: int) -> bytes:
+    """MT/Fn/인포스탁 셀렉터를 모두 포함한 검색 결과 페이지"""
+    mt = "".join(
+        f"<li class='article_item'><h3 class='headline'><a href='https://news.mt.co.kr/mtview.php/{i}'>삼성 기사 {i}</a></h3>"
+        f"<div class='meta'><span>2025.12.08 14:{i % 60:02d}</span></div></li>"
+        for i in range(20)
+    )
+    fn = "".join(
+        f"<li><strong class='tit_thumb'><a href='/news/{i}'>삼성 기사 {i}</a></strong></li>"
+        for i in range(20)
+    )
+    infostock = "".join(
+        f"<div class='list-block'><div class='list-titles'><a href='/news/articleView.html?idxno={i}'>삼성 기사 {i}</a></div>"
+        f"<div class='list-dated'>2025.12.08 14:{i % 60:02d}</div></div>"
+        for i in range(20)
+    )
+    block = "<div class='nav'>" + "<a href='/m'>메뉴</a><span>광고 배너<br></span>" * 50 + "</div>"
+    filler = block * max(1, size_kb * 1024 // len(block.encode('utf-8')) // 2)
+    html = (f"<html><body>{filler}<ul class='list_wrap'>{mt}</ul><ul class='list_article'>{fn}</ul>"
+            f"{infostock}{filler}</body></html>")
+    return html.encode('utf-8')
+
+
+def build_transport(rss: bytes, html: bytes) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" or 'search' in request.url.path or 'search' in request.url.query.decode():
+            return httpx.Response(200, content=html, headers={'Content-Type': 'text/html; charset=utf-8'})
+        return httpx.Response(200, content=rss)
+    return httpx.MockTransport(handler)
+
+
+async def ticker(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def run_cycles(executor: ParseExecutor, transport: httpx.MockTransport, cycles: int) -> tuple:
+    http_client = HttpClient()
+    http_client._client = httpx.AsyncClient(transport=transport)
+
+    lags: list = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    for _ in range(cycles):
+        # 지문/기준점 캐시가 파싱을 생략하지 않도록 매 사이클 새 스크래퍼 사용
+        scrapers = [RssFeedScraper(spec, http_client, executor) for spec in RSS_SOURCES] + [
+            MTScraper(http_client, executor),
+            FnScraper(http_client, executor),
+            InfostockScraper(http_client, executor),
+        ]
+        await asyncio.gather(*(scraper.fetch_reports_many(["삼성", "반도체"]) for scraper in scrapers))
+    elapsed = (time.perf_counter() - started) / cycles
+
+    stop.set()
+    await tick_task
+    await http_client.aclose()
+    executor.shutdown()
+    return elapsed, lags
+
+
+def report(label: str, elapsed: float, lags: list) -> None:
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p95 = lags_ms[int(len(lags_ms) * 0.95) - 1] if lags_ms else 0.0
+    print(f"  {label:<14} 사이클 {elapsed * 1000:7.1f} ms | lag 최대 {max(lags_ms, default=0):7.1f} ms"
+          f" / p95 {p95:6.1f} ms / 평균 {statistics.fmean(lags_ms) if lags_ms else 0:5.1f} ms")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--cycles', type=int, default=5)
+    arg_parser.add_argument('--rss-items', type=int, default=150)
+    arg_parser.add_argument('--web-kb', type=int, default=300)
+    args = arg_parser.parse_args()
+    logging.disable(logging.WARNING)  # 합성 피드의 날짜 형식 경고 생략
+
+    rss = make_rss(args.rss_items)
+    html = make_search_page(args.web_kb)
+    transport = build_transport(rss, html)
+    print(f"RSS {len(rss) / 1024:.0f}KB x {len(RSS_SOURCES)}, 검색 페이지 {len(html) / 1024:.0f}KB x 3, {args.cycles} 사이클")
+
+    modes = [
+        ("inline", ParseExecutor.inline()),
+        ("thread x4", ParseExecutor(max_workers=4, process_workers=0)),
+        ("thread+proc x2", ParseExecutor(max_workers=4, process_workers=2)),
+    ]
+    for label, executor in modes:
+        elapsed, lags = asyncio.run(run_cycles(executor, transport, args.cycles))
+        report(label, elapsed, lags)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""이미 본 기사 건너뛰기 벤치마크 (폴링당 할당량)
+
+RSS 피드 폴링에서 대부분의 item은 이미 본 기사다. 기존에는 모든 item의 필드를 추출하고
+날짜를 해석하고 Article을 만든 뒤 모니터 루프에서 버렸다. 지금은 스크래퍼가 직전 폴링까지
+처리한 링크(FeedWatermark)를 문자열 그대로 확인하여 건너뛰고, 새 링크 중 키워드가 매칭된
+item만 Article.key(URL 정규화 + 해시)를 계산하여 엔진이 넘긴 seen 집합과 비교한다.
+
+비교 대상:
+- 기존: 모든 item 처리 (seen/기준점 없음)
+- seen만: 모든 item 필드 추출, 매칭된 item만 키 계산 후 seen 확인
+- 기준점 + seen: 정상 상태 (직전 폴링의 링크가 기준점에 있음)
+
+폴링 한 번의 최대 추가 메모리(XML 트리 포함 / item 처리만), 생성된 Article 수, 시간을 비교한다.
+
+사용법:
+    python tests/bench_seen_skip.py [--items 150] [--new 10] [--repeat 200]
+"""
+import argparse
+import sys
+import os
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from domain.model import article_key
+from domain.services.keyword_matcher import KeywordMatcher
+from adapters.infrastructure.scrapers.rss.feed_watermark import FeedWatermark
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper
+from adapters.infrastructure.scrapers.rss.rss_sources import get_rss_source
+
+KEYWORDS = ["삼성전자", "SK하이닉스", "현대차", "LG에너지솔루션", "셀트리온", "반도체", "리포트"]
+
+
+def make_feed(items: int) -> tuple:
+    """연합뉴스 형식 피드와 item 링크 목록 (최신순)"""
+    now = datetime.now()
+    links = []
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>연합뉴스</title>']
+    for i in range(items):
+        link = f"https://www.yna.co.kr/view/AKR2025120909{i:07d}?input=1195m"
+        links.append(link)
+        pub = (now - timedelta(minutes=i)).strftime("%a, %d %b %Y %H:%M:%S")
+        keyword = KEYWORDS[i % len(KEYWORDS)] if i % 2 == 0 else "코스피"
+        parts.append(
+            f"<item><title>[속보] {keyword} 관련 {i}번째 기사 제목</title><link>{link}</link>"
+            f"<description>{'본문 요약 ' * 20}</description><author>기자{i}</author>"
+            f"<pubDate>{pub} +0900</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode('utf-8'), links
+
+
+def measure(scraper, content: bytes, matcher: KeywordMatcher, seen, watermark) -> tuple:
+    """(최대 추가 메모리 바이트, 생성된 Article 수)"""
+    scraper._parse_items(content, KEYWORDS, matcher, seen, watermark())  # 정규식/형식 감지 캐시 준비
+    known = watermark()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    results = scraper._parse_items(content, KEYWORDS, matcher, seen, known)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return peak, sum(len(articles) for articles in results.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미 본 기사 건너뛰기 벤치마크")
+    parser.add_argument("--items", type=int, default=150)
+    parser.add_argument("--new", type=int, default=10, help="폴링당 새 기사 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    scraper = RssFeedScraper(get_rss_source("연합뉴스"))
+    matcher = KeywordMatcher(KEYWORDS)
+    content, links = make_feed(args.items)
+    source = scraper.get_source_name()
+    # 정상 상태: 위쪽 new개만 새 기사, 나머지는 이전 폴링에서 본 기사
+    # (seen에는 매칭되어 처리한 기사만, 기준점에는 매칭 여부와 관계없이 처리한 모든 링크)
+    matched_before = {
+        article.link
+        for articles in scraper._parse_items(content, KEYWORDS, matcher).values()
+        for article in articles
+    }
+    seen = {article_key(source, link) for link in links[args.new:] if link in matched_before}
+
+    def primed() -> FeedWatermark:
+        watermark = FeedWatermark()
+        for link in links[args.new:]:
+            watermark.add(link)
+        return watermark
+
+    # item 처리만 측정할 때는 미리 파싱한 트리를 돌려줌
+    tree_scraper = RssFeedScraper(get_rss_source("연합뉴스"))
+    root = tree_scraper._parse_rss_safely(content)
+    tree_scraper._parse_rss_safely = lambda _content: root
+
+    print(f"피드 {args.items}개 item, 새 기사 {args.new}개, 키워드 {len(KEYWORDS)}개")
+    print(f"{'':<16} {'메모리(전체)':>12} {'메모리(item 처리)':>16} {'Article 생성':>12} {'폴링당 시간':>12}")
+    cases = (
+        ("기존", None, lambda: None),
+        ("seen만", seen, lambda: None),
+        ("기준점 + seen", seen, primed),
+    )
+    for name, seen_arg, watermark in cases:
+        peak, created = measure(scraper, content, matcher, seen_arg, watermark)
+        item_peak, _ = measure(tree_scraper, content, matcher, seen_arg, watermark)
+        # 폴링마다 기준점이 갱신되므로 매 호출 직전 상태의 기준점을 미리 만들어 둠 (시간에서 제외)
+        pool = [watermark() for _ in range(args.repeat * 3)]
+        elapsed = min(timeit.repeat(
+            lambda: scraper._parse_items(content, KEYWORDS, matcher, seen_arg, pool.pop()),
+            number=args.repeat, repeat=3
+        )) / args.repeat
+        print(
+            f"{name:<16} {peak / 1024:>9.1f} KB {item_peak / 1024:>13.1f} KB "
+            f"{created:>12} {elapsed * 1000:>9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""서울경제 RSS 파싱 벤치마크
+
+기존 방식(lxml recover 파싱 → tostring 직렬화 → ET.fromstring 재파싱)과
+xml_backend의 단일 파싱(lxml 트리 직접 사용)을 비교한다.
+
+사용법:
+    python tests/bench_seoul_parse.py [--items 200] [--repeat 200] [--live]
+"""
+import argparse
+import asyncio
+import sys
+import os
+import timeit
+import xml.etree.ElementTree as ET
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lxml import etree as lxml_ET
+
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper
+from adapters.infrastructure.scrapers.rss.rss_sources import get_rss_source
+from adapters.infrastructure.scrapers.rss.xml_backend import parse_xml
+
+
+def make_feed(items: int) -> bytes:
+    """서울경제 피드와 비슷한 malformed RSS 생성 (이스케이프되지 않은 '&' 포함)"""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>서울경제</title>']
+    for i in range(items):
+        parts.append(
+            f"<item><title>삼성전자 & SK하이닉스 반도체 전망 {i}</title>"
+            f"<link>https://www.sedaily.com/NewsView/2GQ{i:05d}</link>"
+            f"<description>본문 요약 R&D 투자 확대 {'내용 ' * 30}</description>"
+            f"<author>기자{i}</author>"
+            f"<pubDate>Tue, 09 Dec 2025 14:{i % 60:02d}:17 +0900</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode('utf-8')
+
+
+def triple_pass(content: bytes):
+    """기존 방식: recover 파싱 → 직렬화 → 재파싱"""
+    parser = lxml_ET.XMLParser(recover=True, encoding='utf-8')
+    root = lxml_ET.fromstring(content, parser=parser)
+    xml_str = lxml_ET.tostring(root, encoding='unicode')
+    return ET.fromstring(xml_str)
+
+
+def single_pass(content: bytes):
+    """단일 파싱: lxml 트리를 그대로 사용"""
+    return parse_xml(content, recover=True)
+
+
+def bench(label: str, func, repeat: int) -> float:
+    seconds = min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+    print(f"  {label:<28} {seconds * 1000:8.3f} ms/회")
+    return seconds
+
+
+async def fetch_live() -> bytes:
+    scraper = RssFeedScraper(get_rss_source("서울경제"))
+    try:
+        content = await scraper._fetch_rss_bytes()
+    finally:
+        await scraper.http_client.aclose()
+    if content is None:
+        raise SystemExit("서울경제 RSS를 가져오지 못했습니다.")
+    return content
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--items', type=int, default=200, help="합성 피드 항목 수")
+    arg_parser.add_argument('--repeat', type=int, default=200, help="측정 반복 횟수")
+    arg_parser.add_argument('--live', action='store_true', help="실제 서울경제 RSS로 측정")
+    args = arg_parser.parse_args()
+
+    content = asyncio.run(fetch_live()) if args.live else make_feed(args.items)
+    scraper = RssFeedScraper(get_rss_source("서울경제"))
+
+    # 두 방식의 결과가 같은지 확인
+    old_items = [scraper._extract_item_fields(item) for item in triple_pass(content).findall('.//item')]
+    new_items = [scraper._extract_item_fields(item) for item in single_pass(content).findall('.//item')]
+    assert old_items == new_items, "파싱 결과가 다릅니다"
+
+    print(f"서울경제 RSS 파싱 ({len(content) / 1024:.0f}KB, {len(new_items)}개 항목, {args.repeat}회 반복)")
+    old = bench("parse → tostring → reparse", lambda: triple_pass(content), args.repeat)
+    new = bench("single pass (lxml)", lambda: single_pass(content), args.repeat)
+
+    def old_full():
+        for item in triple_pass(content).findall('.//item'):
+            scraper._extract_item_fields(item)
+
+    def new_full():
+        for item in single_pass(content).findall('.//item'):
+            scraper._extract_item_fields(item)
+
+    old_f = bench("triple pass + fields", old_full, args.repeat)
+    new_f = bench("single pass + fields", new_full, args.repeat)
+
+    print(f"\n파싱만: {old / new:.1f}배, 필드 추출 포함: {old_f / new_f:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""상장 회사 마스터 연결 검증
+
+시작 시 경로(ui.py)와 같은 순서로 load_company_index() → KeywordStorage(companies=...) →
+KeywordMatcher(compiler=storage.compile)를 만들고, 내려받은 KRX 목록(COMPANY_IMPORT_FILE)이
+마스터로 가져와지는지, 종목코드/이전 회사명 항목이 DART 공시 피드에서 매칭되는지 확인한다.
+
+사용법:
+    python tests/verify_company_master.py
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import httpx
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from adapters.infrastructure.company_master import load_company_index
+from adapters.infrastructure.http_client import HttpClient
+from adapters.infrastructure.keyword_storage import KeywordStorage
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper
+from adapters.infrastructure.scrapers.rss.rss_sources import get_rss_source
+from domain.services.keyword_matcher import KeywordMatcher
+
+# KRX KIND 상장법인목록 형식 (엑셀을 거쳐 종목코드 앞의 0이 빠진 행 포함)
+KRX_DOWNLOAD = "회사명,종목코드\n삼성전자,5930\nLG에너지솔루션,373220\n포스코홀딩스,5490\n"
+# 기존 마스터: 포스코홀딩스의 이전 회사명 POSCO
+MASTER = "ticker,name,corp_code,former_names\n005490,POSCO,00155319,\n"
+
+DART_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>
+<item><title>주요사항보고서(자기주식취득결정)</title>
+<link>https://dart.fss.or.kr/api/link.jsp?rcpNo=20251208000001</link>
+<guid>https://dart.fss.or.kr/api/link.jsp?rcpNo=20251208000001</guid>
+<category>유가증권시장</category><dc:creator>삼성전자</dc:creator>
+<pubDate>Mon, 08 Dec 2025 16:00:00 GMT</pubDate></item>
+<item><title>기업설명회(IR)개최</title>
+<link>https://dart.fss.or.kr/api/link.jsp?rcpNo=20251208000002</link>
+<guid>https://dart.fss.or.kr/api/link.jsp?rcpNo=20251208000002</guid>
+<category>유가증권시장</category><dc:creator>POSCO홀딩스</dc:creator>
+<pubDate>Mon, 08 Dec 2025 16:01:00 GMT</pubDate></item>
+<item><title>단일판매ㆍ공급계약체결</title>
+<link>https://dart.fss.or.kr/api/link.jsp?rcpNo=20251208000003</link>
+<guid>https://dart.fss.or.kr/api/link.jsp?rcpNo=20251208000003</guid>
+<category>코스닥시장</category><dc:creator>에코프로비엠</dc:creator>
+<pubDate>Mon, 08 Dec 2025 16:02:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class TestCompanyMaster(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.master = os.path.join(self.tmp.name, "krx_companies.csv")
+        self.download = os.path.join(self.tmp.name, "krx_download.csv")
+        with open(self.master, 'w', encoding='utf-8') as f:
+            f.write(MASTER)
+        with open(self.download, 'w', encoding='cp949') as f:
+            f.write(KRX_DOWNLOAD)
+        # 내려받은 목록이 마스터보다 새 파일
+        past = time.time() - 60
+        os.utime(self.master, (past, past))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_import_on_startup(self):
+        index = load_company_index(self.master, self.download)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.get("005930").name, "삼성전자")
+        # 회사명이 바뀐 종목은 이전 회사명 유지
+        posco = index.get("A005490")
+        self.assertEqual(posco.name, "포스코홀딩스")
+        self.assertIn("POSCO", posco.former_names)
+        self.assertEqual(posco.corp_code, "00155319")
+        # 마스터가 더 새 파일이면 다시 가져오지 않음
+        mtime = os.path.getmtime(self.master)
+        load_company_index(self.master, self.download)
+        self.assertEqual(os.path.getmtime(self.master), mtime)
+
+    def test_short_number_is_not_ticker(self):
+        storage = KeywordStorage(os.path.join(self.tmp.name, "keywords.json"),
+                                 companies=load_company_index(self.master, self.download))
+        # 감시 항목의 짧은 숫자는 종목코드로 채우지 않음 (숫자 키워드)
+        self.assertEqual(storage.compile("20").search_texts, ("20",))
+        self.assertEqual(storage.display_name("5930"), "5930")
+        self.assertEqual(storage.display_name("005930"), "삼성전자")
+
+    def test_dart_feed_matches_ticker_and_former_name(self):
+        storage = KeywordStorage(os.path.join(self.tmp.name, "keywords.json"),
+                                 companies=load_company_index(self.master, self.download))
+        terms = ["005930", "포스코홀딩스", "에코프로"]
+        matcher = KeywordMatcher(terms, compiler=storage.compile)
+
+        http_client = HttpClient()
+        http_client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=DART_FEED.encode()))
+        )
+        scraper = RssFeedScraper(get_rss_source("DART"), http_client=http_client)
+        results = asyncio.run(scraper.fetch_reports_many(terms, matcher))
+
+        self.assertEqual([a.link[-14:] for a in results["005930"]], ["20251208000001"])
+        # 제출인에 이전 회사명(POSCO)만 있어도 현재 회사명 항목으로 매칭
+        self.assertEqual([a.link[-14:] for a in results["포스코홀딩스"]], ["20251208000002"])
+        # 상장 회사가 아닌 항목은 문구 그대로
+        self.assertEqual([a.link[-14:] for a in results["에코프로"]], ["20251208000003"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""감시 항목 쿼리 컴파일 검증
+
+"q:" 접두어가 없는 기존 항목은 괄호/따옴표/-/| 등이 있어도 전체가 하나의 문구로
+매칭되는지, 접두어가 있는 항목만 쿼리 문법으로 해석되는지 확인한다.
+
+사용법:
+    python tests/verify_keyword_query.py
+"""
+import os
+import sys
+import unittest
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from domain.services.keyword_matcher import KeywordMatcher
+from domain.services.keyword_query import QuerySyntaxError, parse_query
+
+
+class TestLegacyEntries(unittest.TestCase):
+    """접두어 없는 기존 항목은 문구 그대로"""
+
+    LEGACY = ["삼성전자(우)", "현대차(2우B)", "-S&P", "!중요", "=LG", "한화솔루션|큐셀", '"따옴표"', "/정규식/"]
+
+    def test_compiled_as_single_phrase(self):
+        for term in self.LEGACY:
+            query = parse_query(term)
+            self.assertEqual(query.search_texts, (term,), term)
+            self.assertEqual(query.literals, ((term.lower(), False),), term)
+            self.assertFalse(query.needs_filter, term)
+
+    def test_parenthesized_entry_matches_as_phrase(self):
+        matcher = KeywordMatcher(["삼성전자(우)"])
+        self.assertEqual(matcher.find("삼성전자(우) 장중 강세"), {"삼성전자(우)"})
+        # 괄호가 AND로 바뀌면 매칭되던 제목: 문구가 없으므로 매칭되지 않아야 함
+        self.assertEqual(matcher.find("삼성전자 우선주 강세"), set())
+        self.assertEqual(matcher.find("삼성전자, 우리銀과 협약"), set())
+
+    def test_unbalanced_legacy_entry_is_not_an_error(self):
+        # 접두어가 없으면 문법을 해석하지 않으므로 오류도 없음
+        self.assertEqual(parse_query("삼성전자(우").search_texts, ("삼성전자(우",))
+
+
+class TestPrefixedQueries(unittest.TestCase):
+    """"q:" 접두어 항목만 쿼리 문법"""
+
+    def test_and_or_not(self):
+        matcher = KeywordMatcher(["q:삼성 AND 반도체", "q:(LG | SK) 배터리", "q:삼성전자 -우선주"])
+        self.assertEqual(matcher.find("삼성, 반도체 투자 확대"), {"q:삼성 AND 반도체"})
+        self.assertEqual(matcher.find("SK 배터리 공장 증설"), {"q:(LG | SK) 배터리"})
+        self.assertEqual(matcher.find("삼성전자 우선주 급등"), set())
+        self.assertEqual(matcher.find("삼성전자 실적 발표"), {"q:삼성전자 -우선주"})
+
+    def test_prefix_is_case_insensitive_and_not_searched(self):
+        query = parse_query("Q: 삼성 반도체")
+        self.assertEqual(query.search_texts, ("삼성 반도체",))
+        self.assertEqual(query.text, "Q: 삼성 반도체")
+
+    def test_parenthesized_phrase_needs_quotes(self):
+        query = parse_query('q:"삼성전자(우)" 급등')
+        self.assertEqual(set(query.literals), {("삼성전자(우)", False), ("급등", False)})
+
+    def test_syntax_error_only_with_prefix(self):
+        with self.assertRaises(QuerySyntaxError):
+            parse_query("q:(삼성 | LG")
+        # 문법 오류여도 매칭기는 접두어 뒤 문구로 검색
+        self.assertEqual(KeywordMatcher(["q:(삼성 | LG"]).find("(삼성 | LG 합작"), {"q:(삼성 | LG"})
+
+
+if __name__ == '__main__':
+    unittest.main()
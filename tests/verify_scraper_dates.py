@@ -9,34 +9,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from adapters.infrastructure.scrapers.web.mt_scraper import MTScraper
 from adapters.infrastructure.scrapers.web.fn_scraper import FnScraper
-from adapters.infrastructure.scrapers.rss.newspim_rss_scraper import NewspimRssScraper
-from adapters.infrastructure.scrapers.rss.edaily_rss_scraper import EdailyRssScraper
-from adapters.infrastructure.scrapers.rss.hankyung_rss_scraper import HankyungRssScraper
-from adapters.infrastructure.scrapers.rss.mk_rss_scraper import MKRssScraper
-from adapters.infrastructure.scrapers.rss.yonhap_rss_scraper import YonhapRssScraper
-from adapters.infrastructure.scrapers.rss.asiae_rss_scraper import AsiaeRssScraper
-from adapters.infrastructure.scrapers.rss.etoday_rss_scraper import EtodayRssScraper
-from adapters.infrastructure.scrapers.rss.herald_rss_scraper import HeraldRssScraper
-from adapters.infrastructure.scrapers.rss.seoul_rss_scraper import SeoulRssScraper
 from adapters.infrastructure.scrapers.rss.infostock_scraper import InfostockScraper
-from adapters.infrastructure.scrapers.rss.dart_rss_scraper import DartRssScraper
-from config import DartConfig
+from adapters.infrastructure.scrapers.rss.rss_feed_scraper import RssFeedScraper
+from adapters.infrastructure.scrapers.rss.rss_sources import RSS_SOURCES
 
 async def main():
-    scrapers = [
-        NewspimRssScraper(),
-        EdailyRssScraper(),
-        HankyungRssScraper(),
-        MKRssScraper(),
+    scrapers = [RssFeedScraper(spec) for spec in RSS_SOURCES] + [
         MTScraper(),
-        YonhapRssScraper(),
-        AsiaeRssScraper(),
-        EtodayRssScraper(),
-        HeraldRssScraper(),
-        SeoulRssScraper(),
         FnScraper(),
         InfostockScraper(),
-        DartRssScraper(DartConfig.RSS_URL)
     ]
 
     print(f"Testing {len(scrapers)} scrapers for date format compliance (YYYY-MM-DD...)...")
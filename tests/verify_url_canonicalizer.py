@@ -0,0 +1,70 @@
+"""URL 정규화 검증
+
+규칙이 없는 호스트에서는 공통 추적 파라미터(utm_*, fbclid, gclid, dclid)만 제거하고
+cid/ref/from 같은 파라미터는 기사 식별자일 수 있으므로 남기는지,
+사이트 규칙(drop_params)이 있는 호스트에서만 추가로 제거하는지 확인한다.
+
+사용법:
+    python tests/verify_url_canonicalizer.py
+"""
+import os
+import sys
+import unittest
+
+# Add src to python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from domain.services.url_canonicalizer import UrlCanonicalizer, UrlRule, default_canonicalizer
+
+
+class TestUnknownHost(unittest.TestCase):
+    """규칙이 없는 호스트"""
+
+    def test_common_tracking_params_removed(self):
+        key = default_canonicalizer.canonicalize(
+            "https://www.example.com/news?id=1&utm_source=rss&utm_medium=feed&fbclid=a&gclid=b&dclid=c"
+        )
+        self.assertEqual(key, "example.com/news?id=1")
+
+    def test_site_specific_names_kept(self):
+        # 게시판/포털형 사이트에서는 이런 파라미터가 기사를 구분한다
+        for name in ("cid", "ref", "from", "nv", "svc", "share", "input", "rss", "sns"):
+            a = default_canonicalizer.canonicalize(f"https://board.example.org/view?{name}=1")
+            b = default_canonicalizer.canonicalize(f"https://board.example.org/view?{name}=2")
+            self.assertNotEqual(a, b, name)
+
+    def test_scheme_host_prefix_and_order(self):
+        self.assertEqual(
+            default_canonicalizer.canonicalize("http://m.example.com/a/?b=2&a=1#top"),
+            default_canonicalizer.canonicalize("https://www.example.com/a?a=1&b=2"),
+        )
+
+
+class TestSiteRules(unittest.TestCase):
+    """사이트 규칙이 있는 호스트"""
+
+    def test_drop_params_only_on_rule_host(self):
+        canonicalizer = UrlCanonicalizer([UrlRule("news.example.com", drop_params=("ref", "cid"))])
+        self.assertEqual(
+            canonicalizer.canonicalize("https://news.example.com/a?no=7&ref=main&cid=3&utm_campaign=x"),
+            "news.example.com/a?no=7",
+        )
+        self.assertEqual(
+            canonicalizer.canonicalize("https://other.example.com/a?no=7&ref=main"),
+            "other.example.com/a?no=7&ref=main",
+        )
+
+    def test_yna_input_param(self):
+        # 기사 ID 규칙이 맞지 않는 경로에서도 연합뉴스 input 파라미터는 제거
+        self.assertEqual(
+            default_canonicalizer.canonicalize("https://m.yna.co.kr/photo/list?page=2&input=1195m"),
+            "yna.co.kr/photo/list?page=2",
+        )
+        self.assertEqual(
+            default_canonicalizer.canonicalize("https://www.yna.co.kr/view/AKR20251208000100008?input=1195m"),
+            "yna.co.kr/AKR20251208000100008",
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()